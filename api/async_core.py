@@ -0,0 +1,254 @@
+# api/async_core.py
+"""
+Optional asyncio network core (NETWORK_BACKEND = "asyncio")
+
+ONE background thread runs ONE event loop that owns:
+    - every websocket stream (AsyncStreamManager, same API as
+      BinanceStreamManager, needs: pip install websockets)
+    - every REST call: the blocking api.binance_rest functions run on a
+      small bounded executor (pooled keep-alive session, no extra client)
+
+Results go back to Tk through UIDispatcher.post (thread-safe queue).
+Thread count stays 1 + ASYNC_REST_WORKERS no matter how many symbols
+are streamed.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from api.binance_stream_manager import BinanceStreamManager
+from config.config import (
+    BINANCE_WS_URL, ASYNC_REST_WORKERS, WS_STALL_TIMEOUT, BACKFILL_TIMEOUT
+)
+
+try:
+    import websockets
+except ImportError:  # optional
+    websockets = None
+
+
+def _require_websockets():
+    if websockets is None:
+        raise RuntimeError("asyncio network backend needs: pip install websockets")
+
+
+# ==================================================
+# Event loop + REST executor
+# ==================================================
+class AsyncNetworkCore:
+    """
+    One asyncio loop on one daemon thread (+ bounded REST executor)
+    """
+
+    def __init__(self, rest_workers: int = ASYNC_REST_WORKERS):
+        self.loop = asyncio.new_event_loop()
+        self._executor = ThreadPoolExecutor(
+            max_workers=rest_workers,
+            thread_name_prefix="rest",
+        )
+        self.loop.set_default_executor(self._executor)
+
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+
+        self._thread = threading.Thread(
+            target=self.loop.run_forever,
+            name="asyncio-core",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._thread = None
+
+    def run(self, coro):
+        """
+        Schedule a coroutine from any thread -> concurrent Future
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def submit(self, fn, *args, on_done=None, on_error=None, dispatcher=None):
+        """
+        Run blocking fn(*args) (e.g. a REST call) on the executor
+
+        on_done(result) / on_error(exc) are delivered on the Tk thread
+        through dispatcher.post() when a dispatcher is given.
+        """
+        async def job():
+            return await self.loop.run_in_executor(None, fn, *args)
+
+        def deliver(callback, value):
+            if dispatcher is not None:
+                dispatcher.post(callback, value)
+            else:
+                callback(value)
+
+        def done(future):
+            if future.cancelled():
+                return
+            exc = future.exception()
+            if exc is not None:
+                if on_error is not None:
+                    deliver(on_error, exc)
+                else:
+                    print(f"[REST] {getattr(fn, '__name__', fn)} failed: {exc}")
+            elif on_done is not None:
+                deliver(on_done, future.result())
+
+        future = self.run(job())
+        future.add_done_callback(done)
+        return future
+
+    def every(self, interval: float, fn):
+        """
+        Call blocking fn() on the executor every `interval` seconds
+
+        Returns a Future; cancel() it to stop.
+        """
+        async def periodic():
+            while True:
+                try:
+                    await self.loop.run_in_executor(None, fn)
+                except Exception as e:
+                    print(f"[REST] {getattr(fn, '__name__', fn)} failed: {e}")
+                await asyncio.sleep(interval)
+
+        return self.run(periodic())
+
+
+# ==================================================
+# Combined stream on the event loop
+# ==================================================
+class AsyncStreamManager(BinanceStreamManager):
+    """
+    BinanceStreamManager on the shared asyncio loop
+
+    - same subscribe / unsubscribe / handler(payload, recv_time) API
+    - no thread of its own: the connection is a task on core.loop
+    - handlers run on the loop thread (keep them short, no Tk calls)
+    """
+
+    def __init__(self, core: AsyncNetworkCore,
+                 base_url: str = BINANCE_WS_URL, recorder=None):
+        _require_websockets()
+        super().__init__(base_url=base_url, recorder=recorder)
+
+        self.core = core
+        self._task = None
+
+    # ==================================================
+    # Public API
+    # ==================================================
+    def start(self):
+        if self._running:
+            return
+
+        self._running = True
+        self._task = self.core.run(self._run_async())
+
+    def stop(self):
+        self._running = False
+        self._connected = False
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    # ==================================================
+    # Internal loop (event loop thread)
+    # ==================================================
+    async def _run_async(self):
+        """
+        Reconnect loop
+        """
+        while self._running:
+            if not self.streams():
+                # nothing to listen to yet
+                await asyncio.sleep(0.2)
+                continue
+
+            try:
+                await self._connect_async()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[WS] Fatal error: {e}")
+
+            self._connected = False
+            self._ws = None
+
+            if self._running:
+                delay = self._backoff.next()
+                print(f"[WS] Reconnecting in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+
+    async def _connect_async(self):
+        url = self._stream_url()
+
+        async with websockets.connect(
+            url,
+            ping_interval=20,
+            ping_timeout=10,
+            max_size=None,
+        ) as ws:
+            self._ws = ws
+            if self._opened():
+                # messages wait in the socket until the gap is filled
+                await self._run_reconnect_listeners_async()
+
+            # stall watchdog = recv timeout (no extra thread)
+            timeout = WS_STALL_TIMEOUT or None
+            while True:
+                try:
+                    message = await asyncio.wait_for(ws.recv(), timeout)
+                except asyncio.TimeoutError:
+                    print(f"[WS] No message for {timeout:.0f}s -> reconnecting")
+                    break
+                except websockets.ConnectionClosed:
+                    break
+                self._on_message(ws, message)
+
+        if self._running:
+            print(f"[WS] Connection closed")
+
+    async def _run_reconnect_listeners_async(self):
+        """
+        Listeners on the REST executor (thread count stays constant)
+        """
+        listeners = self._reconnect_listeners
+        if not listeners:
+            return
+
+        jobs = [
+            self.core.loop.run_in_executor(None, self._call_listener, c)
+            for c in listeners
+        ]
+        try:
+            await asyncio.wait_for(asyncio.gather(*jobs), BACKFILL_TIMEOUT)
+        except asyncio.TimeoutError:
+            print(f"[WS] Backfill timed out after {BACKFILL_TIMEOUT}s, resuming stream")
+
+    def _send(self, method: str, params: list):
+        if not self._connected or self._ws is None:
+            # applied via the URL on (re)connect
+            return
+
+        ws = self._ws
+        frame = self._frame(method, params)
+
+        async def send():
+            try:
+                await ws.send(frame)
+            except Exception as e:
+                print(f"[WS] {method} failed: {e}")
+
+        self.core.run(send())
@@ -1,9 +1,119 @@
 # api/binance_rest.py
 
+import json
+import threading
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.config import HTTP_RETRIES, HTTP_BACKOFF, HTTP_POOL_SIZE
 
 BASE_URL = "https://api.binance.com"
 
+KLINES_MAX_LIMIT = 1000  # max rows per /api/v3/klines request
+
+INTERVAL_MS = {
+    "1m": 60_000,
+    "3m": 3 * 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "30m": 30 * 60_000,
+    "1h": 3_600_000,
+    "2h": 2 * 3_600_000,
+    "4h": 4 * 3_600_000,
+    "6h": 6 * 3_600_000,
+    "8h": 8 * 3_600_000,
+    "12h": 12 * 3_600_000,
+    "1d": 86_400_000,
+    "3d": 3 * 86_400_000,
+    "1w": 7 * 86_400_000,
+}
+
+
+def interval_to_ms(interval: str) -> int:
+    try:
+        return INTERVAL_MS[interval]
+    except KeyError:
+        raise ValueError(f"Unsupported kline interval: {interval}")
+
+
+TICKER_KEYS = [
+    "lastPrice",
+    "priceChangePercent",
+    "highPrice",
+    "lowPrice",
+    "quoteVolume",
+]
+
+
+# ==================================================
+# Shared HTTP session (keep-alive + retry/backoff)
+# ==================================================
+_session = None
+_session_lock = threading.Lock()
+
+
+def _build_session(retries, backoff, pool_size) -> requests.Session:
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(
+        max_retries=retry,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def configure_session(
+    retries: int = HTTP_RETRIES,
+    backoff: float = HTTP_BACKOFF,
+    pool_size: int = HTTP_POOL_SIZE,
+) -> requests.Session:
+    """
+    (Re)create the pooled session used by every REST call
+
+    - keep-alive connection pool -> one TCP+TLS handshake per host
+    - retries GET on connection errors, 429 and 5xx with
+      exponential backoff (backoff * 2^n seconds)
+    """
+    global _session
+
+    session = _build_session(retries, backoff, pool_size)
+
+    with _session_lock:
+        old, _session = _session, session
+
+    if old is not None:
+        old.close()
+
+    return session
+
+
+def get_session() -> requests.Session:
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            _session = _build_session(HTTP_RETRIES, HTTP_BACKOFF, HTTP_POOL_SIZE)
+        return _session
+
+
+def _validate_ticker(data: dict):
+    # basic validation (fail fast)
+    for key in TICKER_KEYS:
+        if key not in data:
+            raise ValueError(f"Missing key in response: {key}")
+
 
 def get_24h_ticker(symbol: str) -> dict:
     """
@@ -23,19 +133,75 @@ def get_24h_ticker(symbol: str) -> dict:
     }
 
     try:
-        response = requests.get(url, params=params, timeout=5)
+        response = get_session().get(url, params=params, timeout=5)
+        response.raise_for_status()
+        data = response.json()
+
+        _validate_ticker(data)
+
+        return data
+
+    except requests.RequestException as e:
+        raise RuntimeError(f"Binance REST request failed: {e}")
+
+    except ValueError as e:
+        raise RuntimeError(f"Invalid Binance REST response: {e}")
+
+
+def get_24h_tickers(symbols) -> dict:
+    """
+    Batched 24h ticker: ONE request for many symbols
+
+    Returns {SYMBOL: ticker dict} (same keys as get_24h_ticker)
+    """
+    symbols = [s.upper() for s in symbols]
+    if not symbols:
+        return {}
+
+    url = f"{BASE_URL}/api/v3/ticker/24hr"
+    params = {
+        "symbols": json.dumps(symbols, separators=(",", ":"))
+    }
+
+    try:
+        response = get_session().get(url, params=params, timeout=5)
+        response.raise_for_status()
+
+        result = {}
+        for data in response.json():
+            _validate_ticker(data)
+            result[data["symbol"]] = data
+
+        return result
+
+    except requests.RequestException as e:
+        raise RuntimeError(f"Binance REST request failed: {e}")
+
+    except (ValueError, KeyError, TypeError) as e:
+        raise RuntimeError(f"Invalid Binance REST response: {e}")
+
+
+def get_depth_snapshot(symbol: str, limit: int = 1000) -> dict:
+    """
+    Order book snapshot from /api/v3/depth
+
+    Returns dict with keys:
+    - lastUpdateId
+    - bids  [[price, qty], ...] best first
+    - asks  [[price, qty], ...] best first
+    """
+    url = f"{BASE_URL}/api/v3/depth"
+    params = {
+        "symbol": symbol.upper(),
+        "limit": limit
+    }
+
+    try:
+        response = get_session().get(url, params=params, timeout=5)
         response.raise_for_status()
         data = response.json()
 
-        # basic validation (fail fast)
-        required_keys = [
-            "lastPrice",
-            "priceChangePercent",
-            "highPrice",
-            "lowPrice",
-            "quoteVolume",
-        ]
-        for key in required_keys:
+        for key in ("lastUpdateId", "bids", "asks"):
             if key not in data:
                 raise ValueError(f"Missing key in response: {key}")
 
@@ -46,13 +212,114 @@ def get_24h_ticker(symbol: str) -> dict:
 
     except ValueError as e:
         raise RuntimeError(f"Invalid Binance REST response: {e}")
-def get_klines(symbol: str, interval="1h", limit=100):
+
+
+def get_klines(symbol: str, interval="1h", limit=100,
+               start_time=None, end_time=None):
     url = f"{BASE_URL}/api/v3/klines"
     params = {
         "symbol": symbol,
         "interval": interval,
         "limit": limit
     }
-    r = requests.get(url, params=params, timeout=5)
+    if start_time is not None:
+        params["startTime"] = int(start_time)
+    if end_time is not None:
+        params["endTime"] = int(end_time)
+
+    r = get_session().get(url, params=params, timeout=5)
     r.raise_for_status()
     return r.json()
+
+
+def get_klines_range(symbol: str, interval: str, start_time: int,
+                     end_time=None, page_size=KLINES_MAX_LIMIT):
+    """
+    All klines with open time in [start_time, end_time] (epoch ms)
+
+    Paginates past Binance's 1000 rows per request limit.
+    """
+    rows = []
+    cursor = int(start_time)
+
+    while True:
+        page = get_klines(
+            symbol,
+            interval=interval,
+            limit=page_size,
+            start_time=cursor,
+            end_time=end_time,
+        )
+        if not page:
+            break
+
+        rows.extend(page)
+
+        if len(page) < page_size:
+            break
+
+        # next page starts after the last open time
+        cursor = int(page[-1][0]) + 1
+        if end_time is not None and cursor > end_time:
+            break
+
+    return rows
+
+
+TRADES_MAX_LIMIT = 1000  # rows per aggTrades / historicalTrades request
+
+
+def get_agg_trades(symbol: str, from_id=None, start_time=None,
+                   limit=TRADES_MAX_LIMIT) -> list:
+    """
+    Aggregate trades from /api/v3/aggTrades, oldest first
+
+    Each row: a (agg id), p, q, f / l (first / last trade id),
+    T (time ms), m (buyer is maker)
+    """
+    url = f"{BASE_URL}/api/v3/aggTrades"
+    params = {
+        "symbol": symbol.upper(),
+        "limit": limit
+    }
+    if from_id is not None:
+        params["fromId"] = int(from_id)
+    elif start_time is not None:
+        params["startTime"] = int(start_time)
+
+    try:
+        response = get_session().get(url, params=params, timeout=5)
+        response.raise_for_status()
+        return response.json()
+
+    except requests.RequestException as e:
+        raise RuntimeError(f"Binance REST request failed: {e}")
+
+    except ValueError as e:
+        raise RuntimeError(f"Invalid Binance REST response: {e}")
+
+
+def get_historical_trades(symbol: str, from_id: int,
+                          limit=TRADES_MAX_LIMIT) -> list:
+    """
+    Trades by id from /api/v3/historicalTrades, oldest first
+
+    Each row: id, price, qty, time (ms), isBuyerMaker
+    """
+    url = f"{BASE_URL}/api/v3/historicalTrades"
+    params = {
+        "symbol": symbol.upper(),
+        "fromId": int(from_id),
+        "limit": limit
+    }
+
+    try:
+        response = get_session().get(url, params=params, timeout=5)
+        response.raise_for_status()
+        return response.json()
+
+    except requests.RequestException as e:
+        raise RuntimeError(f"Binance REST request failed: {e}")
+
+    except ValueError as e:
+        raise RuntimeError(f"Invalid Binance REST response: {e}")
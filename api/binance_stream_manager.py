@@ -0,0 +1,304 @@
+# api/binance_stream_manager.py
+
+import itertools
+import json
+import threading
+import time
+import websocket
+
+from api import trade_decoder
+from api.reconnect import Backoff, StallWatchdog
+from config.config import BINANCE_WS_URL, BACKFILL_TIMEOUT
+
+
+def _stream_name(stream: str) -> str:
+    # symbol streams are lowercase; all-market ones (!miniTicker@arr)
+    # are case-sensitive
+    return stream if stream.startswith("!") else stream.lower()
+
+
+class BinanceStreamManager:
+    """
+    Shared Binance combined-stream WebSocket
+
+    - ONE connection: /stream?streams=a@trade/b@trade/...
+    - subscribe / unsubscribe at runtime (SUBSCRIBE / UNSUBSCRIBE frames)
+    - routes every message to the handlers of its stream
+    - Features:
+        * auto reconnect (re-subscribes everything), exponential
+          backoff with jitter, stall watchdog (api/reconnect.py)
+        * reconnect listeners run before live messages resume
+          (gap backfill keeps trades in order)
+        * background thread
+        * safe close
+        * optional raw frame recording (api/stream_recorder.py)
+    """
+
+    def __init__(self, base_url: str = BINANCE_WS_URL, recorder=None):
+        self.base_url = base_url
+        self.recorder = recorder
+
+        # stream name -> [handler(payload_dict, recv_time)]
+        self._handlers = {}
+        self._reconnect_listeners = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+        self._ws = None
+        self._url = None
+        self._thread = None
+        self._running = False
+        self._connected = False
+        self._opened_before = False
+
+        self._backoff = Backoff()
+        self._watchdog = StallWatchdog(None)
+
+    # ==================================================
+    # Public API
+    # ==================================================
+    def subscribe(self, stream: str, handler):
+        """
+        handler(payload, recv_time) runs on the websocket thread
+        """
+        stream = _stream_name(stream)
+
+        with self._lock:
+            handlers = self._handlers.get(stream, [])
+            is_new = not handlers
+            if handler not in handlers:
+                self._handlers[stream] = handlers + [handler]
+
+        if is_new:
+            self._send("SUBSCRIBE", [stream])
+
+        self.start()
+
+    def unsubscribe(self, stream: str, handler=None):
+        """
+        Remove one handler (or all) -> UNSUBSCRIBE when none are left
+        """
+        stream = _stream_name(stream)
+
+        with self._lock:
+            handlers = self._handlers.get(stream)
+            if handlers is None:
+                return
+
+            if handler is not None:
+                handlers = [h for h in handlers if h != handler]
+
+            if handler is None or not handlers:
+                del self._handlers[stream]
+                removed = True
+            else:
+                self._handlers[stream] = handlers
+                removed = False
+
+        if removed:
+            self._send("UNSUBSCRIBE", [stream])
+
+    def add_reconnect_listener(self, callback):
+        """
+        callback() runs on the stream thread after a RE-connect, before
+        any new message is dispatched (blocking it holds them back)
+        """
+        with self._lock:
+            if callback not in self._reconnect_listeners:
+                self._reconnect_listeners = self._reconnect_listeners + [callback]
+
+    def remove_reconnect_listener(self, callback):
+        with self._lock:
+            self._reconnect_listeners = [
+                c for c in self._reconnect_listeners if c != callback
+            ]
+
+    def streams(self):
+        with self._lock:
+            return list(self._handlers)
+
+    def start(self):
+        """
+        Start websocket connection (non-blocking)
+        """
+        if self._running:
+            return
+
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run,
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop websocket connection gracefully
+        """
+        self._running = False
+        self._connected = False
+        if self._ws:
+            try:
+                self._ws.close()
+            except Exception:
+                pass
+            self._ws = None
+
+    # ==================================================
+    # Internal loop
+    # ==================================================
+    def _run(self):
+        """
+        Reconnect loop
+        """
+        while self._running:
+            if not self.streams():
+                # nothing to listen to yet
+                time.sleep(0.2)
+                continue
+
+            try:
+                self._connect()
+            except Exception as e:
+                print(f"[WS] Fatal error: {e}")
+
+            self._connected = False
+
+            if self._running:
+                delay = self._backoff.next()
+                print(f"[WS] Reconnecting in {delay:.1f}s...")
+                time.sleep(delay)
+
+    def _connect(self):
+        url = self._stream_url()
+
+        ws = websocket.WebSocketApp(
+            url,
+            on_message=self._on_message,
+            on_error=self._on_error,
+            on_close=self._on_close,
+            on_open=self._on_open,
+        )
+        self._ws = ws
+
+        # open but silent for too long -> close, the loop reconnects
+        self._watchdog = StallWatchdog(ws.close)
+        self._watchdog.start()
+        try:
+            ws.run_forever(
+                ping_interval=20,
+                ping_timeout=10
+            )
+        finally:
+            self._watchdog.stop()
+
+    def _stream_url(self):
+        # current subscriptions go in the URL -> no re-subscribe needed
+        self._url = f"{self.base_url}/stream?streams={'/'.join(self.streams())}"
+        return self._url
+
+    def _frame(self, method: str, params: list) -> str:
+        return json.dumps({
+            "method": method,
+            "params": params,
+            "id": next(self._ids),
+        })
+
+    def _send(self, method: str, params: list):
+        if not self._connected or self._ws is None:
+            # applied via the URL on (re)connect
+            return
+
+        try:
+            self._ws.send(self._frame(method, params))
+        except Exception as e:
+            print(f"[WS] {method} failed: {e}")
+
+    # ==================================================
+    # WebSocket callbacks
+    # ==================================================
+    def _on_open(self, ws):
+        if self._opened():
+            self._run_reconnect_listeners()
+
+    def _opened(self) -> bool:
+        """
+        Connection is up; True when it is a RE-connect
+        """
+        self._connected = True
+        print(f"[WS] Connected: {len(self.streams())} stream(s)")
+
+        # streams added between building the URL and the handshake
+        url_streams = set(self._url.split("streams=", 1)[-1].split("/"))
+        missing = [s for s in self.streams() if s not in url_streams]
+        if missing:
+            self._send("SUBSCRIBE", missing)
+
+        reconnect = self._opened_before
+        self._opened_before = True
+        return reconnect
+
+    def _run_reconnect_listeners(self):
+        """
+        Run every listener in parallel (one REST round trip in total),
+        wait at most BACKFILL_TIMEOUT before messages flow again
+        """
+        listeners = self._reconnect_listeners
+        if not listeners:
+            return
+
+        threads = [
+            threading.Thread(target=self._call_listener, args=(c,), daemon=True)
+            for c in listeners
+        ]
+        for t in threads:
+            t.start()
+
+        deadline = time.time() + BACKFILL_TIMEOUT
+        for t in threads:
+            t.join(max(0.0, deadline - time.time()))
+
+        if any(t.is_alive() for t in threads):
+            print(f"[WS] Backfill timed out after {BACKFILL_TIMEOUT}s, resuming stream")
+
+    @staticmethod
+    def _call_listener(callback):
+        try:
+            callback()
+        except Exception as e:
+            print(f"[WS] Reconnect listener error: {e}")
+
+    def _on_message(self, ws, message):
+        recv_time = time.time()
+        self._watchdog.touch(recv_time)
+        if self._backoff.attempt:
+            # healthy connection -> next outage starts from the base delay
+            self._backoff.reset()
+        if self.recorder is not None:
+            self.recorder.write(message, recv_time)
+
+        try:
+            data = trade_decoder.loads(message)
+
+            stream = data.get("stream")
+            if stream is None:
+                # SUBSCRIBE / UNSUBSCRIBE acknowledgement
+                return
+
+            handlers = self._handlers.get(stream, ())
+            payload = data["data"]
+
+            for handler in handlers:
+                handler(payload, recv_time)
+
+        except Exception as e:
+            print(f"[WS] Parse error: {e}")
+
+    def _on_error(self, ws, error):
+        if self._running:
+            print(f"[WS] Error: {error}")
+
+    def _on_close(self, ws, *args):
+        self._connected = False
+        if self._running:
+            print(f"[WS] Connection closed")
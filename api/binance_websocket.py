@@ -1,32 +1,44 @@
 # api/binance_websocket.py
 
-import json
 import threading
 import time
 import websocket
 
+from api import trade_decoder
+from api.reconnect import Backoff, StallWatchdog
+from config.config import BINANCE_WS_URL, STREAM_TYPE
+
 
 class BinanceWebSocket:
     """
     Production-grade Binance WebSocket client
 
-    - Stream: <symbol>@trade
-    - Emits : price only (realtime)
+    - Stream: <symbol>@<stream type> (STREAM_TYPE: aggTrade, trade, ...)
+    - Emits : Trade records (api/trade_decoder.py)
     - Features:
-        * auto reconnect
+        * auto reconnect, exponential backoff with jitter, stall watchdog
+        * on_reconnect() before live trades resume (gap backfill)
         * background thread
         * safe close
+        * optional raw frame recording (api/stream_recorder.py)
     """
 
-    def __init__(self, symbol: str, on_trade):
+    def __init__(self, symbol: str, on_trade, base_url: str = BINANCE_WS_URL,
+                 recorder=None, on_reconnect=None, stream: str = STREAM_TYPE):
         self.symbol = symbol.lower()
+        self.stream = trade_decoder.stream_type(stream)
         self.on_trade = on_trade
+        self.on_reconnect = on_reconnect
+        self.base_url = base_url
+        self.recorder = recorder
 
         self._ws = None
         self._thread = None
         self._running = False
+        self._opened_before = False
 
-        self._reconnect_delay = 3  # seconds
+        self._backoff = Backoff()
+        self._watchdog = StallWatchdog(None)
 
     # ==================================================
     # Public API
@@ -71,25 +83,33 @@ class BinanceWebSocket:
                 print(f"[WS] Fatal error: {e}")
 
             if self._running:
-                print(f"[WS] Reconnecting in {self._reconnect_delay}s...")
-                time.sleep(self._reconnect_delay)
+                delay = self._backoff.next()
+                print(f"[WS] Reconnecting in {delay:.1f}s...")
+                time.sleep(delay)
 
     def _connect(self):
-        url = f"wss://stream.binance.com:9443/ws/{self.symbol}@trade"
+        url = f"{self.base_url}/ws/{self.symbol}@{self.stream.suffix}"
 
-        self._ws = websocket.WebSocketApp(
+        ws = websocket.WebSocketApp(
             url,
             on_message=self._on_message,
             on_error=self._on_error,
             on_close=self._on_close,
             on_open=self._on_open,
         )
+        self._ws = ws
 
-        # ping_interval สำคัญมากสำหรับ connection ยาว ๆ
-        self._ws.run_forever(
-            ping_interval=20,
-            ping_timeout=10
-        )
+        # open but silent for too long -> close, the loop reconnects
+        self._watchdog = StallWatchdog(ws.close)
+        self._watchdog.start()
+        try:
+            # ping_interval สำคัญมากสำหรับ connection ยาว ๆ
+            ws.run_forever(
+                ping_interval=20,
+                ping_timeout=10
+            )
+        finally:
+            self._watchdog.stop()
 
     # ==================================================
     # WebSocket callbacks
@@ -97,16 +117,27 @@ class BinanceWebSocket:
     def _on_open(self, ws):
         print(f"[WS] Connected: {self.symbol}")
 
+        reconnect = self._opened_before
+        self._opened_before = True
+
+        # blocks this thread -> live trades queue in the socket meanwhile
+        if reconnect and callable(self.on_reconnect):
+            try:
+                self.on_reconnect()
+            except Exception as e:
+                print(f"[WS] Reconnect listener error: {e}")
+
     def _on_message(self, ws, message):
+        recv_time = time.time()
+        self._watchdog.touch(recv_time)
+        if self._backoff.attempt:
+            # healthy connection -> next outage starts from the base delay
+            self._backoff.reset()
+        if self.recorder is not None:
+            self.recorder.write(message, recv_time)
+
         try:
-            data = json.loads(message)
-
-            trade = {
-                "price": float(data["p"]),
-                "qty": float(data["q"]),
-                "side": "sell" if data["m"] else "buy",
-                "ts": time.time(),
-            }
+            trade = self.stream.decode(trade_decoder.loads(message), recv_time)
 
             if callable(self.on_trade):
                 self.on_trade(trade)
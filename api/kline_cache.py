@@ -0,0 +1,229 @@
+# api/kline_cache.py
+
+import os
+import sqlite3
+import threading
+import time
+
+from api.binance_rest import get_klines_range, interval_to_ms
+from config.config import KLINE_CACHE_PATH
+
+
+class KlineCache:
+    """
+    Persistent SQLite store of CLOSED klines
+
+    - keyed by (symbol, interval, open_time)
+    - get_klines() serves cached candles instantly and only fetches
+      the missing ranges (normally just the tail) via startTime
+    - the still-open candle is never stored (it keeps changing)
+    - closed ranges the exchange has no klines for (before listing,
+      outages) are remembered as empty spans, so they are fetched once
+
+    Rows are returned REST-style: [open_time, open, high, low, close, volume]
+    """
+
+    def __init__(self, path: str = KLINE_CACHE_PATH):
+        self.path = path
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS klines (
+                symbol    TEXT    NOT NULL,
+                interval  TEXT    NOT NULL,
+                open_time INTEGER NOT NULL,
+                open      REAL    NOT NULL,
+                high      REAL    NOT NULL,
+                low       REAL    NOT NULL,
+                close     REAL    NOT NULL,
+                volume    REAL    NOT NULL,
+                PRIMARY KEY (symbol, interval, open_time)
+            ) WITHOUT ROWID
+            """
+        )
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS empty_spans (
+                symbol     TEXT    NOT NULL,
+                interval   TEXT    NOT NULL,
+                start_time INTEGER NOT NULL,
+                end_time   INTEGER NOT NULL,
+                PRIMARY KEY (symbol, interval, start_time)
+            ) WITHOUT ROWID
+            """
+        )
+        self._db.commit()
+
+    # ==================================================
+    # Storage
+    # ==================================================
+    def load(self, symbol: str, interval: str, start_ms: int, end_ms: int):
+        """
+        Cached rows with open_time in [start_ms, end_ms], oldest first
+        """
+        with self._lock:
+            cur = self._db.execute(
+                """
+                SELECT open_time, open, high, low, close, volume
+                FROM klines
+                WHERE symbol = ? AND interval = ?
+                  AND open_time BETWEEN ? AND ?
+                ORDER BY open_time
+                """,
+                (symbol.upper(), interval, int(start_ms), int(end_ms)),
+            )
+            return [list(row) for row in cur.fetchall()]
+
+    def store(self, symbol: str, interval: str, rows):
+        if not rows:
+            return
+
+        symbol = symbol.upper()
+        with self._lock:
+            self._db.executemany(
+                """
+                INSERT OR REPLACE INTO klines
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (symbol, interval, int(r[0]), float(r[1]), float(r[2]),
+                     float(r[3]), float(r[4]), float(r[5]))
+                    for r in rows
+                ],
+            )
+            self._db.commit()
+
+    def load_empty(self, symbol: str, interval: str, start_ms: int, end_ms: int):
+        """
+        Known-empty (start, end) open-time spans overlapping [start_ms, end_ms]
+        """
+        with self._lock:
+            cur = self._db.execute(
+                """
+                SELECT start_time, end_time
+                FROM empty_spans
+                WHERE symbol = ? AND interval = ?
+                  AND start_time <= ? AND end_time >= ?
+                """,
+                (symbol.upper(), interval, int(end_ms), int(start_ms)),
+            )
+            return cur.fetchall()
+
+    def store_empty(self, symbol: str, interval: str, spans):
+        if not spans:
+            return
+
+        symbol = symbol.upper()
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO empty_spans VALUES (?, ?, ?, ?)",
+                [(symbol, interval, int(s), int(e)) for s, e in spans],
+            )
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    # ==================================================
+    # Cached fetch
+    # ==================================================
+    def get_klines(self, symbol: str, interval: str, limit: int,
+                   end_time=None):
+        """
+        Last `limit` klines up to end_time (default: now, incl. open candle)
+        """
+        symbol = symbol.upper()
+        step = interval_to_ms(interval)
+
+        now = int(time.time() * 1000) if end_time is None else int(end_time)
+        last_open = now - now % step
+        first_open = last_open - (limit - 1) * step
+
+        cached = self.load(symbol, interval, first_open, last_open)
+
+        # open times we know about: cached rows + known-empty spans
+        known = {int(r[0]) for r in cached}
+        for start, end in self.load_empty(symbol, interval, first_open, last_open):
+            known.update(range(max(start, first_open), min(end, last_open) + 1, step))
+
+        wall_now = int(time.time() * 1000)
+        fetched = []
+        empty = []
+        for start, end in self._missing_ranges(sorted(known), first_open, last_open, step):
+            rows = get_klines_range(symbol, interval, start, end)
+            fetched.extend(rows)
+            empty.extend(self._empty_spans(rows, start, end, step, wall_now))
+
+        # only closed candles (and closed empty spans) are persisted
+        closed = [k for k in fetched if int(k[0]) + step <= wall_now]
+        self.store(symbol, interval, closed)
+        self.store_empty(symbol, interval, empty)
+
+        rows = {int(r[0]): r for r in cached}
+        for k in fetched:
+            rows[int(k[0])] = [
+                int(k[0]), float(k[1]), float(k[2]),
+                float(k[3]), float(k[4]), float(k[5]),
+            ]
+
+        return [rows[t] for t in sorted(rows) if first_open <= t <= last_open]
+
+    @staticmethod
+    def _missing_ranges(known, first_open, last_open, step):
+        """
+        [(start, end)] open-time ranges not covered by `known` (sorted)
+        """
+        ranges = []
+        expected = first_open
+
+        for t in known:
+            if t > expected:
+                ranges.append((expected, t - step))
+            expected = t + step
+
+        if expected <= last_open:
+            ranges.append((expected, last_open))
+
+        return ranges
+
+    @staticmethod
+    def _empty_spans(rows, start, end, step, wall_now):
+        """
+        [(start, end)] closed open-time runs in [start, end] without a row
+        """
+        present = {int(k[0]) for k in rows}
+        spans = []
+        run = None
+
+        for t in range(start, min(end, wall_now - step) + 1, step):
+            if t in present:
+                run = None
+            elif run is None:
+                run = [t, t]
+                spans.append(run)
+            else:
+                run[1] = t
+
+        return [tuple(s) for s in spans]
+
+
+# ==================================================
+# Shared instance
+# ==================================================
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_kline_cache() -> KlineCache:
+    global _cache
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = KlineCache()
+        return _cache
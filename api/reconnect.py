@@ -0,0 +1,81 @@
+# api/reconnect.py
+"""
+Reconnect helpers shared by the websocket clients
+
+- Backoff       : exponential delay with jitter (no reconnect storms
+                  when many clients drop at once)
+- StallWatchdog : forces a reconnect when a connection is open but
+                  silent (half-open TCP, stuck proxy, ...)
+"""
+
+import random
+import threading
+import time
+
+from config.config import WS_BACKOFF_BASE, WS_BACKOFF_MAX, WS_STALL_TIMEOUT
+
+
+class Backoff:
+    """
+    Exponential backoff with "equal jitter"
+
+    delay(n) = d / 2 + uniform(0, d / 2),  d = min(cap, base * 2 ** n)
+    reset() after a healthy connection (first message received).
+    """
+
+    def __init__(self, base: float = WS_BACKOFF_BASE, cap: float = WS_BACKOFF_MAX):
+        self.base = base
+        self.cap = cap
+        self.attempt = 0
+
+    def next(self) -> float:
+        delay = min(self.cap, self.base * 2 ** self.attempt)
+        self.attempt += 1
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def reset(self):
+        self.attempt = 0
+
+
+class StallWatchdog:
+    """
+    Calls on_stall() once when touch() was not called for `timeout` s
+
+    One daemon thread per connection; touch() is a plain attribute
+    write (hot path).
+    """
+
+    def __init__(self, on_stall, timeout: float = WS_STALL_TIMEOUT):
+        self.on_stall = on_stall
+        self.timeout = timeout
+        self.last = time.time()
+
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self.timeout <= 0:
+            return
+
+        self.last = time.time()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def touch(self, now: float | None = None):
+        self.last = time.time() if now is None else now
+
+    def _run(self):
+        check = max(0.5, self.timeout / 4)
+        while not self._stop.wait(check):
+            silent = time.time() - self.last
+            if silent >= self.timeout:
+                print(f"[WS] No message for {silent:.0f}s -> reconnecting")
+                self._stop.set()
+                try:
+                    self.on_stall()
+                except Exception:
+                    pass
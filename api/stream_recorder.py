@@ -0,0 +1,307 @@
+# api/stream_recorder.py
+"""
+Record / replay raw Binance websocket frames
+
+File format (append-only):
+    header : b"BSTR" + version (1 byte) + flags (1 byte, 1 = zstd)
+    frame  : <recv_time float64><length uint32><payload bytes>
+
+With zstd the frames after the header are one zstd stream.
+
+Record from the command line:
+    python -m api.stream_recorder record btc.bstr btcusdt ethusdt [--zstd]
+                                         [--stream aggTrade]
+    python -m api.stream_recorder info btc.bstr
+"""
+
+import argparse
+import struct
+import threading
+import time
+
+from api import trade_decoder
+from api.trade_decoder import decoder_for, stream_type
+from config.config import STREAM_TYPE
+
+try:
+    import zstandard
+except ImportError:  # optional
+    zstandard = None
+
+
+MAGIC = b"BSTR"
+VERSION = 1
+FLAG_ZSTD = 1
+
+_FRAME = struct.Struct("<dI")
+
+
+def _require_zstd():
+    if zstandard is None:
+        raise RuntimeError("zstd compression needs: pip install zstandard")
+
+
+# ==================================================
+# Recorder
+# ==================================================
+class StreamRecorder:
+    """
+    Append raw frames + receive timestamps to a file (thread-safe)
+    """
+
+    def __init__(self, path: str, compress: bool = False):
+        self.path = path
+        self.compress = compress
+        self.frames = 0
+
+        # before open(): no handle / header-only file left on failure
+        if compress:
+            _require_zstd()
+
+        self._lock = threading.Lock()
+        self._raw = open(path, "wb")
+        self._raw.write(MAGIC + bytes([VERSION, FLAG_ZSTD if compress else 0]))
+
+        if compress:
+            self._out = zstandard.ZstdCompressor().stream_writer(self._raw)
+        else:
+            self._out = self._raw
+
+    def write(self, message, recv_time: float | None = None):
+        if isinstance(message, str):
+            message = message.encode("utf-8")
+        if recv_time is None:
+            recv_time = time.time()
+
+        with self._lock:
+            if self._out is None:
+                return
+            self._out.write(_FRAME.pack(recv_time, len(message)))
+            self._out.write(message)
+            self.frames += 1
+
+    def close(self):
+        with self._lock:
+            if self._out is None:
+                return
+            if self._out is not self._raw:
+                self._out.close()  # flushes the zstd frame + closes file
+            else:
+                self._raw.close()
+            self._out = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_frames(path: str):
+    """
+    Yield (recv_time, payload_bytes) in recorded order
+    """
+    with open(path, "rb") as raw:
+        header = raw.read(6)
+        if header[:4] != MAGIC:
+            raise ValueError(f"Not a stream recording: {path}")
+        if header[4] != VERSION:
+            raise ValueError(f"Unsupported recording version: {header[4]}")
+
+        f = raw
+        if header[5] & FLAG_ZSTD:
+            _require_zstd()
+            f = zstandard.ZstdDecompressor().stream_reader(raw)
+
+        size = _FRAME.size
+        while True:
+            head = f.read(size)
+            if len(head) < size:
+                return
+            recv_time, length = _FRAME.unpack(head)
+            payload = f.read(length)
+            if len(payload) < length:
+                return
+            yield recv_time, payload
+
+
+# ==================================================
+# Replay
+# ==================================================
+class ReplayWebSocket:
+    """
+    Drop-in stand-in for BinanceWebSocket fed from a recording
+
+    - start() / stop() / on_trade like the live client
+    - speed: 1.0 = real time, N = N x faster, 0 = as fast as possible
+    - timestamps are shifted to now (recorded spacing / speed), so the
+      replay looks live to candles and latency stages
+    - symbol: only replay trades of this symbol (combined recordings)
+    """
+
+    def __init__(self, path: str, on_trade=None, speed: float = 1.0,
+                 symbol: str | None = None, loop: bool = False):
+        self.path = path
+        self.on_trade = on_trade
+        self.speed = speed
+        self.symbol = symbol.upper() if symbol else None
+        self.loop = loop
+
+        self.trades = 0
+        self.finished = threading.Event()
+
+        self._thread = None
+        self._running = False
+
+    def start(self):
+        if self._running:
+            return
+
+        self._running = True
+        self.finished.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+
+    def _run(self):
+        try:
+            while self._running:
+                self._replay_once()
+                if not self.loop:
+                    break
+        finally:
+            self._running = False
+            self.finished.set()
+
+    def _replay_once(self):
+        start_wall = time.perf_counter()
+        start_time = time.time()
+        first_recv = None
+
+        for recv_time, payload in read_frames(self.path):
+            if not self._running:
+                return
+
+            if first_recv is None:
+                first_recv = recv_time
+
+            # keep the recorded inter-arrival times (scaled)
+            if self.speed:
+                due = (recv_time - first_recv) / self.speed
+                delay = due - (time.perf_counter() - start_wall)
+                if delay > 0:
+                    time.sleep(delay)
+                shift = (start_time, first_recv, self.speed)
+            else:
+                # as fast as possible: every frame arrives "now"
+                shift = (time.time(), recv_time, 1.0)
+
+            trade = self._decode(payload, recv_time)
+            if trade is not None and callable(self.on_trade):
+                self.trades += 1
+                self.on_trade(_retime(trade, *shift))
+
+    def _decode(self, payload, recv_time):
+        try:
+            data = trade_decoder.loads(payload)
+
+            # combined-stream envelope
+            if "stream" in data:
+                data = data["data"]
+
+            # any STREAM_TYPES stream (trade, aggTrade, bookTicker, kline)
+            decode = decoder_for(data)
+            if decode is None:
+                return None
+            if self.symbol and data.get("s") != self.symbol:
+                return None
+
+            return decode(data, recv_time)
+
+        except Exception as e:
+            print(f"[Replay] Parse error: {e}")
+            return None
+
+
+def _retime(trade, now: float, origin: float, speed: float):
+    """
+    Trade with every timestamp t (epoch s) moved to now + (t - origin) / speed
+    """
+    def live(t):
+        return now + (t - origin) / speed
+
+    return trade._replace(
+        ts=live(trade.ts),
+        trade_time=int(live(trade.trade_time / 1000) * 1000),
+        event_time=int(live(trade.event_time / 1000) * 1000),
+        recv_time=live(trade.recv_time),
+    )
+
+
+# ==================================================
+# CLI
+# ==================================================
+def _record(args):
+    from api.binance_stream_manager import BinanceStreamManager
+
+    recorder = StreamRecorder(args.path, compress=args.zstd)
+    streams = BinanceStreamManager(recorder=recorder)
+    suffix = stream_type(args.stream).suffix
+    for symbol in args.symbols:
+        streams.subscribe(f"{symbol.lower()}@{suffix}", lambda *a: None)
+
+    print(f"[Record] {args.path} <- {', '.join(args.symbols)} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+            print(f"\r[Record] {recorder.frames} frames", end="", flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        streams.stop()
+        recorder.close()
+        print(f"\n[Record] saved {recorder.frames} frames")
+
+
+def _info(args):
+    frames = 0
+    first = last = None
+    size = 0
+    for recv_time, payload in read_frames(args.path):
+        frames += 1
+        size += len(payload)
+        first = recv_time if first is None else first
+        last = recv_time
+
+    duration = (last - first) if frames else 0.0
+    rate = frames / duration if duration else 0.0
+    print(f"frames   : {frames}")
+    print(f"duration : {duration:.1f}s")
+    print(f"rate     : {rate:.0f} frames/s")
+    print(f"payload  : {size / 1e6:.2f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Binance stream recorder")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    rec = sub.add_parser("record", help="record live trade streams")
+    rec.add_argument("path")
+    rec.add_argument("symbols", nargs="+")
+    rec.add_argument("--zstd", action="store_true")
+    rec.add_argument("--stream", default=STREAM_TYPE,
+                     help="trade, aggTrade, bookTicker or kline")
+    rec.set_defaults(func=_record)
+
+    info = sub.add_parser("info", help="summarize a recording")
+    info.add_argument("path")
+    info.set_defaults(func=_info)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# api/ticker_cache.py
+
+import json
+import os
+import time
+
+from config.config import TICKER_CACHE_PATH
+
+
+def load_tickers(path: str = TICKER_CACHE_PATH) -> dict:
+    """
+    Last-known 24h tickers {SYMBOL: ticker dict} (REST keys)
+
+    Shown at startup until the first REST snapshot / trade arrives;
+    {} when there is no (readable) cache yet.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        if not isinstance(e, FileNotFoundError):
+            print(f"[REST] Ticker cache unreadable: {e}")
+        return {}
+
+    return data.get("tickers", {}) if isinstance(data, dict) else {}
+
+
+def ticker_of(controller) -> dict | None:
+    """
+    Current 24h statistics of a MarketController as a ticker dict
+    (None until all of them are known)
+    """
+    c = controller
+    values = (
+        c.last_price, c.price_change_24h, c.change_percent_24h,
+        c.high_24h, c.low_24h, c.volume_24h,
+    )
+    if None in values:
+        return None
+
+    last, change, pct, high, low, volume = values
+    return {
+        "lastPrice": last,
+        "priceChange": change,
+        "priceChangePercent": pct,
+        "highPrice": high,
+        "lowPrice": low,
+        "quoteVolume": volume,
+    }
+
+
+def save_tickers(tickers: dict, path: str = TICKER_CACHE_PATH):
+    """
+    Store {SYMBOL: ticker dict} (replaces the previous cache)
+    """
+    if not tickers:
+        return
+
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # write + rename: a crash never leaves a truncated cache
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"saved_at": time.time(), "tickers": tickers}, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"[REST] Ticker cache not saved: {e}")
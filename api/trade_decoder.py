@@ -0,0 +1,229 @@
+# api/trade_decoder.py
+
+import json
+import time
+from typing import NamedTuple
+
+from config.config import JSON_DECODER, KLINE_INTERVAL, STREAM_TYPE
+
+
+# ==================================================
+# JSON backends (fastest available wins)
+# ==================================================
+def _stdlib_loads():
+    return json.loads
+
+
+def _orjson_loads():
+    import orjson
+    return orjson.loads
+
+
+def _msgspec_loads():
+    import msgspec
+    return msgspec.json.Decoder().decode
+
+
+BACKENDS = {
+    "orjson": _orjson_loads,
+    "msgspec": _msgspec_loads,
+    "json": _stdlib_loads,
+}
+
+loads = json.loads
+backend = "json"
+
+
+def set_backend(name: str = "auto") -> str:
+    """
+    Select the JSON decoder: "auto", "orjson", "msgspec" or "json"
+
+    "auto" picks the first installed of orjson -> msgspec -> json.
+    Returns the name of the backend in use.
+    """
+    global loads, backend
+
+    names = list(BACKENDS) if name == "auto" else [name]
+
+    for candidate in names:
+        factory = BACKENDS.get(candidate)
+        if factory is None:
+            raise ValueError(f"Unknown JSON decoder: {candidate}")
+
+        try:
+            loads = factory()
+        except ImportError:
+            continue
+
+        backend = candidate
+        return backend
+
+    raise ImportError(f"JSON decoder not installed: {name}")
+
+
+set_backend(JSON_DECODER)
+
+
+# ==================================================
+# Trade record
+# ==================================================
+class Trade(NamedTuple):
+    """
+    One exchange trade (compact, immutable)
+
+    ts         : exchange trade time, epoch SECONDS (display)
+    trade_time : exchange trade time, epoch ms (T)
+    event_time : exchange event time, epoch ms (E)
+    recv_time  : local receive time, epoch seconds
+    """
+
+    price: float
+    qty: float
+    side: str
+    ts: float
+    trade_id: int
+    trade_time: int
+    event_time: int
+    recv_time: float
+
+    @property
+    def latency(self) -> float:
+        """
+        exchange event -> local receive, seconds
+        """
+        return self.recv_time - self.event_time / 1000
+
+
+# tuple.__new__ skips NamedTuple's argument handling (hot path)
+_new_trade = tuple.__new__
+
+
+def decode_trade(data: dict, recv_time: float | None = None) -> Trade:
+    """
+    <symbol>@trade payload (already parsed) -> Trade
+    """
+    trade_time = data["T"]
+    return _new_trade(Trade, (
+        float(data["p"]),
+        float(data["q"]),
+        "sell" if data["m"] else "buy",
+        trade_time / 1000,
+        data["t"],
+        trade_time,
+        data["E"],
+        time.time() if recv_time is None else recv_time,
+    ))
+
+
+def decode_agg_trade(data: dict, recv_time: float | None = None) -> Trade:
+    """
+    <symbol>@aggTrade payload -> Trade
+
+    One row per taker order and price level (a sweep = a few rows, not
+    one per fill); trade_id = last trade id of the row (l), so ids stay
+    comparable with <symbol>@trade and the REST backfill.
+    """
+    trade_time = data["T"]
+    return _new_trade(Trade, (
+        float(data["p"]),
+        float(data["q"]),
+        "sell" if data["m"] else "buy",
+        trade_time / 1000,
+        data["l"],
+        trade_time,
+        data["E"],
+        time.time() if recv_time is None else recv_time,
+    ))
+
+
+def decode_book_ticker(data: dict, recv_time: float | None = None) -> Trade:
+    """
+    <symbol>@bookTicker payload -> price tick at the mid (qty 0)
+
+    No exchange timestamp in the payload -> receive time is used.
+    """
+    if recv_time is None:
+        recv_time = time.time()
+    ms = int(recv_time * 1000)
+    return _new_trade(Trade, (
+        (float(data["b"]) + float(data["a"])) / 2,
+        0.0,
+        "buy",
+        recv_time,
+        data["u"],
+        ms,
+        ms,
+        recv_time,
+    ))
+
+
+def decode_kline(data: dict, recv_time: float | None = None) -> Trade:
+    """
+    <symbol>@kline_<interval> payload -> price tick at the close (qty 0)
+    """
+    k = data["k"]
+    event_time = data["E"]
+    return _new_trade(Trade, (
+        float(k["c"]),
+        0.0,
+        "buy",
+        event_time / 1000,
+        k["L"],
+        event_time,
+        event_time,
+        time.time() if recv_time is None else recv_time,
+    ))
+
+
+def decode_trade_message(message, recv_time: float | None = None) -> Trade:
+    """
+    Raw <symbol>@trade frame (str / bytes) -> Trade
+    """
+    if recv_time is None:
+        recv_time = time.time()
+    return decode_trade(loads(message), recv_time)
+
+
+# ==================================================
+# Stream types (STREAM_TYPE)
+# ==================================================
+class StreamType(NamedTuple):
+    """
+    suffix : stream name after "<symbol>@"
+    event  : payload "e" field (None: bookTicker has none)
+    decode : payload dict -> Trade
+    trades : real trades (tape, volume, backfill) or price ticks only
+    """
+
+    suffix: str
+    event: str | None
+    decode: object
+    trades: bool
+
+
+STREAM_TYPES = {
+    "trade": StreamType("trade", "trade", decode_trade, True),
+    "aggTrade": StreamType("aggTrade", "aggTrade", decode_agg_trade, True),
+    "bookTicker": StreamType("bookTicker", None, decode_book_ticker, False),
+    "kline": StreamType(f"kline_{KLINE_INTERVAL}", "kline", decode_kline, False),
+}
+
+
+def stream_type(name: str = STREAM_TYPE) -> StreamType:
+    try:
+        return STREAM_TYPES[name]
+    except KeyError:
+        raise ValueError(f"Unknown stream type: {name}") from None
+
+
+def decoder_for(data: dict):
+    """
+    Decoder matching a payload of any STREAM_TYPES stream, or None
+    """
+    event = data.get("e")
+    if event is None:
+        return decode_book_ticker if "b" in data and "a" in data else None
+    for spec in STREAM_TYPES.values():
+        if spec.event == event:
+            return spec.decode
+    return None
@@ -1,9 +1,14 @@
 # app.py
-from ui.dashboard import Dashboard
+from controllers.startup_timer import startup
 from config.config import APP_TITLE, WINDOW_SIZE
 
 
 def main():
+    # imported here: spawned engine processes re-import this module
+    # and never need the UI
+    from ui.dashboard import Dashboard
+    startup.mark("imports")
+
     app = Dashboard()
     app.title(APP_TITLE)
     app.geometry(WINDOW_SIZE)
@@ -0,0 +1,127 @@
+# benchmarks/bench_candle_render.py
+"""
+Candlestick draw time: per-candle loop (legacy) vs CandlestickRenderer
+
+Run from the project root:
+    python benchmarks/bench_candle_render.py
+    python benchmarks/bench_candle_render.py --sizes 24 1000 5000 --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+matplotlib.use("Agg")
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+
+from ui.panels.candlestick_renderer import CandlestickRenderer
+
+BULL = "#16a34a"
+BEAR = "#dc2626"
+
+
+# ==================================================
+# Synthetic data
+# ==================================================
+def make_candles(n, seed=7):
+    rng = np.random.default_rng(seed)
+
+    x = 20_000.0 + np.arange(n) / 24.0          # hourly, date units
+    closes = 50_000 + np.cumsum(rng.normal(0, 120, n))
+    opens = np.r_[closes[0], closes[:-1]]
+    spread = np.abs(rng.normal(0, 80, n))
+    highs = np.maximum(opens, closes) + spread
+    lows = np.minimum(opens, closes) - spread
+    volumes = np.abs(rng.normal(500, 150, n))
+
+    return x, opens, highs, lows, closes, volumes
+
+
+def make_figure():
+    fig = Figure(figsize=(7, 4), dpi=95)
+    canvas = FigureCanvasAgg(fig)
+    ax_price = fig.add_subplot(211)
+    ax_volume = fig.add_subplot(212, sharex=ax_price)
+    return fig, canvas, ax_price, ax_volume
+
+
+# ==================================================
+# Implementations
+# ==================================================
+def draw_loop(ax_price, ax_volume, x, o, h, l, c, v, width):
+    """
+    Copy of the original RealtimeChartPanel._draw_chart loop
+    """
+    for i, date in enumerate(x):
+        color = BULL if c[i] >= o[i] else BEAR
+
+        ax_price.plot([date, date], [l[i], h[i]], color=color, linewidth=1.2)
+        ax_price.add_patch(
+            Rectangle(
+                (date - width / 2, min(o[i], c[i])),
+                width,
+                abs(c[i] - o[i]),
+                facecolor=color,
+                edgecolor=color,
+            )
+        )
+        ax_volume.bar(date, v[i], width=width, color=color, alpha=0.9)
+
+
+def draw_vectorized(ax_price, ax_volume, x, o, h, l, c, v, width):
+    CandlestickRenderer(ax_price, ax_volume, bull=BULL, bear=BEAR).draw(
+        x, o, h, l, c, v, width
+    )
+
+
+# ==================================================
+# Runner
+# ==================================================
+def bench(draw, n, repeat):
+    data = make_candles(n)
+    width = (data[0][1] - data[0][0]) * 0.7
+
+    build, render = [], []
+    for _ in range(repeat):
+        fig, canvas, ax_price, ax_volume = make_figure()
+
+        t0 = time.perf_counter()
+        draw(ax_price, ax_volume, *data, width)
+        t1 = time.perf_counter()
+        canvas.draw()
+        t2 = time.perf_counter()
+
+        build.append(t1 - t0)
+        render.append(t2 - t1)
+
+    return min(build) * 1000, min(render) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[24, 250, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'candles':>8} | {'loop build':>10} {'loop draw':>10} | "
+          f"{'vec build':>10} {'vec draw':>10} | {'speedup':>7}")
+    print("-" * 70)
+
+    for n in args.sizes:
+        lb, ld = bench(draw_loop, n, args.repeat)
+        vb, vd = bench(draw_vectorized, n, args.repeat)
+        speedup = (lb + ld) / (vb + vd)
+        print(f"{n:>8} | {lb:>8.1f}ms {ld:>8.1f}ms | "
+              f"{vb:>8.1f}ms {vd:>8.1f}ms | {speedup:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
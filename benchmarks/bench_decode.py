@@ -0,0 +1,89 @@
+# benchmarks/bench_decode.py
+"""
+Per-message trade decode cost: legacy dict path vs trade_decoder backends
+
+Run from the project root:
+    python benchmarks/bench_decode.py
+    python benchmarks/bench_decode.py --messages 500000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api import trade_decoder
+
+
+def make_messages(n):
+    base = 1_700_000_000_000
+    return [
+        json.dumps({
+            "e": "trade",
+            "E": base + i,
+            "s": "BTCUSDT",
+            "t": 3_000_000_000 + i,
+            "p": f"{65000 + (i % 500) * 0.01:.2f}",
+            "q": f"{0.0001 * (1 + i % 97):.5f}",
+            "T": base + i - 3,
+            "m": bool(i & 1),
+            "M": True,
+        })
+        for i in range(n)
+    ]
+
+
+def legacy_decode(message):
+    """
+    Original BinanceWebSocket._on_message body
+    """
+    data = json.loads(message)
+    return {
+        "price": float(data["p"]),
+        "qty": float(data["q"]),
+        "side": "sell" if data["m"] else "buy",
+        "ts": time.time(),
+    }
+
+
+def bench(decode, messages):
+    t0 = time.perf_counter()
+    for m in messages:
+        decode(m)
+    return (time.perf_counter() - t0) / len(messages) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=200_000)
+    args = parser.parse_args()
+
+    messages = make_messages(args.messages)
+
+    rows = [("legacy json + dict", bench(legacy_decode, messages))]
+
+    for name in trade_decoder.BACKENDS:
+        try:
+            trade_decoder.set_backend(name)
+        except ImportError:
+            rows.append((f"Trade ({name})", None))
+            continue
+        rows.append((f"Trade ({name})", bench(trade_decoder.decode_trade_message, messages)))
+
+    trade_decoder.set_backend("auto")
+
+    baseline = rows[0][1]
+    print(f"{'decoder':<22} | {'ns / msg':>9} | {'vs legacy':>9}")
+    print("-" * 46)
+    for name, ns in rows:
+        if ns is None:
+            print(f"{name:<22} | {'n/a':>9} | {'not installed':>9}")
+        else:
+            print(f"{name:<22} | {ns:>9.0f} | {baseline / ns:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
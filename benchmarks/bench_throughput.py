@@ -0,0 +1,339 @@
+# benchmarks/bench_throughput.py
+"""
+Throughput benchmark: MarketController + widgets under synthetic load
+
+Run from the project root:
+    python benchmarks/bench_throughput.py                       # stub Tk
+    xvfb-run python benchmarks/bench_throughput.py --tk real    # real Tk
+    python benchmarks/bench_throughput.py --compare old.json    # regressions
+
+Writes machine-readable results (default: bench_throughput.json).
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import tk_stub  # noqa: E402  (same directory)
+
+
+# ==================================================
+# Synthetic data
+# ==================================================
+def make_trade(i, now=None):
+    from api.trade_decoder import Trade
+
+    now = time.time() if now is None else now
+    ms = int(now * 1000)
+    return Trade(
+        65_000 + (i % 400) * 0.5,
+        0.001 * (1 + i % 50),
+        "sell" if i & 1 else "buy",
+        now,
+        i,
+        ms,
+        ms,
+        now,
+    )
+
+
+def fake_klines_range(symbol, interval, start, end):
+    """
+    Offline replacement for api.binance_rest.get_klines_range
+    """
+    from api.binance_rest import interval_to_ms
+
+    step = interval_to_ms(interval)
+    return [
+        [t, "65000", "65100", "64900", "65050", "12.5", t + step - 1]
+        for t in range(int(start), int(end) + 1, step)
+    ]
+
+
+class SyntheticFeed:
+    """
+    BinanceWebSocket-like source emitting trades at a fixed rate
+    """
+
+    def __init__(self, rate, duration):
+        self.rate = rate
+        self.duration = duration
+        self.on_trade = None
+        self.sent = 0
+        self._running = False
+
+    def start(self):
+        self._running = True
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def stop(self):
+        self._running = False
+
+    def _run(self):
+        start = time.perf_counter()
+        i = 0
+        while self._running:
+            elapsed = time.perf_counter() - start
+            if elapsed >= self.duration:
+                break
+
+            due = int(elapsed * self.rate)
+            now = time.time()
+            while i < due:
+                self.on_trade(make_trade(i, now))
+                i += 1
+            self.sent = i
+
+            time.sleep(0.001)
+
+        self._running = False
+
+
+# ==================================================
+# Setup
+# ==================================================
+def make_root(mode):
+    if mode == "stub":
+        root = tk_stub.StubRoot()
+        return root, root.run_for
+
+    import customtkinter as ctk
+    root = ctk.CTk()
+    root.geometry("1400x700")
+
+    def run_for(seconds):
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            root.update()
+            time.sleep(0.0005)
+
+    return root, run_for
+
+
+def build_market(root, fps, feed=None, chart_limit=500):
+    from controllers.market_controller import MarketController
+    from controllers.ui_dispatcher import UIDispatcher
+    from ui.panels.realtime_chart_panel import RealtimeChartPanel
+    from ui.widgets.price_widget import PriceWidget
+    from ui.widgets.recent_trade_widget import RecentTradeWidget
+
+    dispatcher = UIDispatcher(root, max_fps=fps)
+    market = MarketController("BTCUSDT", dispatcher=dispatcher, feed=feed or SyntheticFeed(0, 0))
+    market.apply_snapshot({
+        "lastPrice": "65000",
+        "priceChange": "120.5",
+        "priceChangePercent": "0.19",
+        "highPrice": "66000",
+        "lowPrice": "64000",
+        "quoteVolume": "1234567890",
+    })
+
+    widgets = {
+        "PriceWidget": PriceWidget(root, market),
+        "RecentTradeWidget": RecentTradeWidget(root, market),
+        "RealtimeChartPanel": RealtimeChartPanel(
+            root, controller=market, interval="1m", limit=chart_limit
+        ),
+    }
+    for w in widgets.values():
+        if hasattr(w, "pack"):
+            w.pack(fill="both", expand=True)
+
+    return dispatcher, market, widgets
+
+
+# ==================================================
+# Benchmarks
+# ==================================================
+def bench_stream(mode, rate, duration, fps):
+    from controllers.latency import latency
+
+    root, run_for = make_root(mode)
+    feed = SyntheticFeed(rate, duration)
+    dispatcher, market, _ = build_market(root, fps, feed)
+
+    run_for(0.3)  # settle initial draw
+    latency.reset()
+    dispatcher.start()
+
+    frames0, dropped0 = dispatcher.frames, dispatcher.dropped_frames
+    cpu0 = time.process_time()
+    wall0 = time.perf_counter()
+
+    market.start_realtime()
+    run_for(duration)
+    market.stop()
+
+    wall = time.perf_counter() - wall0
+    cpu = time.process_time() - cpu0
+    dispatcher.stop()
+
+    e2e = latency.histograms["end_to_end"].snapshot()
+    trades = feed.sent
+
+    if mode == "real":
+        root.destroy()
+
+    return {
+        "target_rate": rate,
+        "trades": trades,
+        "sustained_rate": trades / wall,
+        "cpu_us_per_trade": cpu / trades * 1e6 if trades else None,
+        "frames": dispatcher.frames - frames0,
+        "dropped_frames": dispatcher.dropped_frames - dropped0,
+        "end_to_end_p50_ms": e2e["p50_ms"],
+        "end_to_end_p99_ms": e2e["p99_ms"],
+    }
+
+
+def bench_calls(mode, fps):
+    """
+    Per-call cost (us) of each hot-path function in isolation
+    """
+    root, _ = make_root(mode)
+    dispatcher, market, widgets = build_market(root, fps)
+
+    def per_call(fn, n):
+        t0 = time.perf_counter()
+        for _ in range(n):
+            fn()
+        return (time.perf_counter() - t0) / n * 1e6
+
+    trades = [make_trade(i) for i in range(20_000)]
+    it = iter(trades)
+
+    def apply_batch(n=100):
+        market._inbox.extend(make_trade(i) for i in range(n))
+        market._apply_batch()
+
+    results = {
+        "MarketController._on_trade": per_call(lambda: market._on_trade(next(it)), 20_000),
+        "MarketController._apply_batch(100)": per_call(apply_batch, 200),
+        "MarketController._notify": per_call(market._notify, 20_000),
+        "MarketController._dispatch": per_call(market._dispatch, 200),
+    }
+    for name, widget in widgets.items():
+        n = 20 if name == "RealtimeChartPanel" else 2_000
+        results[f"{name}.on_market_update"] = per_call(widget.on_market_update, n)
+
+    market.stop()
+    if mode == "real":
+        root.destroy()
+
+    return results
+
+
+# ==================================================
+# Results
+# ==================================================
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+def compare(current, baseline_path, tolerance):
+    """
+    Print deltas vs a previous results file; True if something regressed
+    """
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressed = False
+    print(f"\nvs {baseline_path} ({baseline.get('revision')})")
+
+    old_stream = {r["target_rate"]: r for r in baseline["stream"]}
+    for r in current["stream"]:
+        old = old_stream.get(r["target_rate"])
+        if not old or not old["cpu_us_per_trade"] or not r["cpu_us_per_trade"]:
+            continue
+        delta = r["cpu_us_per_trade"] / old["cpu_us_per_trade"] - 1
+        flag = "REGRESSION" if delta > tolerance else ""
+        regressed |= bool(flag)
+        print(f"  {r['target_rate']:>6}/s cpu/trade {delta:+7.1%} {flag}")
+
+    for name, us in current["calls"].items():
+        old = baseline["calls"].get(name)
+        if not old:
+            continue
+        delta = us / old - 1
+        flag = "REGRESSION" if delta > tolerance else ""
+        regressed |= bool(flag)
+        print(f"  {name:<40} {delta:+7.1%} {flag}")
+
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rates", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--tk", choices=["auto", "stub", "real"], default="auto")
+    parser.add_argument("--output", default="bench_throughput.json")
+    parser.add_argument("--compare", metavar="BASELINE_JSON")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args()
+
+    mode = args.tk
+    if mode == "auto":
+        has_display = os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin")
+        mode = "real" if has_display else "stub"
+    if mode == "stub":
+        tk_stub.install()
+
+    # offline history for the chart panel
+    import api.kline_cache as kline_cache
+    kline_cache.get_klines_range = fake_klines_range
+    kline_cache._cache = kline_cache.KlineCache(":memory:")
+
+    print(f"[Bench] Tk mode: {mode}")
+
+    stream = []
+    for rate in args.rates:
+        r = bench_stream(mode, rate, args.duration, args.fps)
+        stream.append(r)
+        print(
+            f"  {rate:>6}/s -> {r['sustained_rate']:>8.0f}/s sustained | "
+            f"{r['cpu_us_per_trade'] or 0:>6.1f} us cpu/trade | "
+            f"{r['frames']:>4} frames, {r['dropped_frames']:>3} dropped | "
+            f"e2e p99 {r['end_to_end_p99_ms']:.1f} ms"
+        )
+
+    calls = bench_calls(mode, args.fps)
+    for name, us in calls.items():
+        print(f"  {name:<40} {us:>10.1f} us/call")
+
+    results = {
+        "revision": git_revision(),
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "tk_mode": mode,
+        "duration": args.duration,
+        "fps": args.fps,
+        "stream": stream,
+        "calls": calls,
+    }
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"[Bench] results -> {args.output}")
+
+    if args.compare and compare(results, args.compare, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# benchmarks/tk_stub.py
+"""
+Minimal stand-ins for Tk so widget code can be benchmarked headless
+
+install() must run BEFORE any ui.* import. Widget calls become no-ops,
+so results measure the Python-side cost of the update path (not Tk's
+own drawing). For real Tk numbers run under a (virtual) display:
+    xvfb-run python benchmarks/bench_throughput.py --tk real
+"""
+
+import heapq
+import itertools
+import sys
+import time
+import types
+
+
+class StubWidget:
+    """
+    Accepts any constructor args / method calls, remembers configure()
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._options = dict(kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _noop
+
+    def configure(self, **kwargs):
+        self._options.update(kwargs)
+
+    config = configure
+
+    def cget(self, key):
+        return self._options.get(key)
+
+    def winfo_exists(self):
+        return True
+
+    def winfo_viewable(self):
+        return True
+
+    def winfo_width(self):
+        return 1200
+
+    def winfo_height(self):
+        return 500
+
+
+def _noop(*args, **kwargs):
+    return None
+
+
+class StubRoot(StubWidget):
+    """
+    after() / after_idle() scheduler driven by run_for()
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._queue = []
+        self._seq = itertools.count()
+        self._cancelled = set()
+
+    def after(self, ms, func=None, *args):
+        due = time.perf_counter() + ms / 1000
+        job = next(self._seq)
+        heapq.heappush(self._queue, (due, job, func, args))
+        return job
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+    def after_cancel(self, job):
+        self._cancelled.add(job)
+
+    def run_for(self, seconds):
+        end = time.perf_counter() + seconds
+        while True:
+            now = time.perf_counter()
+            if now >= end:
+                return
+            if not self._queue or self._queue[0][0] > now:
+                wait = (self._queue[0][0] if self._queue else end) - now
+                time.sleep(max(0.0, min(wait, end - now)))
+                continue
+
+            _, job, func, args = heapq.heappop(self._queue)
+            if job in self._cancelled:
+                self._cancelled.discard(job)
+                continue
+            func(*args)
+
+
+def install():
+    """
+    Replace customtkinter and the TkAgg canvas with headless stubs
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+
+    ctk = types.ModuleType("customtkinter")
+    for name in (
+        "CTk", "CTkFrame", "CTkLabel", "CTkButton", "CTkFont",
+        "CTkProgressBar", "CTkSegmentedButton", "CTkEntry",
+        "CTkScrollbar", "CTkCanvas", "CTkOptionMenu",
+    ):
+        setattr(ctk, name, type(name, (StubWidget,), {}))
+    sys.modules["customtkinter"] = ctk
+
+    from matplotlib.backends import backend_tkagg
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    class StubCanvas(FigureCanvasAgg):
+        def __init__(self, figure, master=None):
+            super().__init__(figure)
+
+        def get_tk_widget(self):
+            return StubWidget()
+
+    backend_tkagg.FigureCanvasTkAgg = StubCanvas
@@ -1,13 +1,120 @@
 # config/config.py
 
+import os
+
 # -------------------------
 # App
 # -------------------------
 APP_TITLE = "Crypto Dashboard"
 WINDOW_SIZE = "1600x600"
 
-KLINE_INTERVAL = "1m"
-MAX_RECENT_TRADES = 10
+# sidebar assets (quoted in USDT), streamed over ONE shared websocket
+WATCHLIST = ["BTC", "ETH", "SOL", "BNB", "XRP"]
+
+# live markets (controller + built view) kept warm, LRU evicted
+MARKET_POOL_SIZE = 5
+# stream the first MARKET_POOL_SIZE WATCHLIST symbols from startup, so
+# the first switch to them is warm (False: only once viewed)
+MARKET_POOL_PREFILL = True
+
+KLINE_INTERVAL = "1m"     # chart timeframe on open
+CHART_INTERVALS = ["1m", "5m", "15m", "1h", "4h", "1d"]  # chart switcher
+MAX_RECENT_TRADES = 50    # trade tape depth (rows kept / rendered)
+ORDER_BOOK_LEVELS = 12    # price levels per side shown in the order book
+
+# market overview: all-market mini-tickers, pairs quoted in this asset
+OVERVIEW_QUOTE = "USDT"
+
+# chart indicators: (name, *params), see controllers/indicators.py
+# sma / ema / bb / vwap are drawn on the price axis, rsi / macd get a pane
+CHART_INDICATORS = [
+    ("ema", 20),
+    ("sma", 50),
+    ("bb", 20, 2.0),
+    ("vwap",),
+    ("rsi", 14),
+    ("macd", 12, 26, 9),
+]
+
+# redraw only the moving chart artists over a cached background
+CHART_BLIT = True
+
+# chart zoom / pan over deep history
+CHART_VIEW_CANDLES = 120      # candles in view on open (double-click resets)
+CHART_MAX_CANDLES = 100_000   # history kept in memory per chart
+CHART_PAGE_SIZE = 1000        # older candles fetched per page while panning
+CHART_LOD_PX = 3              # min pixels per bar, coarser -> aggregated bars
+
+# chart candles follow <symbol>@kline_<interval>: exchange values win over
+# the locally aggregated ones, closed klines go straight to the kline cache
+CHART_KLINE_STREAM = True
+CHART_KLINE_GRACE = 2.0       # seconds a new candle waits for the exchange close
+CHART_KLINE_SILENT = 10.0     # seconds without a kline -> stop keeping replay trades
+
+# max UI refresh rate for realtime listeners (frames / second)
+UI_MAX_FPS = 30
+
+
+# -------------------------
+# Network
+# -------------------------
+BINANCE_WS_URL = "wss://stream.binance.com:9443"
+
+# realtime price feed per symbol (api/trade_decoder.py STREAM_TYPES)
+# "aggTrade"   : one row per taker order & price level (sweeps collapse)
+# "trade"      : one message per fill
+# "bookTicker" : best bid / ask, mid price ticks (no volume, no tape)
+# "kline"      : <symbol>@kline_<KLINE_INTERVAL> close ticks (no volume)
+STREAM_TYPE = "aggTrade"
+
+# "threads" : websocket-client thread + REST worker threads
+# "asyncio" : ONE event loop thread for every stream + bounded REST
+#             executor (api/async_core.py, needs websockets from
+#             requirements.txt)
+NETWORK_BACKEND = "threads"
+ASYNC_REST_WORKERS = 4    # REST calls in flight at once (asyncio backend)
+
+# "inline"  : streams, decoding, order book in the Tk process
+# "process" : a worker process owns them, the UI reads shared memory
+#             once per frame (controllers/market_engine.py)
+MARKET_ENGINE = "inline"
+ENGINE_TRADE_RING = 65_536  # trades per symbol the UI may fall behind
+ENGINE_PUBLISH_HZ = 120     # engine publish cycles per second
+
+# websocket reconnect: exponential backoff with jitter + stall detection
+WS_BACKOFF_BASE = 0.5     # seconds, first retry delay (doubles per failure)
+WS_BACKOFF_MAX = 30       # seconds, delay cap
+WS_STALL_TIMEOUT = 30     # seconds without any message -> reconnect (0 = off)
+
+# missed trades after a reconnect: "aggTrades" or "historicalTrades"
+BACKFILL_SOURCE = "aggTrades"
+BACKFILL_MAX_TRADES = 20_000   # per symbol, longer outages stay partial
+BACKFILL_TIMEOUT = 10          # seconds live messages wait for backfill
+
+HTTP_RETRIES = 3          # REST retries on connection errors / 429 / 5xx
+HTTP_BACKOFF = 0.5        # seconds, doubled on every retry
+HTTP_POOL_SIZE = 10       # keep-alive connections per host
+
+SNAPSHOT_REFRESH_INTERVAL = 30  # seconds, batched 24h ticker refresh
+
+# /api/v3/depth snapshot size used to (re)sync the local order book
+ORDER_BOOK_SNAPSHOT_LIMIT = 1000
+
+# websocket JSON decoder: "auto" (orjson -> msgspec -> json) or a name
+JSON_DECODER = "auto"
+
+# local persistent data (kline cache, ...)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".crypto_dashboard")
+KLINE_CACHE_PATH = os.path.join(CACHE_DIR, "klines.sqlite3")
+TICKER_CACHE_PATH = os.path.join(CACHE_DIR, "tickers.json")  # last-known 24h tickers
+
+
+# -------------------------
+# Diagnostics
+# -------------------------
+LATENCY_TRACKING = False  # stage histograms from startup (else only while F12 is open)
+LATENCY_EXPORT_PATH = os.path.join(CACHE_DIR, "latency.json")
+STARTUP_REPORT = True     # [Startup] import / first paint / first price timings
 
 
 # -------------------------
@@ -0,0 +1,334 @@
+# controllers/candle_aggregator.py
+
+import threading
+import time
+
+from api.binance_rest import interval_to_ms
+from config.config import CHART_KLINE_GRACE, CHART_KLINE_SILENT
+
+LOCAL_CLOSES = 4  # locally closed candles a late final kline may still fix
+
+
+class Candle:
+    """
+    Mutable OHLCV bucket (open_time in epoch ms)
+
+    final: values are the exchange's final kline (not local trades)
+    """
+
+    __slots__ = ("open_time", "open", "high", "low", "close", "volume", "final")
+
+    def __init__(self, open_time, open, high, low, close, volume=0.0,
+                 final=False):
+        self.open_time = open_time
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.final = final
+
+    def copy(self):
+        return Candle(
+            self.open_time,
+            self.open,
+            self.high,
+            self.low,
+            self.close,
+            self.volume,
+            self.final,
+        )
+
+
+class CandleAggregator:
+    """
+    Incremental trade -> OHLCV aggregator for ONE interval
+
+    - add_trades() folds a batch of trades (oldest first) under one
+      lock, safe from any thread
+    - rolls over to a new candle at bucket boundaries
+    - drain() hands closed candles + the live candle to the UI thread
+    - follow_klines(): exchange klines (apply_kline) override the local
+      candle; local trades newer than a kline are replayed on top and a
+      candle only closes with the exchange's final kline (or after
+      CHART_KLINE_GRACE without one; a final kline arriving later still
+      replaces that candle, see drain_revised())
+    """
+
+    def __init__(self, interval: str):
+        self.interval = interval
+        self.interval_ms = interval_to_ms(interval)
+
+        self._current: Candle | None = None
+        self._closed = []
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        # ---- exchange kline sync (follow_klines) ----
+        self._klines = False
+        self._by_id = True
+        self._grace_ms = int(CHART_KLINE_GRACE * 1000)
+        self._synced_id = None     # last trade id included by the last kline
+        self._since_sync = []      # trades folded after it (replayed on a kline)
+        self._held = []            # newer-bucket trades waiting for the close
+        self._final_through = -1   # open time of the last final candle
+        self._local_closes = []    # open times closed without a final kline
+        self._revised = []         # closed candles replaced by a late final kline
+        self._silent_s = CHART_KLINE_SILENT
+        self._kline_at = 0.0       # monotonic time of the last kline
+
+    # ==================================================
+    # Input
+    # ==================================================
+    def seed(self, open_time, open, high, low, close, volume):
+        """
+        Continue from the last (possibly still open) history candle
+        """
+        with self._lock:
+            self._current = Candle(open_time, open, high, low, close, volume)
+            self._closed.clear()
+            self._dirty = False
+
+            self._synced_id = None
+            self._since_sync = []
+            self._held = []
+            self._final_through = -1
+            self._local_closes = []
+            self._revised = []
+
+    def follow_klines(self, by_id: bool = True):
+        """
+        Treat apply_kline() as the truth from now on
+
+        by_id: trades carry exchange trade ids (trade / aggTrade feeds),
+        so trades a kline already includes are not counted twice
+        """
+        with self._lock:
+            self._klines = True
+            self._by_id = by_id
+            self._kline_at = time.monotonic()
+
+    def add_trades(self, trades):
+        """
+        Batch of Trade records (oldest first); late trades for an
+        already closed bucket are ignored
+        """
+        if self._klines:
+            with self._lock:
+                if time.monotonic() - self._kline_at > self._silent_s:
+                    changed = self._unsync()
+                else:
+                    changed = False
+                for t in trades:
+                    changed |= self._fold(t)
+                if changed:
+                    self._dirty = True
+            return
+
+        step = self.interval_ms
+
+        with self._lock:
+            cur = self._current
+            changed = False
+
+            for t in trades:
+                ts_ms = t.trade_time
+                bucket = ts_ms - ts_ms % step
+                price = t.price
+
+                if cur is None or bucket > cur.open_time:
+                    if cur is not None:
+                        self._closed.append(cur)
+                    cur = Candle(bucket, price, price, price, price, t.qty)
+
+                elif bucket == cur.open_time:
+                    if price > cur.high:
+                        cur.high = price
+                    elif price < cur.low:
+                        cur.low = price
+                    cur.close = price
+                    cur.volume += t.qty
+
+                else:
+                    # late trade for an already closed bucket -> ignore
+                    continue
+
+                changed = True
+
+            if changed:
+                self._current = cur
+                self._dirty = True
+
+    def apply_kline(self, open_time, open, high, low, close, volume,
+                    closed: bool, last_id: int | None = None):
+        """
+        Exchange kline (<symbol>@kline_<interval>), any thread
+
+        last_id: last trade id the kline includes (L)
+        """
+        with self._lock:
+            self._kline_at = time.monotonic()
+
+            if open_time <= self._final_through:
+                if closed and open_time in self._local_closes:
+                    # late final kline of a candle closed locally
+                    self._local_closes.remove(open_time)
+                    self._revise(
+                        Candle(open_time, open, high, low, close, volume, True)
+                    )
+                return
+
+            cur = self._current
+            if cur is not None and open_time < cur.open_time:
+                return
+
+            replay = []
+            if cur is not None and open_time > cur.open_time:
+                # final kline of `cur` not here yet -> local values for now
+                self._close_local(cur)
+            elif cur is not None:
+                replay = self._since_sync
+
+            held = self._held
+            self._held = []
+            self._since_sync = []
+
+            candle = Candle(open_time, open, high, low, close, volume, closed)
+            if closed:
+                # final: later local trades of this bucket are already in it
+                self._closed.append(candle)
+                self._final_through = open_time
+                self._current = None
+                self._synced_id = None
+            else:
+                self._current = candle
+                self._synced_id = last_id if self._by_id else None
+                for t in replay:
+                    self._fold(t)
+
+            for t in held:
+                self._fold(t)
+
+            self._dirty = True
+
+    def _fold(self, t) -> bool:
+        """
+        One trade in kline-sync mode (lock held); True if it changed state
+        """
+        ts_ms = t.trade_time
+        bucket = ts_ms - ts_ms % self.interval_ms
+        if bucket <= self._final_through:
+            return False
+
+        price = t.price
+        cur = self._current
+
+        if cur is None:
+            self._current = Candle(bucket, price, price, price, price, t.qty)
+            self._synced_id = None
+            self._since_sync = [t] if self._by_id else []
+            return True
+
+        if bucket == cur.open_time:
+            synced = self._synced_id
+            if synced is not None and t.trade_id <= synced:
+                # already counted by the last kline
+                return False
+            if price > cur.high:
+                cur.high = price
+            elif price < cur.low:
+                cur.low = price
+            cur.close = price
+            cur.volume += t.qty
+            if self._by_id:
+                self._since_sync.append(t)
+            return True
+
+        if bucket < cur.open_time:
+            return False
+
+        # newer bucket: wait for the exchange to close `cur` first
+        if ts_ms < cur.open_time + self.interval_ms + self._grace_ms:
+            self._held.append(t)
+            return False
+
+        # no final kline in time -> close with local values
+        self._close_local(cur)
+        self._current = None
+        held = self._held
+        self._held = []
+        for h in held:
+            self._fold(h)
+        self._fold(t)
+        return True
+
+    def _close_local(self, candle):
+        """
+        Close without the exchange's final kline (lock held)
+        """
+        self._closed.append(candle)
+        self._final_through = candle.open_time
+        self._local_closes.append(candle.open_time)
+        del self._local_closes[:-LOCAL_CLOSES]
+
+    def _revise(self, candle):
+        """
+        Exchange values for an already closed candle (lock held)
+        """
+        for i, c in enumerate(self._closed):
+            if c.open_time == candle.open_time:
+                # not drained yet -> just swap it
+                self._closed[i] = candle
+                break
+        else:
+            self._revised.append(candle)
+        self._dirty = True
+
+    def _unsync(self) -> bool:
+        """
+        No kline for CHART_KLINE_SILENT: stop keeping trades for a replay
+        and close a candle waiting for its final kline (lock held)
+        """
+        self._synced_id = None
+        self._since_sync = []
+        if not self._held:
+            return False
+
+        held = self._held
+        self._held = []
+        self._close_local(self._current)
+        self._current = None
+        for t in held:
+            self._fold(t)
+        return True
+
+    # ==================================================
+    # Output (UI thread)
+    # ==================================================
+    def drain(self):
+        """
+        Returns (closed_candles, live_candle)
+
+        closed_candles : candles finalized since the last drain
+        live_candle    : copy of the current candle, or None if
+                         nothing changed since the last drain
+        """
+        with self._lock:
+            if not self._dirty:
+                return [], None
+
+            closed = self._closed
+            self._closed = []
+            self._dirty = False
+            live = self._current.copy() if self._current else None
+
+        return closed, live
+
+    def drain_revised(self):
+        """
+        Closed candles already drained that a late final kline replaced
+        """
+        with self._lock:
+            revised = self._revised
+            self._revised = []
+        return revised
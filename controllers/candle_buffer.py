@@ -0,0 +1,254 @@
+# controllers/candle_buffer.py
+
+import numpy as np
+
+
+MS_PER_DAY = 86_400_000
+
+
+def ms_to_datenum(ms):
+    """
+    epoch ms -> matplotlib date number (default epoch 1970-01-01 UTC)
+    """
+    return np.asarray(ms, dtype=np.float64) / MS_PER_DAY
+
+
+def klines_to_columns(klines) -> dict:
+    """
+    REST-style rows [open_time, o, h, l, c, v, ...] -> CandleBuffer columns
+    """
+    raw = np.array([k[:6] for k in klines], dtype=np.float64).reshape(-1, 6)
+    open_time = raw[:, 0].astype(np.int64)
+
+    return {
+        "open_time": open_time,
+        "x": ms_to_datenum(open_time),
+        "open": raw[:, 1],
+        "high": raw[:, 2],
+        "low": raw[:, 3],
+        "close": raw[:, 4],
+        "volume": raw[:, 5],
+    }
+
+
+class ColumnarRingBuffer:
+    """
+    Fixed-capacity columnar buffer on NumPy
+
+    - one typed array per column (no boxed Python floats)
+    - append / update_last are O(1) (amortized)
+    - column(name) returns a contiguous zero-copy view of the
+      last `capacity` rows, oldest first
+
+    Storage is 2 x capacity: rows are appended at the end and the
+    live window is copied back to the front only when the end is
+    reached, so views never wrap.
+    """
+
+    def __init__(self, capacity: int, columns: dict):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+
+        self.capacity = capacity
+        self.columns = tuple(columns)
+
+        self._data = {
+            name: np.zeros(2 * capacity, dtype=dtype)
+            for name, dtype in columns.items()
+        }
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    # ==================================================
+    # Write
+    # ==================================================
+    def clear(self):
+        self._start = 0
+        self._end = 0
+
+    def append(self, *values):
+        """
+        Append one row (values in column order)
+        """
+        if self._end == len(self._data[self.columns[0]]):
+            self._compact()
+
+        i = self._end
+        for name, value in zip(self.columns, values):
+            self._data[name][i] = value
+
+        self._end += 1
+        if self._end - self._start > self.capacity:
+            self._start += 1
+
+    def update_last(self, *values):
+        """
+        Overwrite the newest row (values in column order)
+        """
+        if self._end == self._start:
+            raise IndexError("update_last on empty buffer")
+
+        i = self._end - 1
+        for name, value in zip(self.columns, values):
+            self._data[name][i] = value
+
+    def extend(self, **arrays):
+        """
+        Bulk load (vectorized): keeps the newest `capacity` rows
+        """
+        n = len(arrays[self.columns[0]])
+        if n == 0:
+            return
+
+        keep = min(n, self.capacity)
+        if self._end + keep > len(self._data[self.columns[0]]):
+            self._compact(room=keep)
+
+        i = self._end
+        for name in self.columns:
+            self._data[name][i:i + keep] = np.asarray(arrays[name])[n - keep:]
+
+        self._end += keep
+        if self._end - self._start > self.capacity:
+            self._start = self._end - self.capacity
+
+    def prepend(self, **arrays):
+        """
+        Bulk load OLDER rows in front (vectorized)
+
+        Total stays <= capacity: the oldest extra rows are dropped.
+        Returns the number of rows added.
+        """
+        n = len(arrays[self.columns[0]])
+        keep = min(n, self.capacity - len(self))
+        if keep <= 0:
+            return 0
+
+        if self._start < keep:
+            # shift the window right to make room in front
+            size = len(self)
+            for arr in self._data.values():
+                arr[keep:keep + size] = arr[self._start:self._end]
+            self._start = keep
+            self._end = keep + size
+
+        i = self._start - keep
+        for name in self.columns:
+            self._data[name][i:self._start] = np.asarray(arrays[name])[n - keep:]
+
+        self._start = i
+        return keep
+
+    def _compact(self, room=1):
+        """
+        Move the live window to the front, leaving space for `room` rows
+        """
+        n = max(0, min(len(self), self.capacity - room))
+        src = self._end - n
+
+        for arr in self._data.values():
+            arr[:n] = arr[src:self._end]
+
+        self._start = 0
+        self._end = n
+
+    # ==================================================
+    # Read (zero-copy)
+    # ==================================================
+    def column(self, name: str) -> np.ndarray:
+        return self._data[name][self._start:self._end]
+
+    def last(self, name: str):
+        if self._end == self._start:
+            return None
+        return self._data[name][self._end - 1]
+
+
+class CandleBuffer(ColumnarRingBuffer):
+    """
+    OHLCV candles: epoch-ms open_time + precomputed matplotlib x
+    """
+
+    COLUMNS = {
+        "open_time": np.int64,
+        "x": np.float64,       # date number, computed once on append
+        "open": np.float64,
+        "high": np.float64,
+        "low": np.float64,
+        "close": np.float64,
+        "volume": np.float64,
+    }
+
+    def __init__(self, capacity: int):
+        super().__init__(capacity, self.COLUMNS)
+
+    def append_candle(self, open_time, o, h, l, c, v):
+        self.append(open_time, open_time / MS_PER_DAY, o, h, l, c, v)
+
+    def update_last_candle(self, o, h, l, c, v):
+        i = self._end - 1
+        if i < self._start:
+            raise IndexError("update_last_candle on empty buffer")
+
+        d = self._data
+        d["open"][i] = o
+        d["high"][i] = h
+        d["low"][i] = l
+        d["close"][i] = c
+        d["volume"][i] = v
+
+    def load_klines(self, klines):
+        """
+        REST-style rows [open_time, o, h, l, c, v, ...] -> buffer
+        """
+        self.clear()
+        if not klines:
+            return
+
+        self.extend(**klines_to_columns(klines))
+
+    def prepend_klines(self, klines) -> int:
+        """
+        Older REST-style rows -> front of the buffer (overlap skipped)
+        """
+        if not klines:
+            return 0
+
+        cols = klines_to_columns(klines)
+        if len(self):
+            older = cols["open_time"] < self.open_time[0]
+            cols = {name: col[older] for name, col in cols.items()}
+
+        return self.prepend(**cols)
+
+    # column shortcuts (views)
+    @property
+    def open_time(self):
+        return self.column("open_time")
+
+    @property
+    def x(self):
+        return self.column("x")
+
+    @property
+    def open(self):
+        return self.column("open")
+
+    @property
+    def high(self):
+        return self.column("high")
+
+    @property
+    def low(self):
+        return self.column("low")
+
+    @property
+    def close(self):
+        return self.column("close")
+
+    @property
+    def volume(self):
+        return self.column("volume")
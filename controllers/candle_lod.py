@@ -0,0 +1,76 @@
+# controllers/candle_lod.py
+"""
+Level of detail for deep chart history
+
+When more candles are in view than the chart has pixels for, they are
+re-aggregated into higher-timeframe bars (OHLCV of every bucket) so
+the number of drawn bars is bounded by the screen width, not by the
+history length. Buckets are aligned on open_time (like exchange klines),
+so a bar does not change while the view pans.
+"""
+
+import numpy as np
+
+from api.binance_rest import INTERVAL_MS
+
+
+# bucket sizes tried in order, coarser than 1w -> whole weeks
+_LADDER = sorted(INTERVAL_MS.items(), key=lambda item: item[1])
+_WEEK_MS = INTERVAL_MS["1w"]
+
+
+def lod_bucket(step_ms: int, count: int, max_bars: int):
+    """
+    (label, bucket ms) so that `count` candles of step_ms fit max_bars
+
+    Returns (None, step_ms) when no aggregation is needed.
+    """
+    if count <= max_bars:
+        return None, step_ms
+
+    needed = step_ms * count / max(1, max_bars)
+    for label, ms in _LADDER:
+        if ms >= needed and ms % step_ms == 0 and ms > step_ms:
+            return label, ms
+
+    weeks = int(np.ceil(needed / _WEEK_MS))
+    return f"{weeks}w", weeks * _WEEK_MS
+
+
+def bucket_starts(open_time, bucket_ms: int) -> np.ndarray:
+    """
+    Index of the first candle of every bucket (open_time sorted)
+    """
+    ids = np.asarray(open_time) // bucket_ms
+    if not len(ids):
+        return np.empty(0, dtype=np.intp)
+    return np.concatenate(([0], np.flatnonzero(np.diff(ids)) + 1))
+
+
+def aggregate(open_time, open, high, low, close, volume, starts):
+    """
+    OHLCV per bucket (vectorized reduceat)
+
+    Returns dict: open_time (first candle), count, open, high, low,
+    close, volume
+    """
+    n = len(open_time)
+    ends = np.append(starts[1:], n) - 1
+
+    return {
+        "open_time": np.asarray(open_time)[starts],
+        "count": ends - starts + 1,
+        "open": np.asarray(open)[starts],
+        "high": np.maximum.reduceat(high, starts),
+        "low": np.minimum.reduceat(low, starts),
+        "close": np.asarray(close)[ends],
+        "volume": np.add.reduceat(volume, starts),
+    }
+
+
+def sample_last(values, starts) -> np.ndarray:
+    """
+    Value at the end of every bucket (indicator lines at bar close)
+    """
+    ends = np.append(starts[1:], len(values)) - 1
+    return np.asarray(values)[ends]
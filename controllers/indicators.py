@@ -0,0 +1,484 @@
+# controllers/indicators.py
+"""
+Incremental technical indicators
+
+Every indicator keeps a small COMMITTED state built from closed
+candles only:
+    value(candle)  -> values for the live (still open) candle, O(1),
+                      state untouched (called on every tick)
+    commit(candle) -> fold a closed candle into the state, O(1)
+    seed(df)       -> full series for the history (vectorized pandas)
+                      + state as of the second-to-last candle (the
+                      last history candle is the live one; the engine
+                      commits it when it is closed already)
+
+Incremental and vectorized paths use the same recurrences, so live
+values continue the history series exactly.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+
+import numpy as np
+
+from controllers.candle_aggregator import Candle
+
+NAN = float("nan")
+MS_PER_DAY = 86_400_000
+
+
+class Indicator(ABC):
+    """
+    Base class: lines = output names, pane = "price" or an own pane
+    """
+
+    lines = ()
+    pane = "price"
+    warmup = 0  # extra history candles for a settled first value
+
+    @abstractmethod
+    def seed(self, df) -> dict:
+        """
+        Full series for the history + committed state
+        """
+
+    @abstractmethod
+    def value(self, candle) -> tuple:
+        """
+        Values for the live candle (state untouched)
+        """
+
+    @abstractmethod
+    def commit(self, candle):
+        """
+        Fold a closed candle into the state
+        """
+
+
+def _check_period(period, minimum=2):
+    if int(period) != period or period < minimum:
+        raise ValueError(f"Indicator period must be an integer >= {minimum}")
+    return int(period)
+
+
+# ==================================================
+# Building blocks
+# ==================================================
+class _Window:
+    """
+    Last n-1 committed values + running sum / sum of squares
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.values = deque()
+        self.sum = 0.0
+        self.sumsq = 0.0
+
+    def reset(self, values=()):
+        self.values = deque(float(v) for v in values)
+        self.sum = math.fsum(self.values)
+        self.sumsq = math.fsum(v * v for v in self.values)
+
+    @property
+    def full(self):
+        return len(self.values) == self.size
+
+    def push(self, x):
+        if len(self.values) == self.size:
+            old = self.values.popleft()
+            self.sum -= old
+            self.sumsq -= old * old
+        self.values.append(x)
+        self.sum += x
+        self.sumsq += x * x
+
+
+class _Ema:
+    """
+    y = y + alpha * (x - y), starting at the first x
+    (pandas ewm(adjust=False))
+    """
+
+    def __init__(self, alpha):
+        self.alpha = alpha
+        self.value = None
+        self.count = 0
+
+    def peek(self, x):
+        if self.value is None:
+            return x
+        return self.value + self.alpha * (x - self.value)
+
+    def push(self, x):
+        self.value = self.peek(x)
+        self.count += 1
+
+
+# ==================================================
+# Price overlays
+# ==================================================
+class SMA(Indicator):
+    def __init__(self, period=20):
+        self.period = _check_period(period)
+        self.lines = (f"sma{self.period}",)
+        self.warmup = self.period - 1
+        self._window = _Window(self.period - 1)
+
+    def seed(self, df):
+        n = self.period
+        close = df["close"]
+        self._window.reset(close.iloc[-n:-1])
+        return {self.lines[0]: close.rolling(n).mean().to_numpy()}
+
+    def value(self, candle):
+        w = self._window
+        if not w.full:
+            return (NAN,)
+        return ((w.sum + candle.close) / self.period,)
+
+    def commit(self, candle):
+        self._window.push(candle.close)
+
+
+class EMA(Indicator):
+    def __init__(self, period=20):
+        self.period = _check_period(period)
+        self.lines = (f"ema{self.period}",)
+        self.warmup = 2 * self.period
+        self._ema = _Ema(2 / (self.period + 1))
+
+    def seed(self, df):
+        close = df["close"]
+        series = close.ewm(span=self.period, adjust=False).mean().to_numpy()
+
+        self._ema.value = float(series[-2]) if len(series) > 1 else None
+        self._ema.count = max(0, len(series) - 1)
+
+        series[:self.period - 1] = NAN
+        return {self.lines[0]: series}
+
+    def value(self, candle):
+        if self._ema.count + 1 < self.period:
+            return (NAN,)
+        return (self._ema.peek(candle.close),)
+
+    def commit(self, candle):
+        self._ema.push(candle.close)
+
+
+class VWAP(Indicator):
+    """
+    Session VWAP on typical price, reset at 00:00 UTC
+    """
+
+    lines = ("vwap",)
+
+    def __init__(self):
+        self._day = None
+        self._pv = 0.0
+        self._v = 0.0
+
+    @staticmethod
+    def _typical(candle):
+        return (candle.high + candle.low + candle.close) / 3
+
+    def seed(self, df):
+        day = df["open_time"] // MS_PER_DAY
+        tp = (df["high"] + df["low"] + df["close"]) / 3
+        pv = (tp * df["volume"]).groupby(day).cumsum()
+        v = df["volume"].groupby(day).cumsum()
+
+        series = (pv / v).to_numpy()
+        # zero-volume session start -> typical price
+        series = np.where(np.isfinite(series), series, tp.to_numpy())
+
+        if len(df) > 1:
+            self._day = int(day.iloc[-2])
+            self._pv = float(pv.iloc[-2])
+            self._v = float(v.iloc[-2])
+        else:
+            self._day, self._pv, self._v = None, 0.0, 0.0
+
+        return {"vwap": series}
+
+    def _sums(self, candle):
+        day = candle.open_time // MS_PER_DAY
+        pv, v = (self._pv, self._v) if day == self._day else (0.0, 0.0)
+        return day, pv + self._typical(candle) * candle.volume, v + candle.volume
+
+    def value(self, candle):
+        _, pv, v = self._sums(candle)
+        return (pv / v if v else self._typical(candle),)
+
+    def commit(self, candle):
+        self._day, self._pv, self._v = self._sums(candle)
+
+
+class BollingerBands(Indicator):
+    """
+    SMA +- k * population std over `period` closes
+    """
+
+    def __init__(self, period=20, k=2.0):
+        self.period = _check_period(period)
+        self.k = float(k)
+        name = f"bb{self.period}"
+        self.lines = (f"{name}_upper", f"{name}_mid", f"{name}_lower")
+        self.warmup = self.period - 1
+        self._window = _Window(self.period - 1)
+
+    def seed(self, df):
+        n = self.period
+        close = df["close"]
+        self._window.reset(close.iloc[-n:-1])
+
+        rolling = close.rolling(n)
+        mid = rolling.mean().to_numpy()
+        std = rolling.std(ddof=0).to_numpy()
+        return dict(zip(self.lines, (mid + self.k * std, mid, mid - self.k * std)))
+
+    def value(self, candle):
+        w = self._window
+        if not w.full:
+            return (NAN, NAN, NAN)
+
+        n = self.period
+        x = candle.close
+        mean = (w.sum + x) / n
+        var = max(0.0, (w.sumsq + x * x) / n - mean * mean)
+        band = self.k * math.sqrt(var)
+        return (mean + band, mean, mean - band)
+
+    def commit(self, candle):
+        self._window.push(candle.close)
+
+
+# ==================================================
+# Oscillators (own pane)
+# ==================================================
+class RSI(Indicator):
+    """
+    Wilder's RSI (smoothing alpha = 1 / period)
+    """
+
+    pane = "rsi"
+
+    def __init__(self, period=14):
+        self.period = _check_period(period)
+        self.lines = (f"rsi{self.period}",)
+        self.warmup = 2 * self.period
+        self._prev = None
+        self._gain = _Ema(1 / self.period)
+        self._loss = _Ema(1 / self.period)
+
+    @staticmethod
+    def _rsi(gain, loss):
+        if loss == 0:
+            return 100.0 if gain > 0 else 50.0
+        return 100 - 100 / (1 + gain / loss)
+
+    def seed(self, df):
+        close = df["close"]
+        delta = close.diff()
+        alpha = 1 / self.period
+        gain = delta.clip(lower=0).ewm(alpha=alpha, adjust=False).mean()
+        loss = (-delta).clip(lower=0).ewm(alpha=alpha, adjust=False).mean()
+
+        g = gain.to_numpy()
+        l = loss.to_numpy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            series = np.where(
+                l == 0,
+                np.where(g > 0, 100.0, 50.0),
+                100 - 100 / (1 + g / l),
+            )
+        series[:self.period] = NAN
+
+        n = len(close)
+        self._prev = float(close.iloc[-2]) if n > 1 else None
+        self._gain.value = float(g[-2]) if n > 2 else None
+        self._loss.value = float(l[-2]) if n > 2 else None
+        self._gain.count = self._loss.count = max(0, n - 2)
+
+        return {self.lines[0]: series}
+
+    def _moves(self, candle):
+        change = candle.close - self._prev
+        return max(change, 0.0), max(-change, 0.0)
+
+    def value(self, candle):
+        if self._prev is None or self._gain.count + 1 < self.period:
+            return (NAN,)
+        up, down = self._moves(candle)
+        return (self._rsi(self._gain.peek(up), self._loss.peek(down)),)
+
+    def commit(self, candle):
+        if self._prev is not None:
+            up, down = self._moves(candle)
+            self._gain.push(up)
+            self._loss.push(down)
+        self._prev = candle.close
+
+
+class MACD(Indicator):
+    """
+    EMA(fast) - EMA(slow), signal = EMA(signal) of that, histogram
+    """
+
+    pane = "macd"
+
+    def __init__(self, fast=12, slow=26, signal=9):
+        self.fast = _check_period(fast)
+        self.slow = _check_period(slow)
+        self.signal = _check_period(signal)
+        if self.fast >= self.slow:
+            raise ValueError("MACD fast period must be < slow period")
+
+        self.lines = ("macd", "macd_signal", "macd_hist")
+        self.warmup = 2 * self.slow + self.signal
+        self._fast = _Ema(2 / (self.fast + 1))
+        self._slow = _Ema(2 / (self.slow + 1))
+        self._signal = _Ema(2 / (self.signal + 1))
+
+    def seed(self, df):
+        close = df["close"]
+        fast = close.ewm(span=self.fast, adjust=False).mean()
+        slow = close.ewm(span=self.slow, adjust=False).mean()
+        macd = fast - slow
+        signal = macd.ewm(span=self.signal, adjust=False).mean()
+
+        n = len(close)
+        for ema, series in (
+            (self._fast, fast),
+            (self._slow, slow),
+            (self._signal, signal),
+        ):
+            ema.value = float(series.iloc[-2]) if n > 1 else None
+            ema.count = max(0, n - 1)
+
+        macd = macd.to_numpy()
+        signal = signal.to_numpy()
+        hist = macd - signal
+
+        macd[:self.slow - 1] = NAN
+        signal[:self.slow + self.signal - 2] = NAN
+        hist[:self.slow + self.signal - 2] = NAN
+        return dict(zip(self.lines, (macd, signal, hist)))
+
+    def value(self, candle):
+        count = self._slow.count + 1
+        x = candle.close
+        macd = self._fast.peek(x) - self._slow.peek(x)
+        signal = self._signal.peek(macd)
+
+        if count < self.slow:
+            return (NAN, NAN, NAN)
+        if count < self.slow + self.signal - 1:
+            return (macd, NAN, NAN)
+        return (macd, signal, macd - signal)
+
+    def commit(self, candle):
+        x = candle.close
+        macd = self._fast.peek(x) - self._slow.peek(x)
+        self._fast.push(x)
+        self._slow.push(x)
+        self._signal.push(macd)
+
+
+INDICATORS = {
+    "sma": SMA,
+    "ema": EMA,
+    "vwap": VWAP,
+    "bb": BollingerBands,
+    "rsi": RSI,
+    "macd": MACD,
+}
+
+
+# ==================================================
+# Engine
+# ==================================================
+class IndicatorEngine:
+    """
+    Runs a set of indicators over one candle stream
+
+    specs: [(name, *params)], e.g. [("ema", 20), ("bb", 20, 2.0)]
+    """
+
+    def __init__(self, specs=()):
+        self.indicators = []
+        for name, *params in specs:
+            try:
+                cls = INDICATORS[name]
+            except KeyError:
+                raise ValueError(f"Unknown indicator: {name}")
+            self.indicators.append(cls(*params))
+
+        self.lines = tuple(
+            line for ind in self.indicators for line in ind.lines
+        )
+        if len(set(self.lines)) != len(self.lines):
+            raise ValueError(f"Duplicate indicator lines: {self.lines}")
+
+        # extra history needed before the first displayed candle
+        self.warmup = max((ind.warmup for ind in self.indicators), default=0)
+
+    @property
+    def panes(self):
+        """
+        Oscillator panes in spec order (besides the price axis)
+        """
+        panes = []
+        for ind in self.indicators:
+            if ind.pane != "price" and ind.pane not in panes:
+                panes.append(ind.pane)
+        return panes
+
+    def seed(self, open_time, open, high, low, close, volume,
+             live: bool = True) -> dict:
+        """
+        Full series per line for the history
+
+        live: the last candle is still open; False commits it too
+        """
+        # pandas only for the one-off vectorized history pass
+        import pandas as pd
+
+        df = pd.DataFrame({
+            "open_time": np.asarray(open_time, dtype=np.int64),
+            "open": np.asarray(open, dtype=np.float64),
+            "high": np.asarray(high, dtype=np.float64),
+            "low": np.asarray(low, dtype=np.float64),
+            "close": np.asarray(close, dtype=np.float64),
+            "volume": np.asarray(volume, dtype=np.float64),
+        })
+
+        series = {}
+        for ind in self.indicators:
+            series.update(ind.seed(df))
+
+        if not live and len(df):
+            # state as of the last candle = one more commit (same recurrence)
+            self.commit(Candle(*(
+                df[name].iloc[-1]
+                for name in ("open_time", "open", "high", "low", "close", "volume")
+            )))
+        return series
+
+    def update(self, candle) -> tuple:
+        """
+        Values for the live candle, in `lines` order (O(1))
+        """
+        values = ()
+        for ind in self.indicators:
+            values += ind.value(candle)
+        return values
+
+    def commit(self, candle):
+        """
+        The candle closed: fold it into every indicator (O(1))
+        """
+        for ind in self.indicators:
+            ind.commit(candle)
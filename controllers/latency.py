@@ -0,0 +1,146 @@
+# controllers/latency.py
+
+import bisect
+import json
+import os
+import time
+
+from config.config import LATENCY_TRACKING
+
+
+def _bucket_bounds(lo=1e-5, hi=120.0, factor=1.25):
+    """
+    Geometric bucket upper bounds in seconds (10us .. 2min, ~25% wide)
+    """
+    bounds = []
+    b = lo
+    while b < hi:
+        bounds.append(b)
+        b *= factor
+    bounds.append(hi)
+    return bounds
+
+
+BUCKETS = _bucket_bounds()
+
+
+class LatencyHistogram:
+    """
+    Fixed-size log-bucket histogram
+
+    - record() is O(log buckets), no allocation
+    - percentiles are bucket upper bounds (<= 25% error)
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.reset()
+
+    def reset(self):
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        if seconds < 0:
+            # clock skew between exchange and local machine
+            seconds = 0.0
+
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, p: float) -> float:
+        if not self.count:
+            return 0.0
+
+        rank = p / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                bound = BUCKETS[i] if i < len(BUCKETS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        """
+        Stats in milliseconds
+        """
+        return {
+            "count": self.count,
+            "mean_ms": (self.total / self.count * 1000) if self.count else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+class LatencyTracker:
+    """
+    Exchange -> screen latency, per pipeline stage
+
+    network    : exchange event time (E) -> socket receive
+    decode     : socket receive -> Trade record (JSON parse + routing)
+    queue      : Trade queued -> UI frame starts (dispatcher wait)
+    controller : UI frame: trade batch -> MarketController state + trade listeners
+    render     : UI frame: listeners updating widgets
+    paint      : listeners done -> Tk idle (painted)
+    end_to_end : exchange event time -> painted
+    """
+
+    STAGES = (
+        "network",
+        "decode",
+        "queue",
+        "controller",
+        "render",
+        "paint",
+        "end_to_end",
+    )
+
+    def __init__(self, enabled: bool = LATENCY_TRACKING):
+        self.enabled = enabled
+        self.started_at = time.time()
+        self.histograms = {stage: LatencyHistogram() for stage in self.STAGES}
+
+    def record(self, stage: str, seconds: float):
+        if self.enabled:
+            self.histograms[stage].record(seconds)
+
+    def reset(self):
+        self.started_at = time.time()
+        for h in self.histograms.values():
+            h.reset()
+
+    def snapshot(self) -> dict:
+        return {
+            stage: self.histograms[stage].snapshot()
+            for stage in self.STAGES
+        }
+
+    def export_json(self, path: str) -> str:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "started_at": self.started_at,
+                    "exported_at": time.time(),
+                    "stages": self.snapshot(),
+                },
+                f,
+                indent=2,
+            )
+
+        return path
+
+
+# shared instance used by the whole pipeline
+latency = LatencyTracker()
@@ -4,12 +4,22 @@ from collections import deque
 
 from api.binance_rest import get_24h_ticker
 from api.binance_websocket import BinanceWebSocket
+from api.trade_backfill import fetch_missed_trades
+from api.trade_decoder import stream_type
+from controllers.latency import latency
+from controllers.order_book import OrderBookController
+from controllers.trade_tape import TradeTape
+from config.config import MAX_RECENT_TRADES, BACKFILL_TIMEOUT, STREAM_TYPE
 
 
 class MarketController:
-    def __init__(self, symbol: str):
+    def __init__(self, symbol: str, dispatcher=None, streams=None, feed=None,
+                 order_book=None):
         self.symbol = symbol.upper()
 
+        # ---- UI dispatch (optional, coalesces updates per frame) ----
+        self._dispatcher = dispatcher
+
         # ---- market state ----
         self.last_price = None
         self.price_change_24h = None
@@ -19,20 +29,60 @@ class MarketController:
         self.volume_24h = None
 
         # ---- recent trades ----
-        self.recent_trades = deque(maxlen=20)
+        self.recent_trades = TradeTape(MAX_RECENT_TRADES)
+        self.last_trade = None
+
+        # live trades up to this id were already backfilled after a reconnect
+        self._skip_through = -1
+
+        # trades received since the last UI frame (any thread appends,
+        # _dispatch drains the whole batch at once)
+        self._inbox = deque()
+
+        # ---- order book (started by the view that shows it) ----
+        # order_book: a ready OrderBookController-like source instead
+        if order_book is None:
+            order_book = OrderBookController(
+                self.symbol, dispatcher=dispatcher, streams=streams
+            )
+        self.order_book = order_book
+
+        # ---- latency bookkeeping ----
+        self._updated_at = 0.0
+        self._painted_trade = None
 
         # ---- observers ----
         self._listeners = []
+        self._trade_listeners = []
 
         # ---- lifecycle ----
         self._stopped = False
         self._snapshot_running = False
 
         # ---- websocket ----
-        self._ws = BinanceWebSocket(
-            symbol=self.symbol,
-            on_trade=self._on_trade
-        )
+        # feed      : any BinanceWebSocket-like source (e.g. ReplayWebSocket)
+        # streams   : shared combined stream (BinanceStreamManager)
+        # otherwise : a dedicated connection for this symbol
+        self._streams = streams
+        self._stream = stream_type(STREAM_TYPE)
+        self._trade_stream = f"{self.symbol.lower()}@{self._stream.suffix}"
+        self._ws = None
+
+        # <symbol>@kline_<interval> (chart); own connection without `streams`
+        self._kline_streams = None
+        self._own_kline_streams = False
+
+        if feed is not None:
+            self._streams = None
+            self._ws = feed
+            feed.on_trade = self._on_trade
+        elif streams is None:
+            self._ws = BinanceWebSocket(
+                symbol=self.symbol,
+                on_trade=self._on_trade,
+                on_reconnect=self._on_reconnect,
+                stream=STREAM_TYPE,
+            )
 
     # ==================================================
     # Observer
@@ -41,23 +91,127 @@ class MarketController:
         if listener not in self._listeners:
             self._listeners.append(listener)
 
+    def add_trade_listener(self, callback):
+        """
+        callback(trades) runs once per UI frame with every trade received
+        since the previous one (oldest first), before the listeners update
+        """
+        # copy-on-write: the drain may be iterating
+        if callback not in self._trade_listeners:
+            self._trade_listeners = self._trade_listeners + [callback]
+
+    def remove_trade_listener(self, callback):
+        self._trade_listeners = [
+            c for c in self._trade_listeners if c != callback
+        ]
+
+    @property
+    def has_trade_ids(self) -> bool:
+        """
+        Realtime feed carries exchange trade ids (trade / aggTrade)
+        """
+        return self._stream.trades
+
+    def add_kline_listener(self, interval: str, handler) -> bool:
+        """
+        handler(payload, recv_time) for every <symbol>@kline_<interval>
+        message, on the stream thread
+
+        False when the source has no kline stream (recording replay)
+        """
+        if self._stopped:
+            return False
+
+        streams = self._kline_streams
+        if streams is None:
+            if self._streams is not None:
+                streams = self._streams
+            elif isinstance(self._ws, BinanceWebSocket):
+                from api.binance_stream_manager import BinanceStreamManager
+                streams = BinanceStreamManager()
+                self._own_kline_streams = True
+            else:
+                return False
+            self._kline_streams = streams
+
+        streams.subscribe(f"{self.symbol.lower()}@kline_{interval}", handler)
+        return True
+
+    def remove_kline_listener(self, interval: str, handler):
+        if self._kline_streams is not None:
+            self._kline_streams.unsubscribe(
+                f"{self.symbol.lower()}@kline_{interval}", handler
+            )
+
+    def refresh(self):
+        """
+        Re-deliver current state to all listeners (e.g. view shown again)
+        """
+        self._notify()
+
     def _notify(self):
+        """
+        Signal a state change (safe from any thread)
+
+        With a dispatcher, listeners run once per UI frame on the
+        Tk thread no matter how many changes arrived in between.
+        """
+        if self._stopped:
+            return
+
+        if self._dispatcher is not None:
+            self._dispatcher.request(self._dispatch)
+        else:
+            self._dispatch()
+
+    def _dispatch(self):
         if self._stopped:
             return
 
+        frame_start = time.time()
+        if self._inbox:
+            self._apply_batch()
+
+        # newest trade not yet measured on screen
+        trade = self.last_trade
+        if trade is self._painted_trade or not latency.enabled:
+            trade = None
+        t0 = time.time()
+
         alive = []
+        updated = False
         for l in self._listeners:
             try:
                 if hasattr(l, "winfo_exists") and not l.winfo_exists():
                     continue
+                # hidden (pooled) views catch up when shown again
+                if hasattr(l, "winfo_viewable") and not l.winfo_viewable():
+                    alive.append(l)
+                    continue
                 if hasattr(l, "on_market_update"):
                     l.on_market_update()
+                    updated = True
                 alive.append(l)
             except Exception:
                 continue
 
         self._listeners = alive
 
+        if trade is not None and updated:
+            self._painted_trade = trade
+            render_end = time.time()
+            latency.record("queue", frame_start - self._updated_at)
+            latency.record("render", render_end - t0)
+            if self._dispatcher is not None:
+                self._dispatcher.after_paint(
+                    lambda: self._record_paint(trade, render_end)
+                )
+
+    def _record_paint(self, trade, render_end):
+        now = time.time()
+        latency.record("paint", now - render_end)
+        latency.record("end_to_end", now - trade.event_time / 1000)
+
     # ==================================================
     # Snapshot
     # ==================================================
@@ -65,7 +219,15 @@ class MarketController:
         if self._stopped:
             return
 
-        data = get_24h_ticker(self.symbol)
+        self.apply_snapshot(get_24h_ticker(self.symbol))
+
+    def apply_snapshot(self, data: dict):
+        """
+        Apply a 24h ticker dict (single or batched REST response)
+        """
+        if self._stopped:
+            return
+
         self.last_price = float(data["lastPrice"])
         self.price_change_24h = float(data["priceChange"])
         self.change_percent_24h = float(data["priceChangePercent"])
@@ -74,6 +236,42 @@ class MarketController:
         self.volume_24h = float(data["quoteVolume"])
         self._notify()
 
+    def submit(self, fn, *args, on_done=None, on_error=None):
+        """
+        Run blocking fn(*args) (REST, cache) off the Tk thread
+
+        on_done(result) / on_error(exc) run on the Tk thread through the
+        dispatcher; uses the asyncio core's executor when there is one.
+        """
+        core = getattr(self._streams, "core", None)
+        if core is not None:
+            return core.submit(
+                fn, *args,
+                on_done=on_done,
+                on_error=on_error,
+                dispatcher=self._dispatcher,
+            )
+
+        def deliver(callback, value):
+            if callback is None or self._stopped:
+                return
+            if self._dispatcher is not None:
+                self._dispatcher.post(callback, value)
+            else:
+                callback(value)
+
+        def job():
+            try:
+                result = fn(*args)
+            except Exception as e:
+                if on_error is None:
+                    print(f"[REST] {getattr(fn, '__name__', fn)} failed: {e}")
+                deliver(on_error, e)
+            else:
+                deliver(on_done, result)
+
+        threading.Thread(target=job, daemon=True).start()
+
     def start_snapshot_refresh(self, interval=30):
         if self._snapshot_running or self._stopped:
             return
@@ -91,28 +289,108 @@ class MarketController:
     # WebSocket
     # ==================================================
     def start_realtime(self):
-        if not self._stopped:
+        if self._stopped:
+            return
+
+        if self._streams is not None:
+            self._streams.subscribe(self._trade_stream, self._on_trade_msg)
+            add = getattr(self._streams, "add_reconnect_listener", None)
+            if add is not None:
+                add(self._on_reconnect)
+        else:
             self._ws.start()
 
+    def _on_trade_msg(self, data, recv_time):
+        """
+        Raw payload (STREAM_TYPE) from the shared stream
+        """
+        self._on_trade(self._stream.decode(data, recv_time))
+
     def _on_trade(self, trade):
         """
-        Called by websocket on every trade
+        Called by websocket on every trade (Trade record)
+
+        Hot path: only queues the trade, the batch is applied on the
+        next drain (_dispatch).
         """
-        if self._stopped:
+        if self._stopped or trade.trade_id <= self._skip_through:
             return
 
-        self.last_price = trade["price"]
+        if latency.enabled:
+            now = time.time()
+            latency.record("network", trade.recv_time - trade.event_time / 1000)
+            latency.record("decode", now - trade.recv_time)
+            self._updated_at = now
 
-        self.last_trade = {
-            "price": trade["price"],
-            "qty": trade["qty"],
-            "side": trade["side"],
-            "ts": time.time(),
-        }
+        inbox = self._inbox
+        inbox.append(trade)
+        # first trade of a batch schedules the drain, the rest ride along
+        if len(inbox) == 1:
+            self._notify()
 
-        self._notify()
+    def _drain_inbox(self):
+        inbox = self._inbox
+        batch = []
+        # popleft until empty: trades appended meanwhile join this batch
+        while inbox:
+            batch.append(inbox.popleft())
+        return batch
+
+    def _apply_batch(self):
+        t0 = time.time()
+
+        batch = self._drain_inbox()
+        if not batch:
+            return
+
+        last = batch[-1]
+        self.last_price = last.price
+        self.last_trade = last
+        if self._stream.trades:
+            # price ticks (bookTicker, kline) are not trades
+            self.recent_trades.extend(batch)
+
+        for callback in self._trade_listeners:
+            try:
+                callback(batch)
+            except Exception as e:
+                print(f"[Market] Trade listener error: {e}")
+
+        if latency.enabled:
+            latency.record("controller", time.time() - t0)
+
+    def _on_reconnect(self):
+        """
+        Stream came back: fetch the trades missed while it was down
 
+        Runs while the stream holds live messages back, so backfilled
+        trades are queued before them; duplicates are dropped by trade id.
+        """
+        if self._stopped or not self._stream.trades:
+            return
+
+        # newest trade received (queued or already applied)
+        inbox = self._inbox
+        last = inbox[-1] if inbox else self.last_trade
+        if last is None:
+            return
+
+        t0 = time.time()
+        trades = fetch_missed_trades(self.symbol, last.trade_id, last.trade_time)
+        elapsed = time.time() - t0
 
+        if elapsed > BACKFILL_TIMEOUT:
+            # live trades already resumed -> applying now would reorder
+            print(f"[Market] {self.symbol}: backfill took {elapsed:.1f}s, dropped")
+            return
+
+        self._skip_through = trades[-1].trade_id if trades else last.trade_id
+        print(f"[Market] {self.symbol}: backfilled {len(trades)} trades "
+              f"in {elapsed * 1000:.0f} ms")
+
+        if trades:
+            inbox.extend(trades)
+            self._notify()
 
     # ==================================================
     # Stop
@@ -124,9 +402,23 @@ class MarketController:
         self._stopped = True
         self._snapshot_running = False
 
+        if self._dispatcher is not None:
+            self._dispatcher.cancel(self._dispatch)
+
         try:
-            self._ws.stop()
+            if self._streams is not None:
+                self._streams.unsubscribe(self._trade_stream, self._on_trade_msg)
+                remove = getattr(self._streams, "remove_reconnect_listener", None)
+                if remove is not None:
+                    remove(self._on_reconnect)
+            else:
+                self._ws.stop()
+            if self._own_kline_streams:
+                self._kline_streams.stop()
         except Exception:
             pass
 
+        self.order_book.stop()
+
         self._listeners.clear()
+        self._trade_listeners = []
@@ -0,0 +1,404 @@
+# controllers/market_engine.py
+"""
+Process-isolated market data engine (MARKET_ENGINE = "process")
+
+A worker process (multiprocessing, spawn) owns the websocket / REST
+clients, trade decoding, backfill, order book sync and candle klines.
+It publishes per symbol into shared memory (controllers/shared_ring.py):
+
+    trades : SharedRing   every trade, with sequence numbers
+    klines : SharedRing   <symbol>@kline_<interval> updates (chart)
+    ticker : SharedRecord last price + 24h statistics
+    book   : SharedRecord top ORDER_BOOK_LEVELS bids / asks
+
+The Tk process only reads new rows once per frame
+(controllers/remote_market.py), so JSON parsing and book updates never
+take GIL time from rendering. Commands (open / close / book / kline /
+snapshot) go the other way over a multiprocessing queue.
+"""
+
+import multiprocessing as mp
+import queue
+import threading
+import time
+
+import numpy as np
+
+from controllers.shared_ring import SharedRing, SharedRecord
+from config.config import (
+    ORDER_BOOK_LEVELS,
+    ENGINE_TRADE_RING,
+    ENGINE_PUBLISH_HZ,
+    NETWORK_BACKEND,
+    SNAPSHOT_REFRESH_INTERVAL,
+)
+
+
+# ==================================================
+# Shared layout (one channel per symbol)
+# ==================================================
+TRADE_DTYPE = np.dtype([
+    ("price", "f8"),
+    ("qty", "f8"),
+    ("buy", "?"),
+    ("ts", "f8"),
+    ("trade_id", "i8"),
+    ("trade_time", "i8"),
+    ("event_time", "i8"),
+    ("recv_time", "f8"),
+])
+
+KLINE_DTYPE = np.dtype([
+    ("interval", "S4"),
+    ("open_time", "i8"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "f8"),
+    ("closed", "?"),
+    ("last_id", "i8"),
+])
+
+# NaN = not known yet
+TICKER_DTYPE = np.dtype([
+    ("last_price", "f8"),
+    ("price_change", "f8"),
+    ("change_pct", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("volume", "f8"),
+])
+
+BOOK_DTYPE = np.dtype([
+    ("bid_price", "f8", (ORDER_BOOK_LEVELS,)),
+    ("bid_qty", "f8", (ORDER_BOOK_LEVELS,)),
+    ("ask_price", "f8", (ORDER_BOOK_LEVELS,)),
+    ("ask_qty", "f8", (ORDER_BOOK_LEVELS,)),
+    ("bids", "i4"),
+    ("asks", "i4"),
+    ("update_id", "i8"),
+])
+
+KLINE_RING = 256
+
+
+def _nan(value):
+    return np.nan if value is None else value
+
+
+class SymbolChannel:
+    """
+    The four shared blocks of one symbol
+
+    names=None creates them (Tk process), otherwise attaches (engine)
+    """
+
+    def __init__(self, names: dict | None = None):
+        names = names or {}
+        self.trades = SharedRing(TRADE_DTYPE, ENGINE_TRADE_RING, names.get("trades"))
+        self.klines = SharedRing(KLINE_DTYPE, KLINE_RING, names.get("klines"))
+        self.ticker = SharedRecord(TICKER_DTYPE, names.get("ticker"))
+        self.book = SharedRecord(BOOK_DTYPE, names.get("book"))
+
+    @property
+    def names(self) -> dict:
+        return {
+            "trades": self.trades.name,
+            "klines": self.klines.name,
+            "ticker": self.ticker.name,
+            "book": self.book.name,
+        }
+
+    def close(self):
+        for block in (self.trades, self.klines, self.ticker, self.book):
+            block.close()
+
+
+# ==================================================
+# Tk process side
+# ==================================================
+class MarketEngine:
+    """
+    Handle to the engine process
+
+    - start() / stop() the worker
+    - open_channel() creates a symbol's shared blocks (owned here,
+      removed on close_channel / stop)
+    - send(command, *args) is fire-and-forget
+    """
+
+    def __init__(self):
+        ctx = mp.get_context("spawn")
+        self._commands = ctx.Queue()
+        self._process = ctx.Process(
+            target=engine_main,
+            args=(self._commands,),
+            name="market-engine",
+            daemon=True,
+        )
+        self._channels = {}
+
+    def start(self):
+        if self._process.is_alive():
+            return
+        self._process.start()
+        print(f"[Engine] started (pid {self._process.pid})")
+
+    def stop(self):
+        if self._process.is_alive():
+            self.send("stop")
+            self._process.join(timeout=2)
+            if self._process.is_alive():
+                self._process.terminate()
+
+        for channel in self._channels.values():
+            channel.close()
+        self._channels.clear()
+
+    def send(self, command: str, *args):
+        self._commands.put((command, *args))
+
+    def open_channel(self, symbol: str) -> SymbolChannel:
+        channel = self._channels.get(symbol)
+        if channel is None:
+            channel = SymbolChannel()
+            self._channels[symbol] = channel
+        return channel
+
+    def close_channel(self, symbol: str):
+        channel = self._channels.pop(symbol, None)
+        if channel is not None:
+            self.send("close", symbol)
+            channel.close()
+
+
+# ==================================================
+# Engine process side
+# ==================================================
+class EnginePump:
+    """
+    UIDispatcher stand-in inside the engine: coalesced callbacks run
+    ENGINE_PUBLISH_HZ times per second, so controllers publish trade
+    batches instead of single trades
+    """
+
+    def __init__(self):
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._posted = queue.SimpleQueue()
+
+    def request(self, callback):
+        with self._lock:
+            self._pending[callback] = None
+
+    def cancel(self, callback):
+        with self._lock:
+            self._pending.pop(callback, None)
+
+    def post(self, callback, *args):
+        self._posted.put((callback, args))
+
+    def after_paint(self, callback):
+        callback()
+
+    def run_once(self):
+        posted = self._posted
+        for _ in range(posted.qsize()):
+            callback, args = posted.get_nowait()
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"[Engine] Posted call error: {e}")
+
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+
+        for callback in pending:
+            try:
+                callback()
+            except Exception as e:
+                print(f"[Engine] Dispatch error: {e}")
+
+
+class SymbolPublisher:
+    """
+    One MarketController in the engine -> its SymbolChannel
+    """
+
+    def __init__(self, symbol, names, pump, streams):
+        from controllers.market_controller import MarketController
+
+        self.symbol = symbol
+        self.channel = SymbolChannel(names)
+        self.controller = MarketController(symbol, dispatcher=pump, streams=streams)
+        self._kline_handlers = {}
+        self._ticker = None
+
+        self.controller.add_listener(self)
+        self.controller.add_trade_listener(self._on_trades)
+        self.controller.order_book.add_listener(self)
+        self.controller.start_realtime()
+
+    # ---- MarketController / OrderBookController listeners ----
+    def on_market_update(self):
+        c = self.controller
+        ticker = (
+            _nan(c.last_price),
+            _nan(c.price_change_24h),
+            _nan(c.change_percent_24h),
+            _nan(c.high_24h),
+            _nan(c.low_24h),
+            _nan(c.volume_24h),
+        )
+        if ticker != self._ticker:
+            self._ticker = ticker
+            self.channel.ticker.write(ticker)
+
+    def on_order_book_update(self):
+        bids, asks, update_id = self.controller.order_book.top
+        if update_id is None:
+            return
+
+        row = np.zeros((), BOOK_DTYPE)
+        if bids:
+            row["bid_price"][:len(bids)], row["bid_qty"][:len(bids)] = zip(*bids)
+        if asks:
+            row["ask_price"][:len(asks)], row["ask_qty"][:len(asks)] = zip(*asks)
+        row["bids"] = len(bids)
+        row["asks"] = len(asks)
+        row["update_id"] = update_id
+        self.channel.book.write(row)
+
+    def _on_trades(self, trades):
+        self.channel.trades.write([
+            (t.price, t.qty, t.side == "buy", t.ts, t.trade_id,
+             t.trade_time, t.event_time, t.recv_time)
+            for t in trades
+        ])
+
+    # ---- commands ----
+    def snapshot(self):
+        c = self.controller
+        c.submit(c.load_snapshot, on_error=lambda e: print(
+            f"[Engine] {self.symbol} snapshot failed: {e}"
+        ))
+
+    def book(self, on: bool):
+        if on:
+            self.controller.order_book.start()
+        else:
+            self.controller.order_book.stop()
+            # stop() drops listeners
+            self.controller.order_book.add_listener(self)
+
+    def kline(self, interval: str, on: bool):
+        handler = self._kline_handlers.get(interval)
+        if on and handler is None:
+            ring = self.channel.klines
+            tag = interval.encode()
+
+            def handler(payload, recv_time):
+                k = payload["k"]
+                ring.write([(
+                    tag, k["t"], float(k["o"]), float(k["h"]), float(k["l"]),
+                    float(k["c"]), float(k["v"]), k["x"], k["L"],
+                )])
+
+            if self.controller.add_kline_listener(interval, handler):
+                self._kline_handlers[interval] = handler
+        elif not on and handler is not None:
+            self.controller.remove_kline_listener(interval, handler)
+            del self._kline_handlers[interval]
+
+    def close(self):
+        self.controller.stop()
+        self.channel.close()
+
+
+def _build_streams():
+    """
+    Shared combined stream on the configured network backend
+    """
+    from api.binance_stream_manager import BinanceStreamManager
+
+    if NETWORK_BACKEND == "asyncio":
+        from api.async_core import AsyncNetworkCore, AsyncStreamManager
+        try:
+            core = AsyncNetworkCore()
+            streams = AsyncStreamManager(core)
+        except RuntimeError as e:
+            print(f"[WS] {e} -> falling back to threads")
+        else:
+            core.start()
+            return streams, core
+
+    return BinanceStreamManager(), None
+
+
+def engine_main(commands):
+    """
+    Engine process entry point
+    """
+    from controllers.latency import latency
+    from controllers.snapshot_refresher import SnapshotRefresher
+
+    # stage timings are only meaningful in the Tk process
+    latency.enabled = False
+
+    pump = EnginePump()
+    streams, core = _build_streams()
+    snapshots = SnapshotRefresher(interval=SNAPSHOT_REFRESH_INTERVAL, core=core)
+    snapshots.start()
+
+    publishers = {}
+    parent = mp.parent_process()
+    period = 1 / ENGINE_PUBLISH_HZ
+    next_check = 0.0
+
+    running = True
+    while running:
+        while True:
+            try:
+                command, *args = commands.get_nowait()
+            except queue.Empty:
+                break
+
+            symbol = args[0] if args else None
+            pub = publishers.get(symbol)
+
+            try:
+                if command == "stop":
+                    running = False
+                elif command == "open" and pub is None:
+                    pub = SymbolPublisher(symbol, args[1], pump, streams)
+                    publishers[symbol] = pub
+                    snapshots.add(pub.controller)
+                    # first 24h values now, not at the next refresh cycle
+                    pub.snapshot()
+                elif command == "close" and pub is not None:
+                    snapshots.remove(pub.controller)
+                    publishers.pop(symbol).close()
+                elif pub is not None:
+                    getattr(pub, command)(*args[1:])
+            except Exception as e:
+                print(f"[Engine] {command} {symbol or ''} failed: {e}")
+
+        pump.run_once()
+
+        now = time.monotonic()
+        if now >= next_check:
+            # Tk process gone (crash / kill) -> do not linger
+            next_check = now + 1.0
+            if parent is not None and not parent.is_alive():
+                running = False
+
+        time.sleep(period)
+
+    snapshots.stop()
+    for pub in publishers.values():
+        pub.close()
+    streams.stop()
+    if core is not None:
+        core.stop()
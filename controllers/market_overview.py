@@ -0,0 +1,268 @@
+# controllers/market_overview.py
+
+import threading
+
+import numpy as np
+
+from config.config import OVERVIEW_QUOTE
+
+
+SORT_KEYS = ("symbol", "last", "change", "volume")
+
+
+class MarketOverview:
+    """
+    Columnar table of many symbols fed by mini-ticker streams
+
+    - symbols=None : ONE !miniTicker@arr subscription (all markets,
+      filtered to OVERVIEW_QUOTE pairs)
+    - symbols=[..] : <symbol>@miniTicker per symbol on the shared stream
+    - one typed NumPy column per field, one row per symbol
+      (grows by doubling, rows never move)
+    - sort / filter are vectorized; the order is cached until the
+      data or the query changes
+    - no REST polling, no per-symbol thread
+    """
+
+    def __init__(self, dispatcher=None, streams=None, symbols=None,
+                 quote: str = OVERVIEW_QUOTE, capacity: int = 512):
+        self.quote = quote.upper()
+        self.symbols = [s.upper() for s in symbols] if symbols else None
+
+        self._dispatcher = dispatcher
+        self._streams = streams
+        self._own_streams = False
+
+        # ---- columns ----
+        self._names = []   # row -> symbol
+        self._index = {}   # symbol -> row
+        self._last = np.zeros(capacity)
+        self._open = np.zeros(capacity)
+        self._volume = np.zeros(capacity)  # quote volume (24h)
+        self._change = np.zeros(capacity)  # % vs 24h open
+
+        self._lock = threading.Lock()
+        self.version = 0
+
+        # ---- cached query ----
+        self._query = None
+        self._order = np.empty(0, dtype=np.intp)
+
+        self._listeners = []
+        self._running = False
+
+    def __len__(self):
+        return len(self._names)
+
+    # ==================================================
+    # Observer
+    # ==================================================
+    def add_listener(self, listener):
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def refresh(self):
+        self._notify()
+
+    def _notify(self):
+        if not self._running:
+            return
+
+        if self._dispatcher is not None:
+            self._dispatcher.request(self._dispatch)
+        else:
+            self._dispatch()
+
+    def _dispatch(self):
+        if not self._running:
+            return
+
+        alive = []
+        for l in self._listeners:
+            try:
+                if hasattr(l, "winfo_exists") and not l.winfo_exists():
+                    continue
+                # hidden overview catches up when shown again
+                if hasattr(l, "winfo_viewable") and not l.winfo_viewable():
+                    alive.append(l)
+                    continue
+                if hasattr(l, "on_overview_update"):
+                    l.on_overview_update()
+                alive.append(l)
+            except Exception:
+                continue
+
+        self._listeners = alive
+
+    # ==================================================
+    # Lifecycle
+    # ==================================================
+    def _stream_names(self):
+        if self.symbols is None:
+            return ["!miniTicker@arr"]
+        return [f"{s.lower()}@miniTicker" for s in self.symbols]
+
+    def start(self):
+        if self._running:
+            return
+
+        self._running = True
+
+        if self._streams is None:
+            from api.binance_stream_manager import BinanceStreamManager
+            self._streams = BinanceStreamManager()
+            self._own_streams = True
+
+        for stream in self._stream_names():
+            self._streams.subscribe(stream, self._on_ticker_msg)
+
+    def stop(self):
+        if not self._running:
+            return
+
+        self._running = False
+
+        if self._dispatcher is not None:
+            self._dispatcher.cancel(self._dispatch)
+
+        try:
+            for stream in self._stream_names():
+                self._streams.unsubscribe(stream, self._on_ticker_msg)
+            if self._own_streams:
+                self._streams.stop()
+        except Exception:
+            pass
+
+    # ==================================================
+    # Stream
+    # ==================================================
+    def _on_ticker_msg(self, data, recv_time):
+        """
+        !miniTicker@arr (list) or <symbol>@miniTicker (dict) payload
+        """
+        if isinstance(data, dict):
+            data = (data,)
+
+        self.update(data)
+
+    def update(self, tickers):
+        """
+        Apply mini-ticker dicts (keys s, c, o, q), any thread
+        """
+        quote = self.quote
+        watch = self.symbols
+
+        rows, last, open_, volume = [], [], [], []
+        with self._lock:
+            index = self._index
+            for t in tickers:
+                symbol = t["s"]
+                row = index.get(symbol)
+                if row is None:
+                    if watch is None and not symbol.endswith(quote):
+                        continue
+                    row = self._add_row(symbol)
+
+                rows.append(row)
+                last.append(t["c"])
+                open_.append(t["o"])
+                volume.append(t["q"])
+
+            if not rows:
+                return
+
+            # one vectorized write per column
+            rows = np.fromiter(rows, dtype=np.intp, count=len(rows))
+            c = np.asarray(last, dtype=np.float64)
+            o = np.asarray(open_, dtype=np.float64)
+
+            self._last[rows] = c
+            self._open[rows] = o
+            self._volume[rows] = np.asarray(volume, dtype=np.float64)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                self._change[rows] = np.where(o > 0, (c - o) / o * 100, 0.0)
+
+            self.version += 1
+
+        self._notify()
+
+    def _add_row(self, symbol):
+        row = len(self._names)
+        if row == len(self._last):
+            size = 2 * len(self._last)
+            for name in ("_last", "_open", "_volume", "_change"):
+                old = getattr(self, name)
+                grown = np.zeros(size)
+                grown[:row] = old[:row]
+                setattr(self, name, grown)
+
+        self._names.append(symbol)
+        self._index[symbol] = row
+        return row
+
+    # ==================================================
+    # Query (Tk thread)
+    # ==================================================
+    def query(self, sort="volume", descending=True, text="", min_volume=0.0,
+              min_change=0.0, direction=0):
+        """
+        Row ids matching the filter, in display order (cached)
+
+        min_change : minimum |24h change| in %
+        direction  : 1 gainers only, -1 losers only, 0 both
+        """
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key: {sort}")
+
+        key = (self.version, sort, descending, text.upper(), min_volume,
+               min_change, direction)
+        if key == self._query:
+            return self._order
+
+        with self._lock:
+            n = len(self._names)
+            change = self._change[:n]
+            mask = self._volume[:n] >= min_volume
+            if min_change:
+                mask &= np.abs(change) >= min_change
+            if direction > 0:
+                mask &= change > 0
+            elif direction < 0:
+                mask &= change < 0
+            if text:
+                needle = text.upper()
+                mask &= np.fromiter(
+                    (needle in s for s in self._names), dtype=bool, count=n
+                )
+            ids = np.flatnonzero(mask)
+
+            if sort == "symbol":
+                names = self._names
+                ids = np.array(sorted(ids, key=names.__getitem__), dtype=np.intp)
+            else:
+                column = {
+                    "last": self._last,
+                    "change": self._change,
+                    "volume": self._volume,
+                }[sort]
+                ids = ids[np.argsort(column[ids], kind="stable")]
+
+        if descending:
+            ids = ids[::-1]
+
+        self._query = key
+        self._order = ids
+        return ids
+
+    def rows(self, ids):
+        """
+        [(symbol, last, change %, quote volume)] for the given row ids
+        """
+        with self._lock:
+            names = self._names
+            return list(zip(
+                [names[i] for i in ids],
+                self._last[ids].tolist(),
+                self._change[ids].tolist(),
+                self._volume[ids].tolist(),
+            ))
@@ -0,0 +1,67 @@
+# controllers/market_pool.py
+
+from collections import OrderedDict
+
+
+class MarketEntry:
+    """
+    One pooled market: live controller + its built view (or None)
+    """
+
+    __slots__ = ("controller", "view")
+
+    def __init__(self, controller, view=None):
+        self.controller = controller
+        self.view = view
+
+
+class MarketPool:
+    """
+    LRU pool of live markets
+
+    - get() marks an entry as most recently used
+    - put() evicts least recently used entries beyond `capacity`
+      and hands them to on_evict(key, entry) for cleanup
+    """
+
+    def __init__(self, capacity: int, on_evict=None):
+        if capacity < 1:
+            raise ValueError("MarketPool capacity must be >= 1")
+
+        self.capacity = capacity
+        self.on_evict = on_evict
+
+        self._entries = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def keys(self):
+        return list(self._entries)
+
+    def values(self):
+        return list(self._entries.values())
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.capacity:
+            old_key, old_entry = self._entries.popitem(last=False)
+            if self.on_evict:
+                self.on_evict(old_key, old_entry)
+
+    def clear(self):
+        while self._entries:
+            key, entry = self._entries.popitem(last=False)
+            if self.on_evict:
+                self.on_evict(key, entry)
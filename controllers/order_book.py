@@ -0,0 +1,295 @@
+# controllers/order_book.py
+
+import operator
+import threading
+import time
+from collections import deque
+from itertools import islice
+
+from sortedcontainers import SortedDict
+
+from api.binance_rest import get_depth_snapshot
+from config.config import ORDER_BOOK_LEVELS, ORDER_BOOK_SNAPSHOT_LIMIT
+
+# depth events buffered while a snapshot is in flight (10 / s per symbol)
+MAX_BUFFERED_EVENTS = 1000
+
+RESYNC_DELAY = 1.0  # seconds, grows per failed attempt (capped)
+
+
+class OrderBook:
+    """
+    Price-indexed local order book
+
+    - bids / asks in SortedDict -> O(log n) level update / delete
+    - bids keyed descending, asks ascending -> best level first
+    - qty 0 removes a level (Binance diff semantics)
+    """
+
+    def __init__(self):
+        self.bids = SortedDict(operator.neg)
+        self.asks = SortedDict()
+
+    def clear(self):
+        self.bids.clear()
+        self.asks.clear()
+
+    def load(self, bids, asks):
+        """
+        Replace the book with [[price, qty], ...] levels (REST snapshot)
+        """
+        self.bids = SortedDict(
+            operator.neg, ((float(p), float(q)) for p, q in bids)
+        )
+        self.asks = SortedDict((float(p), float(q)) for p, q in asks)
+
+    @staticmethod
+    def _apply(side, levels):
+        for p, q in levels:
+            price = float(p)
+            qty = float(q)
+            if qty:
+                side[price] = qty
+            else:
+                side.pop(price, None)
+
+    def update(self, bids, asks):
+        self._apply(self.bids, bids)
+        self._apply(self.asks, asks)
+
+    def top(self, n: int):
+        """
+        (bids, asks): up to n (price, qty) levels each, best first
+        """
+        return (
+            list(islice(self.bids.items(), n)),
+            list(islice(self.asks.items(), n)),
+        )
+
+
+class OrderBookController:
+    """
+    Locally maintained Binance order book for one symbol
+
+    Sync procedure (Binance spot docs):
+        1. subscribe <symbol>@depth@100ms, buffer events
+        2. GET /api/v3/depth snapshot
+        3. drop buffered events with u <= lastUpdateId
+        4. apply the rest; every event must start at most 1 past the
+           last applied id (U <= last + 1), otherwise resync
+
+    - diffs are applied on the websocket thread
+    - top-N levels are published as ONE immutable tuple, so the Tk
+      thread never locks or walks the book
+    - listeners run at most once per UI frame via UIDispatcher
+    """
+
+    def __init__(self, symbol: str, dispatcher=None, streams=None,
+                 levels: int = ORDER_BOOK_LEVELS,
+                 snapshot_limit: int = ORDER_BOOK_SNAPSHOT_LIMIT):
+        self.symbol = symbol.upper()
+        self.levels = levels
+        self.snapshot_limit = snapshot_limit
+
+        self._dispatcher = dispatcher
+        self._streams = streams
+        self._own_streams = False
+        self._stream = f"{self.symbol.lower()}@depth@100ms"
+
+        self.book = OrderBook()
+
+        # ---- published state (read by the UI) ----
+        # (bids, asks, last update id)
+        self.top = ((), (), None)
+        self.syncs = 0
+
+        # ---- sync state (guarded by _lock) ----
+        self._lock = threading.Lock()
+        self._buffer = deque(maxlen=MAX_BUFFERED_EVENTS)
+        self._last_update_id = None
+        self._synced = False
+        self._syncing = False
+
+        self._listeners = []
+        self._running = False
+
+    # ==================================================
+    # Observer
+    # ==================================================
+    def add_listener(self, listener):
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def refresh(self):
+        self._notify()
+
+    def _notify(self):
+        if not self._running:
+            return
+
+        if self._dispatcher is not None:
+            self._dispatcher.request(self._dispatch)
+        else:
+            self._dispatch()
+
+    def _dispatch(self):
+        if not self._running:
+            return
+
+        alive = []
+        for l in self._listeners:
+            try:
+                if hasattr(l, "winfo_exists") and not l.winfo_exists():
+                    continue
+                # hidden (pooled) views catch up when shown again
+                if hasattr(l, "winfo_viewable") and not l.winfo_viewable():
+                    alive.append(l)
+                    continue
+                if hasattr(l, "on_order_book_update"):
+                    l.on_order_book_update()
+                alive.append(l)
+            except Exception:
+                continue
+
+        self._listeners = alive
+
+    # ==================================================
+    # Lifecycle
+    # ==================================================
+    def start(self):
+        if self._running:
+            return
+
+        self._running = True
+
+        if self._streams is None:
+            from api.binance_stream_manager import BinanceStreamManager
+            self._streams = BinanceStreamManager()
+            self._own_streams = True
+
+        # subscribe FIRST so no diff between snapshot and stream is lost
+        self._streams.subscribe(self._stream, self._on_depth_msg)
+        with self._lock:
+            self._resync()
+
+    def stop(self):
+        if not self._running:
+            return
+
+        self._running = False
+
+        if self._dispatcher is not None:
+            self._dispatcher.cancel(self._dispatch)
+
+        try:
+            self._streams.unsubscribe(self._stream, self._on_depth_msg)
+            if self._own_streams:
+                self._streams.stop()
+        except Exception:
+            pass
+
+        self._listeners.clear()
+
+    # ==================================================
+    # Stream
+    # ==================================================
+    def _on_depth_msg(self, data, recv_time):
+        """
+        Raw <symbol>@depth@100ms payload (websocket thread)
+        """
+        with self._lock:
+            if not self._running:
+                return
+
+            if not self._synced:
+                self._buffer.append(data)
+                return
+
+            if not self._apply_event(data):
+                print(f"[Depth] {self.symbol} sequence gap, resyncing")
+                self._resync()
+                return
+
+            self._publish()
+
+    def _apply_event(self, data) -> bool:
+        """
+        Apply one diff; False on a sequence gap (caller resyncs)
+        """
+        last = self._last_update_id
+        if data["u"] <= last:
+            # already contained in the snapshot / applied
+            return True
+        if data["U"] > last + 1:
+            return False
+
+        self.book.update(data["b"], data["a"])
+        self._last_update_id = data["u"]
+        return True
+
+    def _publish(self):
+        # hold _lock: the book must not change while slicing it
+        bids, asks = self.book.top(self.levels)
+        self.top = (bids, asks, self._last_update_id)
+        self._notify()
+
+    # ==================================================
+    # Snapshot (re)sync
+    # ==================================================
+    def _resync(self):
+        """
+        Drop local state and fetch a new snapshot (hold _lock)
+        """
+        self._synced = False
+        self._buffer.clear()
+
+        if self._syncing:
+            return
+
+        self._syncing = True
+        self.syncs += 1
+
+        # asyncio backend: REST executor instead of a thread per resync
+        core = getattr(self._streams, "core", None)
+        if core is not None:
+            core.submit(self._sync_loop)
+        else:
+            threading.Thread(target=self._sync_loop, daemon=True).start()
+
+    def _sync_loop(self):
+        attempt = 0
+
+        while self._running:
+            if attempt:
+                time.sleep(min(RESYNC_DELAY * attempt, 5.0))
+            attempt += 1
+
+            try:
+                snapshot = get_depth_snapshot(self.symbol, self.snapshot_limit)
+            except RuntimeError as e:
+                print(f"[Depth] {self.symbol} snapshot failed: {e}")
+                continue
+
+            with self._lock:
+                if not self._running:
+                    break
+
+                self.book.load(snapshot["bids"], snapshot["asks"])
+                self._last_update_id = snapshot["lastUpdateId"]
+
+                buffered = list(self._buffer)
+                self._buffer.clear()
+
+                # snapshot older than the first buffered diff -> retry
+                if not all(self._apply_event(e) for e in buffered):
+                    continue
+
+                self._synced = True
+                self._syncing = False
+                self._publish()
+
+            print(f"[Depth] {self.symbol} synced @ {self._last_update_id}")
+            return
+
+        with self._lock:
+            self._syncing = False
@@ -0,0 +1,280 @@
+# controllers/remote_market.py
+"""
+Tk-side controllers for the process market engine
+
+RemoteMarketController / RemoteOrderBook expose the same attributes and
+listener API as MarketController / OrderBookController, but their state
+comes from the engine's shared memory (controllers/market_engine.py),
+read once per UI frame. Widgets and the chart work unchanged.
+"""
+
+import math
+import time
+
+from api.trade_decoder import Trade
+from controllers.market_controller import MarketController
+from controllers.order_book import OrderBookController
+
+SNAPSHOT_WAIT = 10  # seconds load_snapshot waits for the engine
+LOST_REPORT_S = 5   # at most one "UI missed trades" line per interval
+
+
+def _value(x, current=None):
+    # NaN = not known in the engine yet -> keep what is shown (cache)
+    x = float(x)
+    return current if math.isnan(x) else x
+
+
+class _EngineFeed:
+    """
+    feed= stand-in: the engine streams the symbol once opened
+    """
+
+    def __init__(self, engine, symbol, channel):
+        self.engine = engine
+        self.symbol = symbol
+        self.channel = channel
+        self.on_trade = None
+
+    def start(self):
+        self.engine.send("open", self.symbol, self.channel.names)
+
+    def stop(self):
+        self.engine.close_channel(self.symbol)
+
+
+class RemoteOrderBook(OrderBookController):
+    """
+    Top-N levels published by the engine (no local book, no stream)
+    """
+
+    def __init__(self, symbol, engine, channel, dispatcher=None):
+        super().__init__(symbol, dispatcher=dispatcher)
+        self._engine = engine
+        self._channel = channel
+        self._seq = 0
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._engine.send("book", self.symbol, True)
+
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+        if self._dispatcher is not None:
+            self._dispatcher.cancel(self._dispatch)
+        self._engine.send("book", self.symbol, False)
+        self._listeners.clear()
+
+    def poll(self):
+        """
+        Tk thread, once per frame: new top levels -> listeners
+        """
+        record = self._channel.book
+        if not self._running or record.seq == self._seq:
+            return
+
+        row, seq = record.read()
+        if row is None:
+            return
+        self._seq = seq
+
+        nb, na = int(row["bids"]), int(row["asks"])
+        bids = tuple(zip(row["bid_price"][:nb].tolist(), row["bid_qty"][:nb].tolist()))
+        asks = tuple(zip(row["ask_price"][:na].tolist(), row["ask_qty"][:na].tolist()))
+        self.top = (bids, asks, int(row["update_id"]))
+        self._dispatch()
+
+
+class RemoteMarketController(MarketController):
+    """
+    MarketController fed from the engine's shared memory
+
+    - polls its channel every UI frame (needs a UIDispatcher)
+    - listeners only run when something new arrived (or refresh())
+    - 24h snapshots / refreshes and reconnect backfill happen in the
+      engine; order book and chart klines are requested from it
+    """
+
+    def __init__(self, symbol: str, engine, dispatcher):
+        if dispatcher is None:
+            raise ValueError("RemoteMarketController needs a UIDispatcher")
+
+        symbol = symbol.upper()
+        self.engine = engine
+        self.channel = engine.open_channel(symbol)
+        super().__init__(
+            symbol,
+            dispatcher=dispatcher,
+            feed=_EngineFeed(engine, symbol, self.channel),
+            order_book=RemoteOrderBook(
+                symbol, engine, self.channel, dispatcher=dispatcher
+            ),
+        )
+
+        # trades overwritten in the ring before this side read them
+        self.lost_trades = 0
+        self._lost_unreported = 0
+        self._lost_reported_at = 0.0
+
+        self._trade_seq = 0
+        self._kline_seq = 0
+        self._ticker_seq = 0
+        self._kline_listeners = {}
+        self._dirty = True
+
+    # ==================================================
+    # Observer
+    # ==================================================
+    def refresh(self):
+        self._dirty = True
+        self._notify()
+
+    def _dispatch(self):
+        if self._stopped:
+            return
+
+        changed = self._poll()
+        self.order_book.poll()
+
+        if changed or self._dirty:
+            self._dirty = False
+            super()._dispatch()
+
+        # keep polling: next frame
+        self._dispatcher.request(self._dispatch)
+
+    # ==================================================
+    # Shared memory (Tk thread)
+    # ==================================================
+    def _poll(self) -> bool:
+        changed = self._read_ticker()
+
+        rows, self._trade_seq, lost = self.channel.trades.read_since(self._trade_seq)
+        if lost:
+            self._report_lost(lost)
+        if len(rows):
+            trades = [
+                Trade(p, q, "buy" if buy else "sell", ts, i, tt, et, rt)
+                for p, q, buy, ts, i, tt, et, rt in rows.tolist()
+            ]
+            self._inbox.extend(trades)
+            # queue stage = engine receive -> this frame
+            self._updated_at = trades[-1].recv_time
+            changed = True
+
+        rows, self._kline_seq, _ = self.channel.klines.read_since(self._kline_seq)
+        for row in rows.tolist():
+            self._deliver_kline(*row)
+
+        return changed
+
+    def _report_lost(self, lost):
+        self.lost_trades += lost
+        self._lost_unreported += lost
+
+        now = time.monotonic()
+        if now - self._lost_reported_at < LOST_REPORT_S:
+            return
+        print(
+            f"[Engine] {self.symbol}: UI missed {self._lost_unreported} trades "
+            f"({self.lost_trades} total)"
+        )
+        self._lost_unreported = 0
+        self._lost_reported_at = now
+
+    def _read_ticker(self) -> bool:
+        record = self.channel.ticker
+        if record.seq == self._ticker_seq:
+            return False
+
+        row, seq = record.read()
+        if row is None:
+            return False
+        self._ticker_seq = seq
+
+        last, change, pct, high, low, volume = row.tolist()
+        self.last_price = _value(last, self.last_price)
+        self.price_change_24h = _value(change, self.price_change_24h)
+        self.change_percent_24h = _value(pct, self.change_percent_24h)
+        self.high_24h = _value(high, self.high_24h)
+        self.low_24h = _value(low, self.low_24h)
+        self.volume_24h = _value(volume, self.volume_24h)
+        return True
+
+    def _deliver_kline(self, interval, open_time, o, h, l, c, v, closed, last_id):
+        handlers = self._kline_listeners.get(interval.decode())
+        if not handlers:
+            return
+
+        # same payload shape as the <symbol>@kline_<interval> stream
+        payload = {"k": {
+            "t": open_time, "o": o, "h": h, "l": l, "c": c, "v": v,
+            "x": closed, "L": last_id,
+        }}
+        now = time.time()
+        for handler in handlers:
+            try:
+                handler(payload, now)
+            except Exception as e:
+                print(f"[Market] Kline listener error: {e}")
+
+    # ==================================================
+    # Engine requests
+    # ==================================================
+    def add_kline_listener(self, interval: str, handler) -> bool:
+        if self._stopped:
+            return False
+
+        handlers = self._kline_listeners.setdefault(interval, [])
+        if not handlers:
+            self.engine.send("kline", self.symbol, interval, True)
+        if handler not in handlers:
+            handlers.append(handler)
+        return True
+
+    def remove_kline_listener(self, interval: str, handler):
+        handlers = self._kline_listeners.get(interval, [])
+        if handler in handlers:
+            handlers.remove(handler)
+            if not handlers and not self._stopped:
+                self.engine.send("kline", self.symbol, interval, False)
+
+    def load_snapshot(self):
+        """
+        Ask the engine for a 24h snapshot, wait until it is published
+        (worker thread)
+        """
+        if self._stopped:
+            return
+
+        record = self.channel.ticker
+        seen = record.seq
+        self.engine.send("snapshot", self.symbol)
+
+        deadline = time.time() + SNAPSHOT_WAIT
+        while time.time() < deadline and not self._stopped:
+            if record.seq != seen:
+                row, _ = record.read()
+                if row is not None and not math.isnan(row["high"]):
+                    break
+            time.sleep(0.01)
+
+        self._notify()
+
+    def apply_snapshot(self, data: dict):
+        # local only (last-known cache): the engine refreshes 24h
+        # statistics itself and its next ticker overrides these
+        self._dirty = True
+        super().apply_snapshot(data)
+
+    def start_realtime(self):
+        super().start_realtime()
+        self._notify()
+
+    def stop(self):
+        self._kline_listeners.clear()
+        super().stop()
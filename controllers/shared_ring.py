@@ -0,0 +1,149 @@
+# controllers/shared_ring.py
+"""
+Shared-memory blocks for the process market engine
+
+- SharedRing   : single-writer ring of fixed-size rows (NumPy structured
+                 dtype) with a monotonic sequence number; readers copy
+                 everything newer than the sequence they last saw
+- SharedRecord : ONE row guarded by a seqlock (odd = being written),
+                 readers retry until they get a consistent copy
+
+One writer per block (the engine process), any number of readers, no
+locks across processes. Header = one uint64 in its own cache line.
+"""
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+_HEADER = 64  # bytes, sequence number + padding
+
+
+def _attach(size: int, name: str | None):
+    if name is None:
+        return shared_memory.SharedMemory(create=True, size=size)
+    return shared_memory.SharedMemory(name=name)
+
+
+class _SharedBlock:
+    def __init__(self, dtype, rows: int, name: str | None):
+        self.dtype = np.dtype(dtype)
+        self.owner = name is None
+
+        self._shm = _attach(_HEADER + self.dtype.itemsize * rows, name)
+        self._seq = np.ndarray((1,), np.uint64, buffer=self._shm.buf)
+        self._data = np.ndarray(
+            (rows,), self.dtype, buffer=self._shm.buf, offset=_HEADER
+        )
+        if self.owner:
+            self._seq[0] = 0
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def seq(self) -> int:
+        return int(self._seq[0])
+
+    def close(self):
+        """
+        Detach; the creating side also removes the block
+        """
+        if self._shm is None:
+            return
+
+        # views into the buffer must go before the mapping
+        self._seq = self._data = None
+        self._shm.close()
+        if self.owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._shm = None
+
+
+class SharedRing(_SharedBlock):
+    """
+    Ring of `capacity` rows; seq = rows ever written
+
+    Writes are chunked to `guard` rows and readers never trust the
+    oldest `guard` slots, so a write in progress is never read.
+    """
+
+    def __init__(self, dtype, capacity: int, name: str | None = None):
+        super().__init__(dtype, capacity, name)
+        self.capacity = capacity
+        self.guard = max(1, capacity // 4)
+
+    # ==================================================
+    # Writer
+    # ==================================================
+    def write(self, rows):
+        """
+        Append rows (structured array / list of tuples), oldest first
+        """
+        rows = np.asarray(rows, dtype=self.dtype)
+        cap = self.capacity
+        seq = int(self._seq[0])
+
+        for i in range(0, len(rows), self.guard):
+            chunk = rows[i:i + self.guard]
+            self._data[np.arange(seq, seq + len(chunk)) % cap] = chunk
+            seq += len(chunk)
+            # publish after the rows are in place
+            self._seq[0] = seq
+
+    # ==================================================
+    # Reader
+    # ==================================================
+    def read_since(self, seq: int):
+        """
+        Returns (rows, new_seq, lost): rows written after `seq`
+        (a copy), lost = rows overwritten before they could be read
+        """
+        head = int(self._seq[0])
+        if head == seq:
+            return self._data[:0], seq, 0
+
+        first = max(seq, head - self.capacity + self.guard)
+        rows = self._data[np.arange(first, head) % self.capacity]
+
+        # slots recycled while copying -> drop them
+        valid = int(self._seq[0]) - self.capacity + self.guard
+        if valid > first:
+            rows = rows[valid - first:]
+            first = valid
+
+        return rows, head, first - seq
+
+
+class SharedRecord(_SharedBlock):
+    """
+    Latest value of one row (ticker, order book top, ...)
+    """
+
+    RETRIES = 100
+
+    def __init__(self, dtype, name: str | None = None):
+        super().__init__(dtype, 1, name)
+
+    def write(self, values):
+        seq = int(self._seq[0])
+        self._seq[0] = seq + 1        # odd: write in progress
+        self._data[0] = values
+        self._seq[0] = seq + 2
+
+    def read(self):
+        """
+        (row copy, seq) or (None, seq) if nothing consistent was seen
+        """
+        for _ in range(self.RETRIES):
+            seq = int(self._seq[0])
+            if seq & 1:
+                continue
+            row = self._data[0].copy()
+            if int(self._seq[0]) == seq:
+                return row, seq
+        return None, int(self._seq[0])
@@ -0,0 +1,98 @@
+# controllers/snapshot_refresher.py
+
+import threading
+
+from api.binance_rest import get_24h_tickers
+
+
+class SnapshotRefresher:
+    """
+    Batched 24h snapshot refresh for many MarketControllers
+
+    - ONE /api/v3/ticker/24hr?symbols=[...] request per cycle
+    - results fanned out to each controller's apply_snapshot()
+    - single background thread regardless of symbol count
+      (or a periodic task on the asyncio core, no thread at all)
+    """
+
+    def __init__(self, interval=30, core=None):
+        self.interval = interval
+        self.core = core
+        self._task = None
+
+        self._controllers = {}
+        self._lock = threading.Lock()
+
+        self._running = False
+        self._wake = threading.Event()
+
+    # ==================================================
+    # Public API
+    # ==================================================
+    def add(self, controller):
+        with self._lock:
+            self._controllers[controller.symbol] = controller
+
+    def remove(self, controller):
+        with self._lock:
+            if self._controllers.get(controller.symbol) is controller:
+                del self._controllers[controller.symbol]
+
+    def start(self):
+        if self._running:
+            return
+
+        self._running = True
+        if self.core is not None:
+            self._task = self.core.every(self.interval, self.refresh)
+            return
+
+        threading.Thread(target=self._loop, daemon=True).start()
+
+    def stop(self):
+        self._running = False
+        self._wake.set()
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def refresh_now(self):
+        """
+        Trigger a refresh without waiting for the next cycle
+        """
+        if self.core is not None:
+            self.core.submit(self.refresh)
+            return
+
+        self._wake.set()
+
+    def refresh(self):
+        """
+        Fetch + fan out once (blocking, any thread)
+        """
+        with self._lock:
+            controllers = dict(self._controllers)
+
+        if not controllers:
+            return
+
+        tickers = get_24h_tickers(controllers)
+
+        for symbol, controller in controllers.items():
+            data = tickers.get(symbol)
+            if data is not None:
+                controller.apply_snapshot(data)
+
+    # ==================================================
+    # Internal loop
+    # ==================================================
+    def _loop(self):
+        while self._running:
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"[REST] Snapshot refresh failed: {e}")
+
+            self._wake.wait(self.interval)
+            self._wake.clear()
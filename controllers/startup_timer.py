@@ -0,0 +1,86 @@
+# controllers/startup_timer.py
+
+import time
+
+from config.config import STARTUP_REPORT
+
+
+class StartupTimer:
+    """
+    Time from app start to the first useful frames ([Startup] log)
+
+    imports          : app.py started -> Dashboard imported
+    first paint      : window drawn (sidebar + main area)
+    first price      : a price on screen (last-known cache or REST)
+    chart            : chart panel replaced its placeholder
+    first live price : first websocket trade painted
+
+    Each stage is recorded once; the summary line is printed with the
+    first live price.
+    """
+
+    STAGES = (
+        "imports",
+        "first paint",
+        "first price",
+        "chart",
+        "first live price",
+    )
+
+    def __init__(self, enabled: bool = STARTUP_REPORT):
+        self.enabled = enabled
+        self.started_at = time.perf_counter()
+        self.marks = {}
+
+    def mark(self, stage: str):
+        if stage in self.marks:
+            return
+
+        ms = (time.perf_counter() - self.started_at) * 1000
+        self.marks[stage] = ms
+        if not self.enabled:
+            return
+
+        print(f"[Startup] {stage}: {ms:.0f} ms")
+        if stage == "first live price":
+            print(self.summary())
+
+    def summary(self) -> str:
+        return "[Startup] " + " | ".join(
+            f"{stage} {self.marks[stage]:.0f} ms"
+            for stage in self.STAGES
+            if stage in self.marks
+        )
+
+    def watch(self, controller, dispatcher):
+        """
+        Mark first price / first live price once `controller` painted them
+        """
+        if "first live price" not in self.marks:
+            controller.add_listener(_PriceProbe(self, controller, dispatcher))
+
+
+class _PriceProbe:
+    """
+    One-shot MarketController listener, dropped (winfo_exists) when done
+    """
+
+    def __init__(self, timer, controller, dispatcher):
+        self.timer = timer
+        self.controller = controller
+        self.dispatcher = dispatcher
+        self._done = False
+
+    def winfo_exists(self):
+        return not self._done
+
+    def on_market_update(self):
+        c = self.controller
+        if c.last_price is not None and "first price" not in self.timer.marks:
+            self.dispatcher.after_paint(lambda: self.timer.mark("first price"))
+        if c.last_trade is not None:
+            self.dispatcher.after_paint(lambda: self.timer.mark("first live price"))
+            self._done = True
+
+
+startup = StartupTimer()
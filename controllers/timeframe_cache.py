@@ -0,0 +1,304 @@
+# controllers/timeframe_cache.py
+"""
+Multi-timeframe candle cache (one symbol, one chart)
+
+- one Timeframe per interval: columnar candles + live aggregator +
+  indicator state, created on first use and kept for the chart's life
+- a new timeframe is first derived locally from the loaded lower
+  timeframes (complete buckets only, NumPy reduceat); only what they
+  do not cover comes from the kline cache (SQLite first, REST for gaps)
+- every loaded timeframe is fed by the same trades, so switching back
+  is instant: closed candles queued meanwhile are folded in on show
+"""
+
+import numpy as np
+
+from controllers.candle_aggregator import CandleAggregator
+from controllers.candle_buffer import (
+    CandleBuffer, ColumnarRingBuffer, MS_PER_DAY, ms_to_datenum
+)
+from controllers.candle_lod import bucket_starts, aggregate
+from controllers.indicators import IndicatorEngine
+
+
+class Timeframe:
+    """
+    Candles + live aggregator + indicators for ONE interval
+    """
+
+    def __init__(self, interval: str, capacity: int, indicators=()):
+        self.interval = interval
+        self.aggregator = CandleAggregator(interval)
+        self.step_ms = self.aggregator.interval_ms
+        self.step = self.step_ms / MS_PER_DAY  # date units
+
+        self.candles = CandleBuffer(capacity)
+
+        # indicator values kept in lockstep with the candles
+        self.indicators = IndicatorEngine(indicators)
+        self.lines = None
+        if self.indicators.lines:
+            self.lines = ColumnarRingBuffer(
+                capacity, {name: np.float64 for name in self.indicators.lines}
+            )
+
+        # open times of closed candles built from local trades
+        # (no final exchange kline) -> never persisted as klines
+        self.local = set()
+
+        # last buffer row still open (not folded into the indicator
+        # state); False once a final candle was applied and no newer one
+        self.last_open = True
+
+        self.loaded = False
+        self.loading = False       # history request in flight
+        self.history_done = False  # nothing older to fetch
+
+        # chart view, restored when switching back
+        self.view = None
+        self.follow = True
+
+    # ==================================================
+    # History
+    # ==================================================
+    def load(self, columns: dict, local=()):
+        """
+        Replace the history (CandleBuffer columns, last row = live)
+
+        local: open times of rows not taken from exchange klines
+        """
+        c = self.candles
+        c.clear()
+        if len(columns["open_time"]):
+            c.extend(**columns)
+        self.local = set(map(int, local))
+
+        self.history_done = False
+        self.last_open = True  # continued live below
+        self.seed_indicators()
+
+        # last row is the still-open candle -> continue it live
+        if len(c):
+            self.aggregator.seed(
+                int(c.last("open_time")),
+                float(c.last("open")),
+                float(c.last("high")),
+                float(c.last("low")),
+                float(c.last("close")),
+                float(c.last("volume")),
+            )
+
+    def prepend_klines(self, klines) -> int:
+        """
+        Older REST-style rows in front, indicators re-seeded
+        """
+        added = self.candles.prepend_klines(klines)
+        if added:
+            self.seed_indicators()
+        return added
+
+    def seed_indicators(self):
+        """
+        Vectorized pass over the whole buffer (last candle committed
+        unless it is still open)
+        """
+        if self.lines is None:
+            return
+
+        c = self.candles
+        self.lines.clear()
+        if len(c):
+            self.lines.extend(**self.indicators.seed(
+                c.open_time,
+                c.open,
+                c.high,
+                c.low,
+                c.close,
+                c.volume,
+                live=self.last_open,
+            ))
+
+    # ==================================================
+    # Live
+    # ==================================================
+    def apply(self, candle, closed=False):
+        """
+        Update the last candle in place or append a new one
+        (the ring buffer drops the oldest beyond `capacity` candles)
+
+        closed=True folds the final candle into the indicator state
+        """
+        c = self.candles
+        if len(c) and candle.open_time == c.last("open_time"):
+            c.update_last_candle(
+                candle.open,
+                candle.high,
+                candle.low,
+                candle.close,
+                candle.volume,
+            )
+            if self.lines is not None:
+                self.lines.update_last(*self.indicators.update(candle))
+        else:
+            c.append_candle(
+                candle.open_time,
+                candle.open,
+                candle.high,
+                candle.low,
+                candle.close,
+                candle.volume,
+            )
+            if self.lines is not None:
+                self.lines.append(*self.indicators.update(candle))
+
+        self.last_open = not closed
+        if closed:
+            self.indicators.commit(candle)
+            if not candle.final:
+                self._mark_local(candle.open_time)
+
+    def _mark_local(self, open_time):
+        local = self.local
+        local.add(int(open_time))
+        if len(local) > self.candles.capacity:
+            # forget candles the ring buffer already dropped
+            first = int(self.candles.open_time[0])
+            self.local = {t for t in local if t >= first}
+
+    def catch_up(self):
+        """
+        Fold everything the aggregator queued since the last drain
+
+        Returns (closed candles, live candle) like CandleAggregator.drain;
+        closed candles corrected by a late final kline count as closed
+        """
+        closed, live = self.aggregator.drain()
+        for candle in closed:
+            self.apply(candle, closed=True)
+        if live:
+            self.apply(live)
+
+        revised = [c for c in self.aggregator.drain_revised() if self.revise(c)]
+        if revised:
+            self.seed_indicators()
+            closed = closed + revised
+        return closed, live
+
+    def revise(self, candle) -> bool:
+        """
+        Overwrite an earlier candle in place (False if not loaded)
+        """
+        c = self.candles
+        i = int(np.searchsorted(c.open_time, candle.open_time))
+        if i >= len(c) or c.open_time[i] != candle.open_time:
+            return False
+
+        c.open[i] = candle.open
+        c.high[i] = candle.high
+        c.low[i] = candle.low
+        c.close[i] = candle.close
+        c.volume[i] = candle.volume
+        if candle.final:
+            self.local.discard(int(candle.open_time))
+        return True
+
+
+class TimeframeCache:
+    """
+    Timeframes of one symbol, lower ones feed higher ones
+    """
+
+    def __init__(self, capacity: int, indicators=()):
+        self.capacity = capacity
+        self.indicator_specs = indicators
+
+        self._frames = {}
+        self._live = ()  # loaded timeframes (fed every trade batch)
+
+    def get(self, interval: str) -> Timeframe:
+        tf = self._frames.get(interval)
+        if tf is None:
+            tf = Timeframe(interval, self.capacity, self.indicator_specs)
+            self._frames[interval] = tf
+        return tf
+
+    def load(self, tf: Timeframe, columns: dict, local=()):
+        """
+        Load history and start feeding the timeframe live trades
+        """
+        tf.load(columns, local)
+        if not tf.loaded:
+            tf.loaded = True
+            # copy-on-write: the feeding thread iterates without a lock
+            self._live = self._live + (tf,)
+
+    def add_trades(self, trades):
+        """
+        Trade batch (Trade records): one lock per loaded timeframe
+        """
+        for tf in self._live:
+            tf.aggregator.add_trades(trades)
+
+    # ==================================================
+    # Derivation (higher from lower)
+    # ==================================================
+    def derive(self, interval: str):
+        """
+        History for `interval` built from a loaded lower timeframe
+
+        Returns (columns, complete) or None: complete marks closed
+        buckets made of every lower candle, all exchange klines (safe
+        to persist; a bucket with a locally built candle is not).
+        """
+        step = self.get(interval).step_ms
+
+        # lower timeframes that tile this one; widest coverage wins
+        sources = [
+            tf for tf in self._live
+            if tf.step_ms < step and step % tf.step_ms == 0 and len(tf.candles)
+        ]
+        if not sources:
+            return None
+
+        def first_bucket(tf):
+            first = int(tf.candles.open_time[0])
+            return -(-first // step) * step
+
+        src = min(sources, key=lambda tf: (first_bucket(tf), tf.step_ms))
+        src.catch_up()  # hidden timeframes fold their queued candles lazily
+        c = src.candles
+
+        # skip a leading partial bucket
+        i0 = int(np.searchsorted(c.open_time, first_bucket(src)))
+        if i0 >= len(c):
+            return None
+
+        t = c.open_time[i0:]
+        starts = bucket_starts(t, step)
+        bars = aggregate(
+            t,
+            c.open[i0:],
+            c.high[i0:],
+            c.low[i0:],
+            c.close[i0:],
+            c.volume[i0:],
+            starts,
+        )
+
+        open_time = bars["open_time"] - bars["open_time"] % step
+        complete = bars["count"] == step // src.step_ms
+        if src.local:
+            local = np.isin(t, np.fromiter(src.local, np.int64, len(src.local)))
+            complete &= ~np.logical_or.reduceat(local, starts)
+        complete[-1] = False  # live bucket
+
+        columns = {
+            "open_time": open_time,
+            "x": ms_to_datenum(open_time),
+            "open": bars["open"],
+            "high": bars["high"],
+            "low": bars["low"],
+            "close": bars["close"],
+            "volume": bars["volume"],
+        }
+        return columns, complete
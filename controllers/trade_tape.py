@@ -0,0 +1,49 @@
+# controllers/trade_tape.py
+
+
+class TradeTape:
+    """
+    Preallocated ring buffer of the most recent trades
+
+    - append() is O(1), no allocation (slot list sized once)
+    - seq counts every trade ever appended -> readers can tell
+      how many are new since their last look
+    - latest(n) returns newest first
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("TradeTape capacity must be >= 1")
+
+        self.capacity = capacity
+        self.seq = 0
+
+        self._slots = [None] * capacity
+
+    def __len__(self):
+        return min(self.seq, self.capacity)
+
+    def append(self, trade):
+        self._slots[self.seq % self.capacity] = trade
+        self.seq += 1
+
+    def extend(self, trades):
+        for trade in trades:
+            self.append(trade)
+
+    def latest(self, n: int | None = None):
+        """
+        Up to n newest trades, newest first
+        """
+        seq = self.seq
+        count = min(seq, self.capacity)
+        if n is not None:
+            count = min(count, n)
+
+        slots = self._slots
+        cap = self.capacity
+        return [slots[(seq - 1 - i) % cap] for i in range(count)]
+
+    def clear(self):
+        self._slots = [None] * self.capacity
+        self.seq = 0
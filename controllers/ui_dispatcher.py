@@ -0,0 +1,135 @@
+# controllers/ui_dispatcher.py
+
+import queue
+import threading
+import time
+
+
+class UIDispatcher:
+    """
+    Frame-rate capped bridge between network threads and Tk
+
+    - request(callback) can be called from ANY thread
+    - requests are coalesced: the same callback queued N times
+      between two frames runs only once
+    - pending callbacks are drained on the Tk main loop via after()
+      at most `max_fps` times per second
+    - post(callback, *args) queues a one-shot call (NOT coalesced),
+      e.g. a background REST result handed back to Tk
+    """
+
+    def __init__(self, root, max_fps=30):
+        self.root = root
+        self.max_fps = max_fps
+
+        self._frame_ms = max(1, int(1000 / max_fps))
+
+        # dict keeps insertion order -> callbacks run in request order
+        self._pending = {}
+        self._lock = threading.Lock()
+
+        # one-shot results from background threads / the asyncio core
+        self._posted = queue.SimpleQueue()
+
+        self._running = False
+        self._after_id = None
+
+        # ---- frame stats ----
+        self.frames = 0
+        self.dropped_frames = 0
+        self._last_tick = None
+
+    # ==================================================
+    # Public API
+    # ==================================================
+    def start(self):
+        """
+        Start the frame loop (call from the Tk thread)
+        """
+        if self._running:
+            return
+
+        self._running = True
+        self._after_id = self.root.after(self._frame_ms, self._tick)
+
+    def stop(self):
+        self._running = False
+
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+        with self._lock:
+            self._pending.clear()
+
+    def request(self, callback):
+        """
+        Queue callback for the next frame (thread-safe, coalescing)
+        """
+        with self._lock:
+            self._pending[callback] = None
+
+    def post(self, callback, *args):
+        """
+        Run callback(*args) once on the next frame (thread-safe, FIFO)
+        """
+        self._posted.put((callback, args))
+
+    def after_paint(self, callback):
+        """
+        Run callback once Tk is idle again, i.e. after pending redraws
+        (Tk thread only)
+        """
+        self.root.after_idle(callback)
+
+    def cancel(self, callback):
+        with self._lock:
+            self._pending.pop(callback, None)
+
+    # ==================================================
+    # Frame loop (Tk thread)
+    # ==================================================
+    def _tick(self):
+        if not self._running:
+            return
+
+        start = time.perf_counter()
+        self._count_frame(start)
+
+        # only what was queued before this frame (no starvation)
+        posted = self._posted
+        for _ in range(posted.qsize()):
+            callback, args = posted.get_nowait()
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"[UI] Posted call error: {e}")
+
+        with self._lock:
+            pending = self._pending
+            self._pending = {}
+
+        for callback in pending:
+            try:
+                callback()
+            except Exception as e:
+                print(f"[UI] Dispatch error: {e}")
+
+        # keep the cadence: subtract the time spent in this frame
+        spent_ms = (time.perf_counter() - start) * 1000
+        delay = max(1, int(self._frame_ms - spent_ms))
+        self._after_id = self.root.after(delay, self._tick)
+
+    def _count_frame(self, now):
+        self.frames += 1
+
+        if self._last_tick is not None:
+            # a frame slot with no tick (main loop was busy) = dropped
+            missed = int((now - self._last_tick) * 1000 / self._frame_ms + 0.5) - 1
+            if missed > 0:
+                self.dropped_frames += missed
+
+        self._last_tick = now
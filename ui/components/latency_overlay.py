@@ -0,0 +1,115 @@
+import customtkinter as ctk
+from config.config import (
+    BG_CARD, TEXT_MAIN, TEXT_MUTED, ACCENT, LATENCY_EXPORT_PATH, LATENCY_TRACKING
+)
+from controllers.latency import latency
+
+
+class LatencyOverlay(ctk.CTkFrame):
+    """
+    Debug overlay: exchange -> screen latency per stage
+
+    - p50 / p99 / max in ms, refreshed twice per second
+    - trades are only timed while it is open (unless LATENCY_TRACKING)
+    - Export JSON -> LATENCY_EXPORT_PATH
+    - toggled by the Dashboard (F12)
+    """
+
+    REFRESH_MS = 500
+
+    def __init__(self, parent):
+        super().__init__(parent, fg_color=BG_CARD, corner_radius=14)
+
+        self._running = False
+
+        ctk.CTkLabel(
+            self,
+            text="Latency (ms)",
+            font=ctk.CTkFont(size=14, weight="bold"),
+            text_color=TEXT_MAIN,
+        ).pack(anchor="w", padx=14, pady=(10, 4))
+
+        self.table = ctk.CTkLabel(
+            self,
+            text="",
+            justify="left",
+            font=ctk.CTkFont(family="Courier", size=12),
+            text_color=TEXT_MAIN,
+        )
+        self.table.pack(anchor="w", padx=14)
+
+        row = ctk.CTkFrame(self, fg_color="transparent")
+        row.pack(fill="x", padx=14, pady=(6, 10))
+
+        ctk.CTkButton(
+            row,
+            text="Export JSON",
+            width=100,
+            height=26,
+            fg_color=ACCENT,
+            command=self.export,
+        ).pack(side="left")
+
+        ctk.CTkButton(
+            row,
+            text="Reset",
+            width=60,
+            height=26,
+            fg_color=BG_CARD,
+            border_width=1,
+            border_color=TEXT_MUTED,
+            command=latency.reset,
+        ).pack(side="left", padx=(8, 0))
+
+        self.status = ctk.CTkLabel(
+            self,
+            text="",
+            font=ctk.CTkFont(size=11),
+            text_color=TEXT_MUTED,
+        )
+        self.status.pack(anchor="w", padx=14, pady=(0, 8))
+
+    # ==================================================
+    # Visibility
+    # ==================================================
+    def toggle(self):
+        if self._running:
+            self.hide()
+        else:
+            self.show()
+
+    def show(self):
+        self._running = True
+        latency.enabled = True
+        self.place(relx=1.0, rely=0.0, x=-10, y=10, anchor="ne")
+        self.lift()
+        self._refresh()
+
+    def hide(self):
+        self._running = False
+        latency.enabled = LATENCY_TRACKING
+        self.place_forget()
+
+    # ==================================================
+    # Content
+    # ==================================================
+    def _refresh(self):
+        if not self._running:
+            return
+
+        lines = [f"{'stage':<11}{'p50':>8}{'p99':>8}{'max':>8}{'n':>8}"]
+        for stage, s in latency.snapshot().items():
+            lines.append(
+                f"{stage:<11}{s['p50_ms']:>8.1f}{s['p99_ms']:>8.1f}"
+                f"{s['max_ms']:>8.1f}{s['count']:>8}"
+            )
+
+        self.table.configure(text="\n".join(lines))
+        self.after(self.REFRESH_MS, self._refresh)
+
+    def export(self):
+        try:
+            path = latency.export_json(LATENCY_EXPORT_PATH)
+            self.status.configure(text=f"Saved {path}")
+        except OSError as e:
+            self.status.configure(text=f"Export failed: {e}")
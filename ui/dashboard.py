@@ -1,5 +1,4 @@
 import time
-import threading
 import customtkinter as ctk
 
 from config.config import (
@@ -9,17 +8,41 @@ from config.config import (
     TEXT_MAIN,
     TEXT_MUTED,
     ACCENT,
-    WINDOW_SIZE
+    ACCENT_SOFT,
+    WINDOW_SIZE,
+    UI_MAX_FPS,
+    WATCHLIST,
+    MARKET_POOL_SIZE,
+    MARKET_POOL_PREFILL,
+    SNAPSHOT_REFRESH_INTERVAL,
+    NETWORK_BACKEND,
+    MARKET_ENGINE,
+    KLINE_INTERVAL,
 )
 
+# heavy / optional modules (matplotlib chart, NumPy overview, asyncio
+# core, market engine) are imported where they are first needed, so
+# the window shows before they load
+from api.binance_stream_manager import BinanceStreamManager
+from api.ticker_cache import load_tickers, save_tickers, ticker_of
 from controllers.market_controller import MarketController
+from controllers.market_pool import MarketEntry, MarketPool
+from controllers.snapshot_refresher import SnapshotRefresher
+from controllers.startup_timer import startup
+from controllers.ui_dispatcher import UIDispatcher
 
+from ui.formatting import fmt_price
 from ui.widgets.price_widget import PriceWidget
 from ui.widgets.volume_24h_widget import Volume24hWidget
 from ui.widgets.high_low_24h_widget import HighLow24hWidget
 from ui.widgets.recent_trade_widget import RecentTradeWidget
-from ui.panels.realtime_chart_panel import RealtimeChartPanel
+from ui.panels.market_overview_panel import MarketOverviewPanel
+from ui.panels.order_book_panel import OrderBookPanel
 from ui.components.loading_overlay import LoadingOverlay
+from ui.components.latency_overlay import LatencyOverlay
+
+
+SIDEBAR_REFRESH_MS = 1000
 
 
 class Dashboard(ctk.CTk):
@@ -31,7 +54,49 @@ class Dashboard(ctk.CTk):
         self.title("Crypto Dashboard")
 
         self.market: MarketController | None = None
-        self._loading_start_ts = 0.0
+        self._symbol: str | None = None
+        self._view = None
+        self._painted = False
+
+        # realtime updates -> Tk main loop (max UI_MAX_FPS per second)
+        self.dispatcher = UIDispatcher(self, max_fps=UI_MAX_FPS)
+        self.dispatcher.start()
+
+        # optional worker process owning every symbol's streams / REST
+        self.engine = None
+        if MARKET_ENGINE == "process":
+            from controllers.market_engine import MarketEngine
+            self.engine = MarketEngine()
+            self.engine.start()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # one combined-stream connection for every viewed symbol,
+        # LRU pool keeps controllers + built views alive for fast switching
+        self.net = None
+        self.streams = self._build_streams()
+        self.snapshots = SnapshotRefresher(
+            interval=SNAPSHOT_REFRESH_INTERVAL,
+            core=self.net,
+        )
+        self.pool = MarketPool(MARKET_POOL_SIZE, on_evict=self._evict_market)
+
+        # last-known 24h tickers: sidebar prices + first values of a
+        # new market until its snapshot arrives
+        self._last_known = load_tickers()
+        self._sidebar_buttons = {}
+
+        # sidebar symbols stream from startup (views are built on first
+        # switch); otherwise entries are created when first viewed
+        if MARKET_POOL_PREFILL:
+            for asset in WATCHLIST[:MARKET_POOL_SIZE]:
+                self._get_entry(f"{asset}USDT", prefill=True)
+
+        # one batched 24h ticker request for every pooled symbol
+        self.snapshots.start()
+
+        # all-market table, created + subscribed when first opened
+        self.overview = None
+        self.overview_view = None
 
         # layout
         self.grid_columnconfigure(0, weight=0)
@@ -41,7 +106,45 @@ class Dashboard(ctk.CTk):
         self._build_sidebar()
         self._build_main()
 
-        self.after(150, lambda: self._switch_symbol("BTCUSDT"))
+        # first symbol view right after the window is on screen
+        self.bind("<Map>", self._on_map, add="+")
+
+    def _on_map(self, event):
+        if event.widget is not self or self._painted:
+            return
+        self._painted = True
+        self.dispatcher.after_paint(self._on_first_paint)
+
+    def _on_first_paint(self):
+        startup.mark("first paint")
+        self._switch_symbol("BTCUSDT")
+        startup.watch(self.market, self.dispatcher)
+
+    def _on_close(self):
+        for entry in self.pool.values():
+            self._remember(entry.controller)
+        save_tickers(self._last_known)
+        if self.engine is not None:
+            self.engine.stop()
+        self.destroy()
+
+    def _build_streams(self):
+        """
+        Shared combined stream on the configured network backend
+        """
+        if NETWORK_BACKEND == "asyncio":
+            from api.async_core import AsyncNetworkCore, AsyncStreamManager
+            try:
+                core = AsyncNetworkCore()
+                streams = AsyncStreamManager(core)
+            except RuntimeError as e:
+                print(f"[WS] {e} -> falling back to threads")
+            else:
+                core.start()
+                self.net = core
+                return streams
+
+        return BinanceStreamManager()
 
     # ==================================================
     # Sidebar
@@ -58,8 +161,19 @@ class Dashboard(ctk.CTk):
             text_color=TEXT_MAIN,
         ).pack(pady=(20, 24))
 
-        for sym in ["BTC", "ETH", "SOL", "BNB", "XRP"]:
-            ctk.CTkButton(
+        ctk.CTkButton(
+            self.sidebar,
+            text="  Overview",
+            width=170,
+            height=44,
+            fg_color=ACCENT_SOFT,
+            hover_color=ACCENT,
+            corner_radius=14,
+            command=self._show_overview,
+        ).pack(padx=16, pady=(0, 14))
+
+        for sym in WATCHLIST:
+            button = ctk.CTkButton(
                 self.sidebar,
                 text=f"  {sym}",
                 width=170,
@@ -68,7 +182,33 @@ class Dashboard(ctk.CTk):
                 hover_color=ACCENT,
                 corner_radius=14,
                 command=lambda s=sym: self._switch_symbol(f"{s}USDT"),
-            ).pack(padx=16, pady=6)
+            )
+            button.pack(padx=16, pady=6)
+            self._sidebar_buttons[f"{sym}USDT"] = [button, None]
+
+        self._refresh_sidebar()
+
+    def _refresh_sidebar(self):
+        """
+        Price on each symbol button: live when pooled, else last-known
+        """
+        live = {e.controller.symbol: e.controller for e in self.pool.values()}
+
+        for symbol, item in self._sidebar_buttons.items():
+            button, shown = item
+            market = live.get(symbol)
+            if market is not None and market.last_price is not None:
+                price = market.last_price
+            else:
+                price = float(self._last_known.get(symbol, {}).get("lastPrice", 0))
+
+            asset = symbol[:-len("USDT")]
+            text = f"  {asset}   {fmt_price(price)}" if price else f"  {asset}"
+            if text != shown:
+                button.configure(text=text)
+                item[1] = text
+
+        self.after(SIDEBAR_REFRESH_MS, self._refresh_sidebar)
 
     # ==================================================
     # Main
@@ -78,69 +218,154 @@ class Dashboard(ctk.CTk):
         self.main.grid(row=0, column=1, sticky="nsew", padx=20, pady=20)
 
         self.main.grid_columnconfigure(0, weight=1)
-        self.main.grid_rowconfigure(0, weight=0)  
-        self.main.grid_rowconfigure(1, weight=1)   
-        self.main.grid_rowconfigure(2, weight=0)  
-
-        self.loading = LoadingOverlay(self.main, text="Loading market...")
-        self.loading.place(relx=0, rely=0, relwidth=1, relheight=1)
-        self.loading.hide()
+        self.main.grid_rowconfigure(0, weight=1)
 
+        # F12 -> latency debug overlay
+        self.latency_overlay = LatencyOverlay(self.main)
+        self.bind("<F12>", lambda e: self.latency_overlay.toggle())
 
     # ==================================================
-    # Switch Symbol
+    # Market Overview
     # ==================================================
-    def _switch_symbol(self, symbol: str):
-        self._loading_start_ts = time.time()
-        self.loading.show()
-        self.after(120, lambda: self._load_market(symbol))
+    def _show_overview(self):
+        self._symbol = None
 
-    def _load_market(self, symbol: str):
-        if self.market:
-            self.market.stop()
+        if self.overview_view is None:
+            from controllers.market_overview import MarketOverview
+            self.overview = MarketOverview(
+                dispatcher=self.dispatcher, streams=self.streams
+            )
+            self.overview_view = MarketOverviewPanel(
+                self.main,
+                self.overview,
+                on_select=self._switch_symbol,
+            )
+            self.overview.start()
 
-        for child in self.main.winfo_children():
-            if child is not self.loading:
-                child.destroy()
+        if self._view is not None and self._view is not self.overview_view:
+            self._view.grid_remove()
 
-        self.market = MarketController(symbol)
+        self.overview_view.grid(row=0, column=0, sticky="nsew")
+        self._view = self.overview_view
 
-        threading.Thread(
-            target=self._load_market_bg,
-            daemon=True
-        ).start()
+        self.overview.refresh()
 
-    def _load_market_bg(self):
-        self.market.load_snapshot()
-        self.market.start_realtime()
-        self.market.start_snapshot_refresh(interval=30)
-        self.after(0, self._build_after_load)
-
-    def _build_after_load(self):
-        self._build_price_strip(self.main)
-        self._build_chart(self.main)
-        self._build_bottom_panel(self.main)
+    # ==================================================
+    # Switch Symbol
+    # ==================================================
+    def _switch_symbol(self, symbol: str):
+        self._symbol = symbol
+        start = time.perf_counter()
+
+        # warm: view already built -> just raise it
+        entry = self._get_entry(symbol)
+        warm = entry.view is not None
+        if not warm:
+            self._build_view(entry)
+
+        self._show_view(symbol, entry)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(
+            f"[UI] Switched to {symbol} in {elapsed:.1f} ms "
+            f"({'warm' if warm else 'cold'})"
+        )
 
-        elapsed = time.time() - self._loading_start_ts
-        delay = max(0, int((0.35 - elapsed) * 1000))
-        self.after(delay, self.loading.hide)
+    def _get_entry(self, symbol: str, prefill: bool = False) -> MarketEntry:
+        entry = self.pool.get(symbol)
+        if entry is None:
+            if self.engine is not None:
+                from controllers.remote_market import RemoteMarketController
+
+                # the engine refreshes its own 24h snapshots
+                market = RemoteMarketController(
+                    symbol,
+                    self.engine,
+                    dispatcher=self.dispatcher,
+                )
+                market.start_realtime()
+            else:
+                market = MarketController(
+                    symbol,
+                    dispatcher=self.dispatcher,
+                    streams=self.streams,
+                )
+                market.start_realtime()
+
+            # last-known values until the first snapshot arrives
+            cached = self._last_known.get(symbol)
+            if cached is not None:
+                market.apply_snapshot(cached)
+
+            if self.engine is None:
+                # batched refreshes; a market added later fetches its
+                # own first snapshot instead of waiting for the cycle
+                self.snapshots.add(market)
+                if not prefill:
+                    market.submit(market.load_snapshot)
+
+            entry = MarketEntry(market)
+            self.pool.put(symbol, entry)
+        return entry
+
+    def _remember(self, market):
+        ticker = ticker_of(market)
+        if ticker is not None:
+            self._last_known[market.symbol] = ticker
+
+    def _evict_market(self, symbol: str, entry: MarketEntry):
+        self._remember(entry.controller)
+        self.snapshots.remove(entry.controller)
+        entry.controller.stop()
+        if entry.view is not None:
+            if entry.view is self._view:
+                self._view = None
+            entry.view.destroy()
+
+    def _build_view(self, entry: MarketEntry):
+        """
+        Widgets at once, data as it arrives: nothing here waits on REST
+        """
+        market = entry.controller
+
+        view = ctk.CTkFrame(self.main, fg_color="transparent")
+        view.grid_columnconfigure(0, weight=1)
+        view.grid_columnconfigure(1, weight=0)
+        view.grid_rowconfigure(0, weight=0)
+        view.grid_rowconfigure(1, weight=1)
+
+        self._build_price_strip(view, market)
+        self._build_chart(view, market)
+        self._build_side_panel(view, market)
+
+        entry.view = view
+
+    def _show_view(self, symbol: str, entry: MarketEntry):
+        if self._view is not None and self._view is not entry.view:
+            self._view.grid_remove()
+
+        entry.view.grid(row=0, column=0, sticky="nsew")
+        self._view = entry.view
+        self.market = entry.controller
+
+        self.market.refresh()
+        self.market.order_book.refresh()
 
     # ==================================================
     # Price Strip
     # ==================================================
-    def _build_price_strip(self, parent):
+    def _build_price_strip(self, parent, market):
         strip = ctk.CTkFrame(parent, fg_color="transparent")
-        strip.grid(row=0, column=0, sticky="ew", pady=(0, 20))
+        strip.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 20))
         strip.grid_columnconfigure((0, 1, 2), weight=1)
 
-        PriceWidget(strip, self.market).grid(row=0, column=0, sticky="ew", padx=8)
-        HighLow24hWidget(strip, self.market).grid(row=0, column=1, sticky="ew", padx=8)
-        Volume24hWidget(strip, self.market).grid(row=0, column=2, sticky="ew", padx=8)
+        PriceWidget(strip, market).grid(row=0, column=0, sticky="ew", padx=8)
+        HighLow24hWidget(strip, market).grid(row=0, column=1, sticky="ew", padx=8)
+        Volume24hWidget(strip, market).grid(row=0, column=2, sticky="ew", padx=8)
 
     # ==================================================
     # Chart
     # ==================================================
-    def _build_chart(self, parent):
+    def _build_chart(self, parent, market):
         chart = ctk.CTkFrame(parent, fg_color=BG_PANEL, corner_radius=22)
         chart.grid(row=1, column=0, sticky="nsew", pady=(0,0))
         chart.grid_columnconfigure(0, weight=1)
@@ -149,30 +374,74 @@ class Dashboard(ctk.CTk):
         body = ctk.CTkFrame(chart, fg_color=BG_CARD, corner_radius=16)
         body.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
 
+        # placeholder until matplotlib + history are loaded off the Tk thread
+        placeholder = LoadingOverlay(body, text="Loading chart")
+        placeholder.show()
+
+        market.submit(
+            self._prefetch_chart,
+            market.symbol,
+            on_done=lambda klines: self._mount_chart(body, placeholder, market, klines),
+            on_error=lambda e: self._chart_failed(placeholder, e),
+        )
+
+    @staticmethod
+    def _prefetch_chart(symbol):
+        # worker thread; the first call also imports matplotlib + TkAgg
+        from ui.panels.realtime_chart_panel import prefetch_history
+        return prefetch_history(symbol, KLINE_INTERVAL)
+
+    def _mount_chart(self, body, placeholder, market, klines):
+        if not body.winfo_exists():
+            # evicted while loading
+            return
+
+        from ui.panels.realtime_chart_panel import RealtimeChartPanel
+
         RealtimeChartPanel(
             body,
-            controller=self.market,
-            interval="1h",
+            controller=market,
+            interval=KLINE_INTERVAL,
+            klines=klines,
         ).pack(fill="both", expand=True)
 
+        placeholder.hide()
+        placeholder.destroy()
+        startup.mark("chart")
+
+    def _chart_failed(self, placeholder, exc):
+        print(f"[Chart] History load failed: {exc}")
+        if placeholder.winfo_exists():
+            placeholder.hide()
+            placeholder.label.configure(text="Chart unavailable")
+            placeholder.sub.configure(text=str(exc)[:60])
+            placeholder.place(relx=0, rely=0, relwidth=1, relheight=1)
+
     # ==================================================
-    # Bottom Panel (Recent Trades ONLY)
+    # Side Panel (Order Book + Recent Trades tape)
     # ==================================================
-    def _build_bottom_panel(self, parent):
+    def _build_side_panel(self, parent, market):
         panel = ctk.CTkFrame(
             parent,
             fg_color=BG_PANEL,
             corner_radius=22,
-            height=120   
+            width=320
         )
-        panel.grid(row=2, column=0, sticky="ew", pady=(10, 0))
+        panel.grid(row=1, column=1, sticky="ns", padx=(16, 0))
         panel.grid_propagate(False)
 
         panel.grid_columnconfigure(0, weight=1)
+        panel.grid_rowconfigure(0, weight=1)
+        panel.grid_rowconfigure(1, weight=1)
+
+        OrderBookPanel(
+            panel,
+            controller=market,
+        ).grid(row=0, column=0, sticky="nsew", padx=12, pady=(12, 6))
 
         RecentTradeWidget(
             panel,
-            controller=self.market,
-        ).grid(row=0, column=0, sticky="nsew", padx=20, pady=16)
+            controller=market,
+        ).grid(row=1, column=0, sticky="nsew", padx=12, pady=(6, 12))
 
 
@@ -0,0 +1,20 @@
+# ui/formatting.py
+
+import math
+
+
+def fmt_price(price):
+    """
+    Price text with the precision its magnitude needs
+
+    2 decimals from 100, 4 from 1, below that 4 significant digits
+    (0.1234, 0.01234, 0.00001234), so every view of a symbol matches
+    """
+    if price >= 100:
+        return f"{price:,.2f}"
+    if price >= 1:
+        return f"{price:,.4f}"
+    if price <= 0:
+        return f"{price:.4f}"
+    decimals = 3 - math.floor(math.log10(price))
+    return f"{price:.{decimals}f}"
@@ -0,0 +1,218 @@
+# ui/panels/candlestick_renderer.py
+
+import numpy as np
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.lines import Line2D
+from matplotlib.patches import Rectangle
+
+
+class CandlestickRenderer:
+    """
+    Vectorized candlestick + volume renderer
+
+    - Wicks  : ONE LineCollection
+    - Bodies : ONE PolyCollection
+    - Volume : ONE PolyCollection
+    - All geometry is built from NumPy arrays -> 3 artists for N candles
+    - The LAST (live) candle is drawn with its own 3 artists so it can
+      be updated in place without rebuilding the collections
+    """
+
+    def __init__(self, ax_price, ax_volume, bull, bear,
+                 wick_width=1.2, volume_alpha=0.9):
+        self.ax_price = ax_price
+        self.ax_volume = ax_volume
+
+        self.bull = bull
+        self.bear = bear
+        self._bull_rgba = np.array(to_rgba(bull))
+        self._bear_rgba = np.array(to_rgba(bear))
+        self.wick_width = wick_width
+        self.volume_alpha = volume_alpha
+
+        self.wicks = None
+        self.bodies = None
+        self.volume_bars = None
+
+        # live candle artists
+        self.live_wick = None
+        self.live_body = None
+        self.live_volume = None
+        self._live_x = None
+        self._width = None
+
+    # ==================================================
+    # Geometry (pure NumPy)
+    # ==================================================
+    @staticmethod
+    def wick_segments(x, highs, lows):
+        """
+        (N, 2, 2) array: [[x, low], [x, high]] per candle
+        """
+        segs = np.empty((len(x), 2, 2))
+        segs[:, 0, 0] = x
+        segs[:, 1, 0] = x
+        segs[:, 0, 1] = lows
+        segs[:, 1, 1] = highs
+        return segs
+
+    @staticmethod
+    def box_verts(x, bottoms, tops, width):
+        """
+        (N, 4, 2) array of rectangles centered on x
+        """
+        half = width / 2
+        left = x - half
+        right = x + half
+
+        verts = np.empty((len(x), 4, 2))
+        verts[:, 0, 0] = left
+        verts[:, 1, 0] = left
+        verts[:, 2, 0] = right
+        verts[:, 3, 0] = right
+        verts[:, 0, 1] = bottoms
+        verts[:, 1, 1] = tops
+        verts[:, 2, 1] = tops
+        verts[:, 3, 1] = bottoms
+        return verts
+
+    def colors(self, opens, closes):
+        """
+        (N, 4) RGBA array (avoids per-candle color string parsing)
+        """
+        up = (closes >= opens)[:, None]
+        return np.where(up, self._bull_rgba, self._bear_rgba)
+
+    # ==================================================
+    # Draw
+    # ==================================================
+    def draw(self, x, opens, highs, lows, closes, volumes, width):
+        """
+        Add candle + volume collections to the axes
+
+        x is in matplotlib date units, all inputs are 1-D arrays
+        of equal length. Axes are expected to be cleared by caller.
+        """
+        x = np.asarray(x, dtype=float)
+        opens = np.asarray(opens, dtype=float)
+        highs = np.asarray(highs, dtype=float)
+        lows = np.asarray(lows, dtype=float)
+        closes = np.asarray(closes, dtype=float)
+        volumes = np.asarray(volumes, dtype=float)
+
+        self._width = width
+
+        # closed candles -> collections, last candle -> live artists
+        hx = x[:-1]
+        ho, hh, hl, hc, hv = (
+            opens[:-1], highs[:-1], lows[:-1], closes[:-1], volumes[:-1]
+        )
+        colors = self.colors(ho, hc)
+
+        self.wicks = LineCollection(
+            self.wick_segments(hx, hh, hl),
+            colors=colors,
+            linewidths=self.wick_width,
+        )
+
+        self.bodies = PolyCollection(
+            self.box_verts(
+                hx,
+                np.minimum(ho, hc),
+                np.maximum(ho, hc),
+                width,
+            ),
+            facecolors=colors,
+            edgecolors=colors,
+        )
+
+        self.volume_bars = PolyCollection(
+            self.box_verts(hx, np.zeros_like(hv), hv, width),
+            facecolors=colors,
+            edgecolors="none",
+            alpha=self.volume_alpha,
+        )
+
+        self.ax_price.add_collection(self.wicks)
+        self.ax_price.add_collection(self.bodies)
+        self.ax_volume.add_collection(self.volume_bars)
+
+        self.live_wick = Line2D([], [], linewidth=self.wick_width)
+        self.live_body = Rectangle((0, 0), width, 0)
+        self.live_volume = Rectangle((0, 0), width, 0, alpha=self.volume_alpha)
+        self.ax_price.add_line(self.live_wick)
+        self.ax_price.add_patch(self.live_body)
+        self.ax_volume.add_patch(self.live_volume)
+
+        # collections do not autoscale -> set limits explicitly
+        if len(x):
+            self.autoscale(lows.min(), highs.max(), volumes.max())
+
+            self._live_x = x[-1]
+            self.update_live(
+                opens[-1], highs[-1], lows[-1], closes[-1], volumes[-1]
+            )
+
+    def autoscale(self, low, high, volume):
+        """
+        Fit the y-limits to a price range + max volume
+        """
+        pad = (high - low) * 0.05 or high * 0.001 or 1.0
+        self.ax_price.set_ylim(low - pad, high + pad)
+        self.ax_volume.set_ylim(0, (volume or 1.0) * 1.05)
+
+    # ==================================================
+    # Live candle (O(1) per update)
+    # ==================================================
+    @property
+    def live_artists(self):
+        """
+        Artists changed by update_live() (animated when blitting)
+        """
+        if self.live_wick is None:
+            return ()
+        return (self.live_wick, self.live_body, self.live_volume)
+
+    def update_live(self, open, high, low, close, volume):
+        """
+        Move the live candle artists; grows y-limits if needed
+
+        Returns True when the y-limits changed (static layer is stale)
+        """
+        if self.live_wick is None or self._live_x is None:
+            return False
+
+        x = self._live_x
+        color = self.bull if close >= open else self.bear
+
+        self.live_wick.set_data([x, x], [low, high])
+        self.live_wick.set_color(color)
+
+        self.live_body.set_bounds(
+            x - self._width / 2,
+            min(open, close),
+            self._width,
+            abs(close - open),
+        )
+        self.live_body.set_facecolor(color)
+        self.live_body.set_edgecolor(color)
+
+        self.live_volume.set_bounds(x - self._width / 2, 0, self._width, volume)
+        self.live_volume.set_facecolor(color)
+        self.live_volume.set_edgecolor("none")
+
+        rescaled = False
+
+        # grow with headroom: every rescale means a full redraw
+        lo, hi = self.ax_price.get_ylim()
+        if high > hi or low < lo:
+            pad = (hi - lo) * 0.25
+            self.ax_price.set_ylim(min(lo, low - pad), max(hi, high + pad))
+            rescaled = True
+
+        if volume > self.ax_volume.get_ylim()[1]:
+            self.ax_volume.set_ylim(0, volume * 1.5)
+            rescaled = True
+
+        return rescaled
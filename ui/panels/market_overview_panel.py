@@ -0,0 +1,313 @@
+# ui/panels/market_overview_panel.py
+
+import customtkinter as ctk
+from config.config import (
+    BG_CARD, BG_PANEL, TEXT_MAIN, TEXT_MUTED, ACCENT, GREEN, RED
+)
+from ui.formatting import fmt_price
+
+
+HOVER = "#222A33"
+
+# column: (sort key, header, anchor, x as fraction of the width)
+COLUMNS = (
+    ("symbol", "Symbol", "nw", 0.0),
+    ("last", "Last", "ne", 0.45),
+    ("change", "24h %", "ne", 0.70),
+    ("volume", "Volume (24h)", "ne", 1.0),
+)
+
+VOLUME_FILTERS = {
+    "All": 0.0,
+    "> 1M": 1e6,
+    "> 10M": 1e7,
+    "> 100M": 1e8,
+}
+
+# label: (min |24h change| %, direction: 1 gainers, -1 losers, 0 both)
+CHANGE_FILTERS = {
+    "All": (0.0, 0),
+    "Gainers": (0.0, 1),
+    "Losers": (0.0, -1),
+    "|24h| > 5%": (5.0, 0),
+    "|24h| > 10%": (10.0, 0),
+}
+
+
+def _fmt_volume(volume):
+    for unit, div in (("B", 1e9), ("M", 1e6), ("K", 1e3)):
+        if volume >= div:
+            return f"{volume / div:,.2f}{unit}"
+    return f"{volume:,.0f}"
+
+
+class MarketOverviewPanel(ctk.CTkFrame):
+    """
+    All-market table (virtualized)
+
+    - reads MarketOverview (columnar, sorted / filtered in NumPy)
+    - ONE canvas with one multi-line text item per column: only the
+      visible rows are formatted, so 400 or 4000 symbols cost the same
+    - click a column header to sort, click a row -> on_select(symbol)
+    """
+
+    def __init__(self, parent, overview, on_select=None):
+        super().__init__(parent, fg_color=BG_PANEL, corner_radius=22)
+
+        self.overview = overview
+        self.overview.add_listener(self)
+        self.on_select = on_select
+
+        self.sort = "volume"
+        self.descending = True
+        self.min_volume = 0.0
+        self.min_change, self.direction = CHANGE_FILTERS["All"]
+
+        self._top = 0          # first visible row (index into the order)
+        self._visible = 1      # rows that fit the canvas
+        self._width = 1
+        self._symbols = []     # symbols currently on screen
+
+        self.font = ctk.CTkFont(family="Courier", size=13)
+        self._line = 20
+
+        # ---------- toolbar ----------
+        bar = ctk.CTkFrame(self, fg_color="transparent")
+        bar.pack(fill="x", padx=20, pady=(16, 8))
+
+        ctk.CTkLabel(
+            bar,
+            text="Market Overview",
+            font=ctk.CTkFont(size=18, weight="bold"),
+            text_color=TEXT_MAIN
+        ).pack(side="left")
+
+        self.count_label = ctk.CTkLabel(
+            bar, text="", font=ctk.CTkFont(size=12), text_color=TEXT_MUTED
+        )
+        self.count_label.pack(side="left", padx=12)
+
+        ctk.CTkOptionMenu(
+            bar,
+            values=list(VOLUME_FILTERS),
+            width=100,
+            command=self._on_volume_filter,
+        ).pack(side="right")
+
+        ctk.CTkOptionMenu(
+            bar,
+            values=list(CHANGE_FILTERS),
+            width=110,
+            command=self._on_change_filter,
+        ).pack(side="right", padx=(8, 0))
+
+        self.search = ctk.CTkEntry(bar, placeholder_text="Filter symbol", width=160)
+        self.search.pack(side="right", padx=8)
+        self.search.bind("<KeyRelease>", lambda e: self._reset_scroll())
+
+        # ---------- table ----------
+        body = ctk.CTkFrame(self, fg_color=BG_CARD, corner_radius=16)
+        body.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+
+        body.grid_columnconfigure(0, weight=1)
+        body.grid_rowconfigure(1, weight=1)
+
+        self.header = ctk.CTkCanvas(body, height=24, bg=BG_CARD, highlightthickness=0)
+        self.header.grid(row=0, column=0, sticky="ew", padx=(16, 0), pady=(10, 0))
+        self.header.bind("<Button-1>", self._on_header_click)
+
+        self.canvas = ctk.CTkCanvas(body, bg=BG_CARD, highlightthickness=0)
+        self.canvas.grid(row=1, column=0, sticky="nsew", padx=(16, 0), pady=(4, 10))
+
+        self.scrollbar = ctk.CTkScrollbar(body, command=self._on_scrollbar)
+        self.scrollbar.grid(row=1, column=1, sticky="ns", padx=6, pady=10)
+
+        self._hover = self.canvas.create_rectangle(
+            0, 0, 0, 0, fill=HOVER, width=0
+        )
+
+        def text(color, anchor):
+            return self.canvas.create_text(
+                0, 0, text="", fill=color, font=self.font, anchor=anchor
+            )
+
+        self._col_symbol = text(TEXT_MAIN, "nw")
+        self._col_last = text(TEXT_MAIN, "ne")
+        self._col_up = text(GREEN, "ne")
+        self._col_down = text(RED, "ne")
+        self._col_volume = text(TEXT_MUTED, "ne")
+
+        header_font = ctk.CTkFont(size=12, weight="bold")
+        self._headers = {
+            key: self.header.create_text(
+                0, 4, text=title, fill=TEXT_MUTED,
+                font=header_font, anchor=anchor
+            )
+            for key, title, anchor, _ in COLUMNS
+        }
+
+        self.canvas.bind("<Configure>", self._on_resize)
+        self.canvas.bind("<Motion>", self._on_motion)
+        self.canvas.bind("<Leave>", lambda e: self.canvas.coords(self._hover, 0, 0, 0, 0))
+        self.canvas.bind("<Button-1>", self._on_click)
+        # Windows / macOS wheel + X11 buttons
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", lambda e: self._scroll(-3))
+        self.canvas.bind("<Button-5>", lambda e: self._scroll(3))
+
+        self._update_headers()
+
+    # ==================================================
+    # Layout
+    # ==================================================
+    def _col_x(self, frac, anchor):
+        x = frac * self._width
+        return x - 8 if anchor == "ne" else x + 8
+
+    def _on_resize(self, event):
+        self._width = max(1, event.width)
+        self._line = self.font.metrics("linespace") or 20
+        self._visible = max(1, event.height // self._line)
+
+        x = {key: self._col_x(frac, anchor) for key, _, anchor, frac in COLUMNS}
+        self.canvas.coords(self._col_symbol, x["symbol"], 0)
+        self.canvas.coords(self._col_last, x["last"], 0)
+        self.canvas.coords(self._col_up, x["change"], 0)
+        self.canvas.coords(self._col_down, x["change"], 0)
+        self.canvas.coords(self._col_volume, x["volume"], 0)
+        for key, item in self._headers.items():
+            self.header.coords(item, x[key], 4)
+
+        self._render()
+
+    def _update_headers(self):
+        arrow = " ▼" if self.descending else " ▲"
+        for key, title, _, _ in COLUMNS:
+            self.header.itemconfigure(
+                self._headers[key],
+                text=title + (arrow if key == self.sort else ""),
+                fill=ACCENT if key == self.sort else TEXT_MUTED,
+            )
+
+    # ==================================================
+    # Sort / filter
+    # ==================================================
+    def _on_header_click(self, event):
+        # nearest column boundary -> sort key
+        frac = event.x / self._width
+        key = min(COLUMNS, key=lambda c: abs(c[3] - frac))[0]
+
+        if key == self.sort:
+            self.descending = not self.descending
+        else:
+            self.sort = key
+            self.descending = key != "symbol"
+
+        self._update_headers()
+        self._reset_scroll()
+
+    def _on_volume_filter(self, choice):
+        self.min_volume = VOLUME_FILTERS[choice]
+        self._reset_scroll()
+
+    def _on_change_filter(self, choice):
+        self.min_change, self.direction = CHANGE_FILTERS[choice]
+        self._reset_scroll()
+
+    def _reset_scroll(self):
+        self._top = 0
+        self._render()
+
+    # ==================================================
+    # Scrolling
+    # ==================================================
+    def _on_wheel(self, event):
+        self._scroll(-3 if event.delta > 0 else 3)
+
+    def _on_scrollbar(self, action, value, unit=None):
+        total = len(self._order())
+        if action == "moveto":
+            self._top = int(float(value) * total)
+        elif action == "scroll":
+            step = self._visible if unit == "pages" else 1
+            self._top += int(value) * step
+        self._render()
+
+    def _scroll(self, rows):
+        self._top += rows
+        self._render()
+
+    # ==================================================
+    # Rows
+    # ==================================================
+    def _order(self):
+        return self.overview.query(
+            sort=self.sort,
+            descending=self.descending,
+            text=self.search.get() or "",
+            min_volume=self.min_volume,
+            min_change=self.min_change,
+            direction=self.direction,
+        )
+
+    def _row_at(self, y):
+        row = int(y // self._line)
+        if 0 <= row < len(self._symbols):
+            return row
+        return None
+
+    def _on_motion(self, event):
+        row = self._row_at(event.y)
+        if row is None:
+            self.canvas.coords(self._hover, 0, 0, 0, 0)
+            return
+        y = row * self._line
+        self.canvas.coords(self._hover, 0, y, self._width, y + self._line)
+
+    def _on_click(self, event):
+        row = self._row_at(event.y)
+        if row is not None and callable(self.on_select):
+            self.on_select(self._symbols[row])
+
+    # ==================================================
+    # Realtime update (once per frame via dispatcher)
+    # ==================================================
+    def on_overview_update(self):
+        self._render()
+
+    def _render(self):
+        order = self._order()
+        total = len(order)
+
+        # clamp the scroll position
+        self._top = max(0, min(self._top, total - self._visible))
+        ids = order[self._top:self._top + self._visible]
+        rows = self.overview.rows(ids)
+
+        symbols, last, up, down, volume = [], [], [], [], []
+        for symbol, price, change, vol in rows:
+            symbols.append(symbol)
+            last.append(fmt_price(price))
+            if change >= 0:
+                up.append(f"+{change:.2f}%")
+                down.append("")
+            else:
+                up.append("")
+                down.append(f"{change:.2f}%")
+            volume.append(_fmt_volume(vol))
+
+        self._symbols = symbols
+
+        canvas = self.canvas
+        canvas.itemconfigure(self._col_symbol, text="\n".join(symbols))
+        canvas.itemconfigure(self._col_last, text="\n".join(last))
+        canvas.itemconfigure(self._col_up, text="\n".join(up))
+        canvas.itemconfigure(self._col_down, text="\n".join(down))
+        canvas.itemconfigure(self._col_volume, text="\n".join(volume))
+
+        self.count_label.configure(text=f"{total} / {len(self.overview)} pairs")
+        if total:
+            self.scrollbar.set(self._top / total,
+                               (self._top + len(ids)) / total)
+        else:
+            self.scrollbar.set(0, 1)
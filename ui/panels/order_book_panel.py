@@ -0,0 +1,165 @@
+# ui/panels/order_book_panel.py
+
+import customtkinter as ctk
+from config.config import BG_CARD, TEXT_MAIN, TEXT_MUTED, GREEN, RED
+from ui.formatting import fmt_price
+
+
+# depth bars behind the levels (muted market colours)
+BID_BAR = "#17291C"
+ASK_BAR = "#2E1819"
+
+PRICE_X = 0  # qty is right-aligned to the canvas width (_on_resize)
+
+
+class OrderBookPanel(ctk.CTkFrame):
+    """
+    Top-N order book ladder (asks above, bids below, spread between)
+
+    - reads OrderBookController.top (published on the websocket thread)
+    - ONE canvas: 4 multi-line text items + 1 spread label +
+      2N depth bars -> fixed Tk cost per frame
+    - depth bars show cumulative size from the best level outwards
+    """
+
+    def __init__(self, parent, controller):
+        super().__init__(parent, fg_color=BG_CARD, corner_radius=18)
+
+        self.book = controller.order_book
+        self.book.add_listener(self)
+
+        self.levels = self.book.levels
+        self._update_id = None
+        self._width = 1
+        self._line = 16
+
+        # ---------- title ----------
+        ctk.CTkLabel(
+            self,
+            text="Order Book",
+            font=ctk.CTkFont(size=15, weight="bold"),
+            text_color=TEXT_MAIN
+        ).pack(anchor="w", padx=18, pady=(14, 4))
+
+        self.font = ctk.CTkFont(family="Courier", size=12)
+
+        # ---------- ladder ----------
+        self.canvas = ctk.CTkCanvas(self, bg=BG_CARD, highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True, padx=18, pady=(2, 16))
+
+        # bars first -> drawn below the text
+        self._ask_bars = [
+            self.canvas.create_rectangle(0, 0, 0, 0, fill=ASK_BAR, width=0)
+            for _ in range(self.levels)
+        ]
+        self._bid_bars = [
+            self.canvas.create_rectangle(0, 0, 0, 0, fill=BID_BAR, width=0)
+            for _ in range(self.levels)
+        ]
+
+        def text(x, color, anchor="nw"):
+            return self.canvas.create_text(
+                x, 0, text="", fill=color, font=self.font, anchor=anchor
+            )
+
+        self._ask_price = text(PRICE_X, RED)
+        self._ask_qty = text(0, TEXT_MUTED, "ne")
+        self._bid_price = text(PRICE_X, GREEN)
+        self._bid_qty = text(0, TEXT_MUTED, "ne")
+        self._spread = text(PRICE_X, TEXT_MAIN)
+
+        self.canvas.bind("<Configure>", self._on_resize)
+
+        self.book.start()
+
+    # ==================================================
+    # Layout
+    # ==================================================
+    def _on_resize(self, event):
+        self._width = max(1, event.width)
+        self._line = self.font.metrics("linespace") or 16
+
+        line = self._line
+        n = self.levels
+        self.canvas.coords(self._ask_price, PRICE_X, 0)
+        self.canvas.coords(self._ask_qty, self._width, 0)
+        self.canvas.coords(self._spread, PRICE_X, n * line)
+        self.canvas.coords(self._bid_price, PRICE_X, (n + 1) * line)
+        self.canvas.coords(self._bid_qty, self._width, (n + 1) * line)
+
+        self._update_id = None
+        self.on_order_book_update()
+
+    # ==================================================
+    # Realtime update (once per frame via dispatcher)
+    # ==================================================
+    def on_order_book_update(self):
+        bids, asks, update_id = self.book.top
+        if update_id is None or update_id == self._update_id:
+            return
+        self._update_id = update_id
+
+        n = self.levels
+        line = self._line
+        canvas = self.canvas
+
+        # cumulative depth, scaled to the deeper side
+        bid_cum = self._cumulative(bids)
+        ask_cum = self._cumulative(asks)
+        total = max(bid_cum[-1] if bid_cum else 0,
+                    ask_cum[-1] if ask_cum else 0) or 1
+        scale = self._width / total
+
+        # asks: best level at the bottom, next to the spread
+        pad = n - len(asks)
+        canvas.itemconfigure(
+            self._ask_price,
+            text="\n" * pad + "\n".join(fmt_price(p) for p, _ in reversed(asks))
+        )
+        canvas.itemconfigure(
+            self._ask_qty,
+            text="\n" * pad + "\n".join(f"{q:.4f}" for _, q in reversed(asks))
+        )
+        for i, bar in enumerate(self._ask_bars):
+            if i < len(asks):
+                y = (n - 1 - i) * line
+                canvas.coords(bar, self._width - ask_cum[i] * scale, y,
+                              self._width, y + line)
+            else:
+                canvas.coords(bar, 0, 0, 0, 0)
+
+        # bids: best level at the top
+        top = (n + 1) * line
+        canvas.itemconfigure(
+            self._bid_price, text="\n".join(fmt_price(p) for p, _ in bids)
+        )
+        canvas.itemconfigure(
+            self._bid_qty, text="\n".join(f"{q:.4f}" for _, q in bids)
+        )
+        for i, bar in enumerate(self._bid_bars):
+            if i < len(bids):
+                y = top + i * line
+                canvas.coords(bar, self._width - bid_cum[i] * scale, y,
+                              self._width, y + line)
+            else:
+                canvas.coords(bar, 0, 0, 0, 0)
+
+        # spread
+        if bids and asks:
+            best_bid, best_ask = bids[0][0], asks[0][0]
+            spread = best_ask - best_bid
+            mid = (best_ask + best_bid) / 2
+            canvas.itemconfigure(
+                self._spread,
+                text=f"{fmt_price(mid)}  spread {spread:.4g} "
+                     f"({spread / mid * 10_000:.1f} bp)"
+            )
+
+    @staticmethod
+    def _cumulative(levels):
+        out = []
+        acc = 0.0
+        for _, qty in levels:
+            acc += qty
+            out.append(acc)
+        return out
@@ -1,12 +1,35 @@
 import customtkinter as ctk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import PolyCollection
 from matplotlib.figure import Figure
-from matplotlib.patches import Rectangle
 from matplotlib.gridspec import GridSpec
+from matplotlib.patches import Rectangle
 import matplotlib.dates as mdates
 from datetime import datetime
-
-from api.binance_rest import get_klines
+from itertools import cycle
+import sqlite3
+
+import numpy as np
+
+from api.binance_rest import get_klines, KLINES_MAX_LIMIT
+from api.kline_cache import get_kline_cache
+from config.config import (
+    CHART_INDICATORS,
+    CHART_BLIT,
+    CHART_VIEW_CANDLES,
+    CHART_MAX_CANDLES,
+    CHART_PAGE_SIZE,
+    CHART_LOD_PX,
+    CHART_INTERVALS,
+    CHART_KLINE_STREAM,
+    TEXT_MUTED,
+)
+from controllers.candle_buffer import MS_PER_DAY, klines_to_columns
+from controllers.candle_lod import lod_bucket, bucket_starts, aggregate, sample_last
+from controllers.indicators import IndicatorEngine
+from controllers.timeframe_cache import TimeframeCache
+from ui.formatting import fmt_price
+from ui.panels.candlestick_renderer import CandlestickRenderer
 
 
 # ===== Light theme colors =====
@@ -17,6 +40,46 @@ BULL = "#16a34a"
 BEAR = "#dc2626"
 PRICE_LINE = "#2563eb"
 
+# indicator lines (one colour per indicator, in CHART_INDICATORS order)
+INDICATOR_COLORS = ["#f59e0b", "#8b5cf6", "#0ea5e9", "#ec4899", "#14b8a6", "#64748b"]
+SIGNAL_COLOR = "#f59e0b"
+
+LOCAL_TZ = datetime.now().astimezone().tzinfo
+
+ZOOM_STEP = 1.25     # per wheel notch
+MIN_VIEW_CANDLES = 10
+
+
+def fetch_klines(symbol, interval, count, end_time=None):
+    """
+    Last `count` klines of symbol / interval up to end_time (any thread)
+    """
+    # closed candles from the local cache, only the gaps from REST
+    try:
+        return get_kline_cache().get_klines(
+            symbol,
+            interval,
+            count,
+            end_time=end_time,
+        )
+    except sqlite3.Error as e:
+        print(f"[Chart] Kline cache unavailable: {e}")
+        return get_klines(
+            symbol=symbol,
+            interval=interval,
+            limit=min(count, KLINES_MAX_LIMIT),
+            end_time=end_time,
+        )
+
+
+def prefetch_history(symbol, interval, limit=CHART_VIEW_CANDLES,
+                     indicators=CHART_INDICATORS):
+    """
+    Initial history for RealtimeChartPanel(klines=...), worker thread
+    """
+    warmup = IndicatorEngine(indicators).warmup
+    return fetch_klines(symbol, interval, limit + warmup)
+
 
 class RealtimeChartPanel(ctk.CTkFrame):
     """
@@ -25,9 +88,33 @@ class RealtimeChartPanel(ctk.CTkFrame):
     - Price : Volume = 3 : 1
     - X-axis shown ONLY on volume
     - Realtime last price tick (no redraw)
+    - Live candle aggregated from the trade stream
+      (only the last candle's artists change per update)
+    - Indicators (CHART_INDICATORS): overlays on the price axis,
+      oscillators in their own pane; live values are O(1) per update
+    - Blitting (CHART_BLIT): candles / grid / axes are rasterized once
+      into a cached background; a tick only restores it and redraws
+      the animated artists (price line + label, live candle, indicator
+      lines). The background is rebuilt on resize or a new candle.
+    - Zoom (wheel) / pan (drag) over deep history, double-click goes
+      back to the live edge. Only the visible slice is drawn; when it
+      has more candles than pixels they are re-aggregated into
+      higher-timeframe bars (level of detail), so render cost follows
+      the screen width, not the history length. Older pages are
+      fetched lazily while panning left.
+    - Timeframe switcher (CHART_INTERVALS): every timeframe is kept in
+      a TimeframeCache, derived from lower ones where they cover it and
+      fed live by the same trades; switching only redraws the slice.
+    - Exchange klines (CHART_KLINE_STREAM): every loaded timeframe also
+      follows <symbol>@kline_<interval>; the exchange candle wins over
+      the local one and closed klines are written to the kline cache,
+      so history never has to be re-fetched to correct drift.
     """
 
-    def __init__(self, parent, controller, interval="1h", limit=24):
+    def __init__(self, parent, controller, interval="1h",
+                 limit=CHART_VIEW_CANDLES, indicators=CHART_INDICATORS,
+                 blit=CHART_BLIT, history=CHART_MAX_CANDLES,
+                 kline_stream=CHART_KLINE_STREAM, klines=None):
         super().__init__(parent, fg_color="transparent")
 
         # =========================
@@ -37,18 +124,40 @@ class RealtimeChartPanel(ctk.CTkFrame):
         self.controller.add_listener(self)
 
         self.symbol = controller.symbol
-        self.interval = interval
         self.limit = limit
 
         # =========================
-        # Data buffers
+        # Candles per timeframe (columnar, NumPy): whole loaded
+        # history + live aggregator + indicator state each
         # =========================
-        self.timestamps = []
-        self.opens = []
-        self.highs = []
-        self.lows = []
-        self.closes = []
-        self.volumes = []
+        self.timeframes = TimeframeCache(history, indicators)
+        self.tf = self.timeframes.get(interval)
+        self._pending = None    # timeframe being loaded for display
+
+        # interval -> <symbol>@kline_<interval> handler
+        self.kline_stream = kline_stream
+        self._kline_handlers = {}
+
+        self._line_artists = {}
+        self._line_y = {}
+        self._hist_live = None
+
+        # =========================
+        # View (zoom / pan) + level of detail
+        # =========================
+        # view (x0, x1) / follow flag live on the Timeframe
+        self._span = None       # (x0, x1) covered by the drawn artists
+        self._lod = None        # bar size label when aggregated
+        self._drawn = None      # drawn bars: x, low, high, volume
+        self._live_start = None # first candle of the live bar (if drawn)
+        self._drag = None
+
+        # =========================
+        # Blitting
+        # =========================
+        self.blit = blit
+        self._background = None
+        self._animated = []
 
         # =========================
         # Header (title above chart)
@@ -61,143 +170,668 @@ class RealtimeChartPanel(ctk.CTkFrame):
 
         self.title_label = ctk.CTkLabel(
             self.header,
-            text=f"{self.symbol} · 24H Chart ( TF : {self.interval} )",
+            text=f"{self.symbol} · Chart ( TF : {self.tf.interval} )",
             font=ctk.CTkFont(size=18, weight="bold"),
             text_color="white",
         )
-        self.title_label.pack(anchor="w")
+        self.title_label.pack(side="left")
+
+        self.tf_selector = ctk.CTkSegmentedButton(
+            self.header,
+            values=CHART_INTERVALS,
+            command=self.set_interval,
+        )
+        self.tf_selector.set(interval)
+        self.tf_selector.pack(side="left", padx=16)
+
+        self.info_label = ctk.CTkLabel(
+            self.header,
+            text="",
+            font=ctk.CTkFont(size=12),
+            text_color=TEXT_MUTED,
+        )
+        self.info_label.pack(side="right")
 
         # =========================
         # Figure + GridSpec (3:1)
         # =========================
         self.fig = Figure(figsize=(7, 4), dpi=95, facecolor=BG_AX)
+
+        # price, volume, then one pane per oscillator (RSI, MACD, ...)
+        panes = self.tf.indicators.panes
         gs = GridSpec(
-            4,
+            4 + 2 * len(panes),
             1,
-            height_ratios=[3, 0.02, 1, 0.02],
+            height_ratios=[3, 0.02, 1, 0.02] + [1, 0.02] * len(panes),
             hspace=0.0,
         )
 
         self.ax_price = self.fig.add_subplot(gs[0])
         self.ax_volume = self.fig.add_subplot(gs[2], sharex=self.ax_price)
+        self.ax_panes = {
+            pane: self.fig.add_subplot(gs[4 + 2 * i], sharex=self.ax_price)
+            for i, pane in enumerate(panes)
+        }
+
+        self.renderer = CandlestickRenderer(
+            self.ax_price,
+            self.ax_volume,
+            bull=BULL,
+            bear=BEAR,
+        )
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=self)
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
 
-        # draw
-        self._load_history()
+        # every full draw (first show, resize, new candle) -> new background
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+        # zoom / pan; LOD depends on the width -> redraw on resize
+        self.canvas.mpl_connect("scroll_event", self._on_scroll)
+        self.canvas.mpl_connect("button_press_event", self._on_press)
+        self.canvas.mpl_connect("motion_notify_event", self._on_motion)
+        self.canvas.mpl_connect("button_release_event", self._on_release)
+        self.canvas.mpl_connect("resize_event", lambda e: self._draw_chart())
+
+        # draw (klines: history prefetched off the Tk thread)
+        self._load_history(klines)
         self._draw_chart()
 
+        self.controller.add_trade_listener(self._on_trades)
+
+    def destroy(self):
+        self.controller.remove_trade_listener(self._on_trades)
+        for interval, handler in self._kline_handlers.items():
+            self.controller.remove_kline_listener(interval, handler)
+        self._kline_handlers.clear()
+        super().destroy()
+
     # ==================================================
     # Data
     # ==================================================
-    def _load_history(self):
-        klines = get_klines(
-            symbol=self.symbol,
-            interval=self.interval,
-            limit=self.limit,
+    def _fetch_klines(self, count, end_time=None, interval=None):
+        """
+        Last `count` klines up to end_time (any thread)
+        """
+        return fetch_klines(
+            self.symbol, interval or self.tf.interval, count, end_time
+        )
+
+    def _load_history(self, klines=None):
+        # extra candles so indicators are settled at the first shown one
+        if klines is None:
+            klines = self._fetch_klines(self.limit + self.tf.indicators.warmup)
+        self._load_timeframe(self.tf, klines_to_columns(klines))
+
+    def _load_timeframe(self, tf, columns, local=()):
+        self.timeframes.load(tf, columns, local)
+        self._follow_klines(tf)
+
+    def _on_trades(self, trades):
+        """
+        Trade batch of this frame: fold into the live candles
+        """
+        self.timeframes.add_trades(trades)
+
+    # ==================================================
+    # Exchange klines (authoritative live candle)
+    # ==================================================
+    def _follow_klines(self, tf):
+        if not self.kline_stream or tf.interval in self._kline_handlers:
+            return
+
+        def handler(payload, recv_time):
+            self._on_kline(tf, payload)
+
+        if self.controller.add_kline_listener(tf.interval, handler):
+            self._kline_handlers[tf.interval] = handler
+            tf.aggregator.follow_klines(by_id=self.controller.has_trade_ids)
+
+    def _on_kline(self, tf, payload):
+        """
+        Stream thread: exchange values replace the local candle
+        """
+        k = payload["k"]
+        row = [k["t"], float(k["o"]), float(k["h"]), float(k["l"]),
+               float(k["c"]), float(k["v"])]
+        closed = k["x"]
+
+        tf.aggregator.apply_kline(*row, closed, k["L"])
+
+        if closed:
+            # final exchange candle -> never downloaded again
+            # (SQLite off the stream thread: it is the shared asyncio loop
+            # with NETWORK_BACKEND = "asyncio")
+            self.controller.submit(self._store_klines, tf.interval, [row])
+
+        self.controller.refresh()
+
+    def _store_klines(self, interval, rows):
+        """
+        Worker thread: persist final klines
+        """
+        try:
+            get_kline_cache().store(self.symbol, interval, rows)
+        except sqlite3.Error as e:
+            print(f"[Chart] Kline cache unavailable: {e}")
+
+    # ==================================================
+    # Lazy history (older pages while panning left)
+    # ==================================================
+    def _maybe_load_older(self):
+        tf = self.tf
+        c = tf.candles
+        if tf.loading or tf.history_done or not len(c):
+            return
+
+        # keep one view width of candles loaded left of the view
+        x0, x1 = self._view_limits()
+        target = x0 - (x1 - x0)
+        if target > c.x[0]:
+            return
+
+        room = c.capacity - len(c)
+        if room <= 0:
+            tf.history_done = True
+            return
+
+        # whole pages, enough to reach the target in ONE request
+        # (one prepend + re-seed + redraw instead of one per page)
+        missing = int((c.x[0] - target) / tf.step) + 1
+        pages = -(-missing // CHART_PAGE_SIZE)
+        count = min(room, pages * CHART_PAGE_SIZE)
+
+        tf.loading = True
+        self._update_info()
+
+        # the page belongs to `tf` even if the user switches meanwhile
+        self.controller.submit(
+            self._fetch_klines,
+            count,
+            int(c.open_time[0]) - 1,
+            tf.interval,
+            on_done=lambda klines: self._on_older_page(tf, klines),
+            on_error=lambda exc: self._on_load_error(tf, exc),
         )
 
-        self.timestamps.clear()
-        self.opens.clear()
-        self.highs.clear()
-        self.lows.clear()
-        self.closes.clear()
-        self.volumes.clear()
+    def _on_older_page(self, tf, klines):
+        """
+        Tk thread: prepend the page, re-seed indicators, redraw
+        """
+        tf.loading = False
+        if not self.winfo_exists():
+            return
 
-        for k in klines:
-            self.timestamps.append(datetime.fromtimestamp(k[0] / 1000))
-            self.opens.append(float(k[1]))
-            self.highs.append(float(k[2]))
-            self.lows.append(float(k[3]))
-            self.closes.append(float(k[4]))
-            self.volumes.append(float(k[5]))  # base asset volume
+        added = tf.prepend_klines(klines)
+        if not added:
+            # before the listing date (or memory cap reached)
+            tf.history_done = True
+            self._update_info()
+            return
+
+        print(f"[Chart] {self.symbol} {tf.interval} +{added} older candles ({len(tf.candles)})")
+
+        if tf is self.tf:
+            self._draw_chart()
+            self._maybe_load_older()
+
+    def _on_load_error(self, tf, exc):
+        tf.loading = False
+        print(f"[Chart] {self.symbol} {tf.interval} history failed: {exc}")
+        if self.winfo_exists():
+            self._update_info()
+
+    # ==================================================
+    # Timeframe switch (no REST for cached timeframes, no rebuild)
+    # ==================================================
+    def set_interval(self, interval):
+        """
+        Show another timeframe of the same symbol
+        """
+        if interval == self.tf.interval and self._pending is None:
+            return
+
+        tf = self.timeframes.get(interval)
+        if tf.loaded:
+            self._pending = None
+            self._activate(tf)
+            return
+
+        self._pending = interval
+        if tf.loading:
+            return
+
+        need = self.limit + tf.indicators.warmup
+        derived = self.timeframes.derive(interval)
+
+        if derived is not None:
+            columns, complete = derived
+            if len(columns["open_time"]) >= need:
+                # lower timeframes cover it: no request at all
+                self._load_timeframe(
+                    tf, columns, local=columns["open_time"][~complete]
+                )
+                self._pending = None
+                self._activate(tf)
+                return
+
+            # persist the derived exchange candles -> only the rest
+            # is downloaded (buckets with local candles are not stored)
+            rows = np.column_stack([
+                columns[name][complete]
+                for name in ("open_time", "open", "high", "low", "close", "volume")
+            ]).tolist()
+        else:
+            rows = []
+
+        tf.loading = True
+        self._update_info()
+
+        self.controller.submit(
+            self._fetch_timeframe,
+            interval,
+            need,
+            rows,
+            on_done=lambda klines: self._on_timeframe_loaded(tf, klines),
+            on_error=lambda exc: self._on_load_error(tf, exc),
+        )
+
+    def _fetch_timeframe(self, interval, count, derived_rows):
+        """
+        Worker thread: store derived candles, then read through the cache
+        """
+        if derived_rows:
+            try:
+                get_kline_cache().store(self.symbol, interval, derived_rows)
+            except sqlite3.Error as e:
+                print(f"[Chart] Kline cache unavailable: {e}")
+
+        return self._fetch_klines(count, interval=interval)
+
+    def _on_timeframe_loaded(self, tf, klines):
+        tf.loading = False
+        if not self.winfo_exists():
+            return
+
+        self._load_timeframe(tf, klines_to_columns(klines))
+        if self._pending == tf.interval:
+            self._pending = None
+            self._activate(tf)
+
+    def _activate(self, tf):
+        """
+        Swap the displayed timeframe: the figure, axes and artists
+        stay, only the data slice is redrawn
+        """
+        self.tf = tf
+
+        # fold in what closed while it was hidden
+        tf.catch_up()
+
+        self._span = None
+        self.title_label.configure(
+            text=f"{self.symbol} · Chart ( TF : {tf.interval} )"
+        )
+        self.tf_selector.set(tf.interval)
+
+        self._draw_chart()
+        self._maybe_load_older()
 
     # ==================================================
     # Styling
     # ==================================================
     def _style_axes(self):
-        for ax in (self.ax_price, self.ax_volume):
+        panes = list(self.ax_panes.values())
+        axes = [self.ax_price, self.ax_volume] + panes
+
+        for ax in axes:
             ax.set_facecolor(BG_AX)
             ax.grid(True, color=GRID, linewidth=0.8)
             ax.tick_params(colors=TEXT, labelsize=10)
             for spine in ax.spines.values():
                 spine.set_visible(False)
+            # date ticks on every axis -> grid lines line up
+            ax.xaxis.set_major_locator(mdates.AutoDateLocator(tz=LOCAL_TZ))
 
         # ----- PRICE AXIS -----
         self.ax_price.yaxis.tick_left()
         # self.ax_price.tick_params(labelleft=False)
         self.ax_price.set_ylabel("")
 
-        self.ax_price.tick_params(
-            axis="x",
-            which="both",
-            bottom=False,
-            labelbottom=False,
-        )
+        # x labels only on the bottom axis
+        for ax in axes[:-1]:
+            ax.tick_params(
+                axis="x",
+                which="both",
+                bottom=False,
+                labelbottom=False,
+            )
 
         # ----- VOLUME AXIS -----
         self.ax_volume.set_ylabel("Volume", fontsize=10, color=TEXT)
-        self.ax_volume.xaxis.set_major_formatter(
-            mdates.DateFormatter("%m-%d %H:%M")
+
+        # ----- OSCILLATOR PANES -----
+        for pane, ax in self.ax_panes.items():
+            ax.set_ylabel(pane.upper(), fontsize=10, color=TEXT)
+            if pane == "rsi":
+                ax.set_ylim(0, 100)
+                ax.set_yticks([30, 70])
+                for level in (30, 70):
+                    ax.axhline(level, color=TEXT, linewidth=0.8, alpha=0.4)
+            elif pane == "macd":
+                ax.axhline(0, color=TEXT, linewidth=0.8, alpha=0.4)
+
+        # x is UTC-based -> format in local time (minutes .. months)
+        bottom = axes[-1].xaxis
+        bottom.set_major_formatter(
+            mdates.ConciseDateFormatter(bottom.get_major_locator(), tz=LOCAL_TZ)
         )
 
+    def _draw_indicators(self, dates, candle_width, i0, i1, starts):
+        self._line_artists = {}
+        self._line_y = {}
+        self._hist_live = None
+        if self.tf.lines is None:
+            return
+
+        for ind, color in zip(self.tf.indicators.indicators, cycle(INDICATOR_COLORS)):
+            ax = self.ax_price if ind.pane == "price" else self.ax_panes[ind.pane]
+
+            for name in ind.lines:
+                y = self.tf.lines.column(name)[i0:i1]
+                # aggregated bars -> value at the bar close
+                y = sample_last(y, starts) if starts is not None else y.copy()
+                self._line_y[name] = y
+
+                if name.endswith("_hist"):
+                    self._draw_histogram(ax, dates, y, candle_width)
+                    continue
+
+                style = "--" if name.endswith(("_upper", "_lower")) else "-"
+                line_color = SIGNAL_COLOR if name.endswith("_signal") else color
+                (self._line_artists[name],) = ax.plot(
+                    dates,
+                    y,
+                    color=line_color,
+                    linewidth=1.1,
+                    linestyle=style,
+                )
+
+    def _draw_histogram(self, ax, dates, y, width):
+        """
+        Histogram like the volume bars: ONE collection for the closed
+        candles + one live bar moved per tick
+        """
+        y = np.nan_to_num(y)
+        colors = self.renderer.colors(np.zeros_like(y), y)
+
+        ax.add_collection(PolyCollection(
+            CandlestickRenderer.box_verts(
+                dates[:-1], np.zeros(len(y) - 1), y[:-1], width
+            ),
+            facecolors=colors[:-1],
+            edgecolors="none",
+            alpha=0.5,
+        ))
+
+        self._hist_live = Rectangle(
+            (dates[-1] - width / 2, 0), width, y[-1],
+            color=colors[-1], alpha=0.5,
+        )
+        ax.add_patch(self._hist_live)
+
+    def _update_indicators(self):
+        """
+        Live candle changed: refresh the last point of every line
+        """
+        if self.tf.lines is None or self._live_start is None:
+            return
+
+        for name, line in self._line_artists.items():
+            y = self._line_y[name]
+            y[-1] = self.tf.lines.last(name)
+            line.set_ydata(y)
+
+        if self._hist_live is not None:
+            value = float(self.tf.lines.last("macd_hist"))
+            self._hist_live.set_height(0.0 if value != value else value)
+            self._hist_live.set_color(BULL if value >= 0 else BEAR)
+
     # ==================================================
-    # Initial draw
+    # View (zoom / pan)
+    # ==================================================
+    def _view_limits(self):
+        """
+        (x0, x1) in view; on the live edge the right side follows
+        the newest candle
+        """
+        if self.tf.view is not None and not self.tf.follow:
+            return self.tf.view
+
+        x1 = float(self.tf.candles.x[-1]) + self.tf.step
+        width = (
+            self.tf.view[1] - self.tf.view[0]
+            if self.tf.view is not None
+            else (self.limit + 1) * self.tf.step
+        )
+        return x1 - width, x1
+
+    def _set_view(self, x0, x1):
+        c = self.tf.candles
+        if not len(c):
+            return
+
+        # never more than half a view past the newest candle
+        last = float(c.x[-1]) + self.tf.step
+        width = x1 - x0
+        if x1 > last + width / 2:
+            x0, x1 = last + width / 2 - width, last + width / 2
+
+        # oldest candle reached and nothing left to load
+        first = float(c.x[0]) - self.tf.step
+        if self.tf.history_done and x0 < first:
+            width = min(width, last - first)
+            x0, x1 = first, first + width
+
+        self.tf.view = (x0, x1)
+        self.tf.follow = x1 >= last
+
+        x0, x1 = self._view_limits()
+        span = self._span
+        if (span is None or x0 < span[0] or x1 > span[1]
+                or self._lod_for(x0, x1)[0] != self._lod):
+            # left the drawn span or the bar size changes -> re-slice
+            self._draw_chart()
+        else:
+            # pan / zoom inside the drawn span: limits only
+            self.ax_price.set_xlim(x0, x1)
+            self._fit_y(x0, x1)
+            self._update_info()
+            self.canvas.draw_idle()
+
+        self._maybe_load_older()
+
+    def _lod_for(self, x0, x1):
+        x = self.tf.candles.x
+        count = int(np.searchsorted(x, x1) - np.searchsorted(x, x0))
+        max_bars = max(1, self.ax_price.bbox.width / CHART_LOD_PX)
+        return lod_bucket(self.tf.aggregator.interval_ms, count, max_bars)
+
+    def _on_scroll(self, event):
+        if event.inaxes is None or not len(self.tf.candles):
+            return
+
+        x0, x1 = self._view_limits()
+        factor = 1 / ZOOM_STEP if event.button == "up" else ZOOM_STEP
+
+        # keep the candle under the cursor in place
+        width = max(MIN_VIEW_CANDLES * self.tf.step, (x1 - x0) * factor)
+        frac = (event.xdata - x0) / (x1 - x0)
+        x0 = event.xdata - frac * width
+        self._set_view(x0, x0 + width)
+
+    def _on_press(self, event):
+        if event.inaxes is None or event.button != 1:
+            return
+
+        if event.dblclick:
+            # back to the live edge at the default zoom
+            self.tf.view = None
+            self.tf.follow = True
+            self._draw_chart()
+            return
+
+        x0, x1 = self._view_limits()
+        self._drag = (event.x, x0, x1)
+
+    def _on_motion(self, event):
+        if self._drag is None:
+            return
+
+        start, x0, x1 = self._drag
+        shift = (start - event.x) * (x1 - x0) / max(1.0, self.ax_price.bbox.width)
+        self._set_view(x0 + shift, x1 + shift)
+
+    def _on_release(self, event):
+        self._drag = None
+
+    def _fit_y(self, x0, x1):
+        """
+        Y-limits from the bars in view (not the whole drawn span)
+        """
+        if self._drawn is None:
+            return
+
+        x, low, high, volume = self._drawn
+        i0, i1 = np.searchsorted(x, (x0, x1))
+        if i1 <= i0:
+            return
+
+        self.renderer.autoscale(
+            low[i0:i1].min(), high[i0:i1].max(), volume[i0:i1].max()
+        )
+
+        # oscillators without a fixed range follow the data in view
+        for pane, ax in self.ax_panes.items():
+            if pane == "rsi":
+                continue
+            values = [
+                self._line_y[name][i0:i1]
+                for ind in self.tf.indicators.indicators if ind.pane == pane
+                for name in ind.lines
+            ]
+            values = np.concatenate(values) if values else np.empty(0)
+            if not np.isfinite(values).any():
+                continue
+            lo = min(0.0, np.nanmin(values))
+            hi = max(0.0, np.nanmax(values))
+            pad = (hi - lo) * 0.1 or 1.0
+            ax.set_ylim(lo - pad, hi + pad)
+
+    def _update_info(self):
+        if not len(self.tf.candles):
+            return
+
+        x0, x1 = self._view_limits()
+        x = self.tf.candles.x
+        count = int(np.searchsorted(x, x1) - np.searchsorted(x, x0))
+
+        text = f"{count:,} candles"
+        if self._lod is not None:
+            text += f" · bars: {self._lod}"
+        if self._pending is not None:
+            text += f" · loading {self._pending}..."
+        elif self.tf.loading:
+            text += " · loading history..."
+        self.info_label.configure(text=text)
+
+    # ==================================================
+    # Draw (visible slice only)
     # ==================================================
     def _draw_chart(self):
         # safety guard
-        if not self.closes:
+        c = self.tf.candles
+        if not len(c):
             return
 
         self.ax_price.clear()
         self.ax_volume.clear()
+        for ax in self.ax_panes.values():
+            ax.clear()
         self._style_axes()
 
-        dates = mdates.date2num(self.timestamps)
-        candle_width = (dates[1] - dates[0]) * 0.7
-
-        for i, date in enumerate(dates):
-            o = self.opens[i]
-            h = self.highs[i]
-            l = self.lows[i]
-            c = self.closes[i]
-            v = self.volumes[i]
-
-            color = BULL if c >= o else BEAR
-
-            # Wick
-            self.ax_price.plot(
-                [date, date],
-                [l, h],
-                color=color,
-                linewidth=1.2,
+        # draw one extra view width on both sides: short pans only
+        # move the x-limits, no re-slice
+        x0, x1 = self._view_limits()
+        pad = x1 - x0
+        x = c.x
+        n = len(c)
+        i0 = int(np.searchsorted(x, x0 - pad))
+        i1 = int(np.searchsorted(x, x1 + pad, side="right"))
+        i0 = min(i0, n - 1)
+        i1 = max(i1, i0 + 1)
+
+        self._lod, bucket_ms = self._lod_for(x0, x1)
+        step_ms = self.tf.aggregator.interval_ms
+
+        if self._lod is None:
+            # zero-copy views, x precomputed on append (no date2num)
+            starts = None
+            dates = x[i0:i1]
+            bars = {
+                name: c.column(name)[i0:i1]
+                for name in ("open", "high", "low", "close", "volume")
+            }
+            candle_width = self.tf.step * 0.7
+            self._live_start = n - 1 if i1 == n else None
+        else:
+            # whole buckets only: widen the slice to bucket boundaries
+            t = c.open_time
+            first = int(t[i0]) - int(t[i0]) % bucket_ms
+            last = int(t[i1 - 1]) - int(t[i1 - 1]) % bucket_ms + bucket_ms
+            i0 = int(np.searchsorted(t, first))
+            i1 = int(np.searchsorted(t, last))
+
+            starts = bucket_starts(t[i0:i1], bucket_ms)
+            bars = aggregate(
+                t[i0:i1],
+                c.open[i0:i1],
+                c.high[i0:i1],
+                c.low[i0:i1],
+                c.close[i0:i1],
+                c.volume[i0:i1],
+                starts,
             )
+            # bar centered over the candles it covers
+            open_ms = bars["open_time"] - bars["open_time"] % bucket_ms
+            dates = (open_ms + (bucket_ms - step_ms) / 2) / MS_PER_DAY
+            candle_width = bucket_ms / MS_PER_DAY * 0.7
+            self._live_start = i0 + int(starts[-1]) if i1 == n else None
+
+        # wicks + bodies + volume -> 3 artists total (vectorized)
+        self.renderer.draw(
+            dates,
+            bars["open"],
+            bars["high"],
+            bars["low"],
+            bars["close"],
+            bars["volume"],
+            candle_width,
+        )
 
-            # Body
-            self.ax_price.add_patch(
-                Rectangle(
-                    (date - candle_width / 2, min(o, c)),
-                    candle_width,
-                    abs(c - o),
-                    facecolor=color,
-                    edgecolor=color,
-                )
-            )
+        self._draw_indicators(dates, candle_width, i0, i1, starts)
 
-            # Volume
-            self.ax_volume.bar(
-                date,
-                v,
-                width=candle_width,
-                color=color,
-                alpha=0.9,
-            )
+        self._drawn = (dates, bars["low"], bars["high"], bars["volume"])
+        self._span = (min(x0 - pad, x[i0]), max(x1 + pad, x[i1 - 1]))
+        if i0 == 0:
+            self._span = (-np.inf, self._span[1])
+        if i1 == n:
+            self._span = (self._span[0], np.inf)
 
         # =========================
         # Last price (initial)
         # =========================
-        last_price = self.closes[-1]
+        last_price = float(c.last("close"))
 
         self.last_price_line = self.ax_price.axhline(
             last_price,
@@ -210,7 +844,7 @@ class RealtimeChartPanel(ctk.CTkFrame):
         self.last_price_label = self.ax_price.text(
             1.005,
             last_price,
-            f"{last_price:,.2f}",
+            fmt_price(last_price),
             transform=self.ax_price.get_yaxis_transform(),
             color="white",
             fontsize=11,
@@ -224,10 +858,8 @@ class RealtimeChartPanel(ctk.CTkFrame):
             ),
         )
 
-        self.ax_price.set_xlim(
-            dates[0] - candle_width,
-            dates[-1] + candle_width,
-        )
+        self.ax_price.set_xlim(x0, x1)
+        self._fit_y(x0, x1)
 
         self.fig.subplots_adjust(
             left=0.06,
@@ -236,18 +868,93 @@ class RealtimeChartPanel(ctk.CTkFrame):
             bottom=0.10,
         )
 
+        self._update_info()
+        self._set_animated()
         self.canvas.draw_idle()
 
     # ==================================================
-    # Realtime update (NO redraw)
+    # Blitting
+    # ==================================================
+    def _set_animated(self):
+        """
+        Collect the per-tick artists; with blitting they are left out
+        of the full draw and painted over the cached background
+        """
+        animated = [
+            self.last_price_line,
+            self.last_price_label,
+            *self.renderer.live_artists,
+            *self._line_artists.values(),
+        ]
+        if self._hist_live is not None:
+            animated.append(self._hist_live)
+
+        self._animated = animated
+        self._background = None
+
+        for artist in animated:
+            artist.set_animated(self.blit)
+
+    def _on_draw(self, event):
+        if not self.blit:
+            return
+
+        # static layer just rasterized -> cache it, then paint the
+        # animated artists on top (a full draw skips them)
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        draw_artist = self.fig.draw_artist
+        for artist in self._animated:
+            draw_artist(artist)
+
+    def _blit(self):
+        if self._background is None:
+            # no background yet (first draw pending)
+            self.canvas.draw_idle()
+            return
+
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.fig.bbox)
+
+    # ==================================================
+    # Realtime update (NO full redraw unless a candle closed)
     # ==================================================
     def on_market_update(self):
         price = self.controller.last_price
-        if price is None:
+        if price is None or not len(self.tf.candles):
             return
 
+        closed, live = self.tf.catch_up()
+
+        if closed:
+            # bucket rollover -> new candle(s), rebuild once
+            self._draw_chart()
+            return
+
+        rescaled = False
+        if live:
+            s = self._live_start
+            if s is not None:
+                # live bar = live candle, or its aggregated bucket
+                c = self.tf.candles
+                rescaled = self.renderer.update_live(
+                    float(c.open[s]),
+                    float(c.high[s:].max()),
+                    float(c.low[s:].min()),
+                    live.close,
+                    float(c.volume[s:].sum()),
+                )
+                self._update_indicators()
+
         self.last_price_line.set_ydata([price, price])
         self.last_price_label.set_y(price)
-        self.last_price_label.set_text(f"{price:,.2f}")
+        self.last_price_label.set_text(fmt_price(price))
 
-        self.canvas.draw_idle()
+        if self.blit and not rescaled:
+            self._blit()
+        else:
+            # y-limits moved -> grid / ticks changed, full redraw
+            self.canvas.draw_idle()
@@ -6,6 +6,7 @@ from config.config import (
     TEXT_MAIN,
     TEXT_MUTED,
 )
+from ui.formatting import fmt_price
 
 
 class HighLow24hWidget(ctk.CTkFrame):
@@ -55,10 +56,10 @@ class HighLow24hWidget(ctk.CTkFrame):
 
         if high is not None:
             self.high_label.configure(
-                text=f"High: {high:,.2f}"
+                text=f"High: {fmt_price(high)}"
             )
 
         if low is not None:
             self.low_label.configure(
-                text=f"Low: {low:,.2f}"
+                text=f"Low: {fmt_price(low)}"
             )
@@ -8,6 +8,7 @@ from config.config import (
     GREEN,
     RED,
 )
+from ui.formatting import fmt_price
 
 
 class PriceWidget(ctk.CTkFrame):
@@ -62,7 +63,7 @@ class PriceWidget(ctk.CTkFrame):
         # ----- Last price -----
         if price is not None:
             self.price_label.configure(
-                text=f"{price:,.2f}"
+                text=fmt_price(price)
             )
 
         # ----- 24h change (VALUE + %) -----
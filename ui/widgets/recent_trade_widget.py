@@ -1,81 +1,159 @@
+# ui/widgets/recent_trade_widget.py
+
+import time
+from collections import deque
+
 import customtkinter as ctk
-from datetime import datetime
-from config.config import BG_CARD, TEXT_MAIN, TEXT_MUTED, GREEN, RED
+from config.config import BG_CARD, TEXT_MAIN, TEXT_MUTED, GREEN, RED, MAX_RECENT_TRADES
+from ui.formatting import fmt_price
 
 
 class RecentTradeWidget(ctk.CTkFrame):
-    def __init__(self, parent, controller):
+    """
+    Scrolling trade tape (newest on top)
+
+    - reads MarketController.recent_trades (TradeTape ring buffer)
+    - ONE canvas, 6 multi-line text items (side/price split by
+      buy & sell colour + qty + time) -> constant Tk cost per frame
+      no matter how many rows are shown
+    - only trades that are new since the last frame are formatted
+    """
+
+    def __init__(self, parent, controller, depth=MAX_RECENT_TRADES):
         super().__init__(parent, fg_color=BG_CARD, corner_radius=18)
 
         self.controller = controller
         controller.add_listener(self)
 
+        self.depth = depth
+        self._seq = 0
+        self._rows = deque(maxlen=depth)  # formatted, newest first
+        self._visible = depth
+
         # ---------- title ----------
         ctk.CTkLabel(
             self,
-            text="Recent Trade",
+            text="Recent Trades",
             font=ctk.CTkFont(size=15, weight="bold"),
             text_color=TEXT_MAIN
-        ).pack(anchor="w", padx=18, pady=(14, 8))
+        ).pack(anchor="w", padx=18, pady=(14, 4))
 
-        # ---------- main row ----------
-        self.row = ctk.CTkFrame(self, fg_color="transparent")
-        self.row.pack(fill="x", padx=18, pady=(0, 16))
+        self.font = ctk.CTkFont(family="Courier", size=12)
+        self.header_font = ctk.CTkFont(family="Courier", size=11)
 
-        # BUY / SELL
-        self.side = ctk.CTkLabel(
-            self.row,
-            width=64,
-            font=ctk.CTkFont(size=16, weight="bold"),
+        # ---------- header ----------
+        self.header = ctk.CTkCanvas(
+            self, height=18, bg=BG_CARD, highlightthickness=0
         )
-        self.side.pack(side="left")
+        self.header.pack(fill="x", padx=18)
 
-        # PRICE (hero)
-        self.price = ctk.CTkLabel(
-            self.row,
-            font=ctk.CTkFont(size=18, weight="bold"),
-        )
-        self.price.pack(side="left", padx=(10, 14))
+        # ---------- tape ----------
+        self.canvas = ctk.CTkCanvas(self, bg=BG_CARD, highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True, padx=18, pady=(2, 16))
 
-        # Qty (secondary)
-        self.qty = ctk.CTkLabel(
-            self.row,
-            font=ctk.CTkFont(size=13),
-            text_color=TEXT_MUTED
-        )
-        self.qty.pack(side="left")
+        # x positions are set in _on_resize (measured from the font)
+        self._cols = {}
+        for name, color, anchor in (
+            ("side_buy", GREEN, "nw"),
+            ("side_sell", RED, "nw"),
+            ("price_buy", GREEN, "nw"),
+            ("price_sell", RED, "nw"),
+            ("qty", TEXT_MUTED, "ne"),
+            ("time", TEXT_MUTED, "ne"),
+        ):
+            self._cols[name] = self.canvas.create_text(
+                0, 0, text="", fill=color, font=self.font, anchor=anchor
+            )
 
-        # Time (right aligned)
-        self.time = ctk.CTkLabel(
-            self.row,
-            font=ctk.CTkFont(size=12),
-            text_color=TEXT_MUTED
-        )
-        self.time.pack(side="right")
+        self._header = {}
+        for name, anchor in (("Side", "nw"), ("Price", "nw"),
+                             ("Qty", "ne"), ("Time", "ne")):
+            self._header[name] = self.header.create_text(
+                0, 2, text=name, fill=TEXT_MUTED,
+                font=self.header_font, anchor=anchor
+            )
+
+        self.canvas.bind("<Configure>", self._on_resize)
 
     # ==================================================
-    # Realtime update
+    # Layout
+    # ==================================================
+    def _on_resize(self, event):
+        # price after the widest side, time right-aligned, qty
+        # right-aligned before the time -> no overlap at any width
+        gap = self.font.measure("  ")
+        price_x = self.font.measure("SELL") + gap
+        time_x = event.width
+        qty_x = time_x - self.font.measure("00:00:00") - gap
+
+        for name, x in (("side_buy", 0), ("side_sell", 0),
+                        ("price_buy", price_x), ("price_sell", price_x),
+                        ("qty", qty_x), ("time", time_x)):
+            self.canvas.coords(self._cols[name], x, 0)
+        for name, x in (("Side", 0), ("Price", price_x),
+                        ("Qty", qty_x), ("Time", time_x)):
+            self.header.coords(self._header[name], x, 2)
+
+        line = self.font.metrics("linespace") or 16
+        self._visible = max(1, min(self.depth, event.height // line))
+        self._render()
+
+    # ==================================================
+    # Realtime update (once per frame via dispatcher)
     # ==================================================
     def on_market_update(self):
-        trade = getattr(self.controller, "last_trade", None)
-        if not trade:
+        tape = self.controller.recent_trades
+        seq = tape.seq
+        if seq == self._seq:
             return
 
-        color = GREEN if trade["side"] == "buy" else RED
+        # format only the trades that arrived since the last frame
+        new = tape.latest(min(seq - self._seq, self.depth))
+        self._seq = seq
+        for trade in reversed(new):
+            self._rows.appendleft(self._format(trade))
 
-        self.side.configure(
-            text=trade["side"].upper(),
-            text_color=color
-        )
+        self._render()
 
-        self.price.configure(
-            text=f"{trade['price']:,.2f}",
-            text_color=color
+    @staticmethod
+    def _format(trade):
+        buy = trade.side == "buy"
+        return (
+            buy,
+            "BUY" if buy else "SELL",
+            fmt_price(trade.price),
+            f"{trade.qty:.4f}",
+            time.strftime("%H:%M:%S", time.localtime(trade.ts)),
         )
 
-        self.qty.configure(
-            text=f"Qty {trade['qty']:.4f}"
+    def _render(self):
+        rows = list(self._rows)[:self._visible]
+        if not rows:
+            return
+
+        side_buy, side_sell, price_buy, price_sell, qty, ts = (
+            [], [], [], [], [], []
         )
+        for buy, side, price, q, t in rows:
+            # the other colour's column gets a blank line -> rows align
+            if buy:
+                side_buy.append(side)
+                side_sell.append("")
+                price_buy.append(price)
+                price_sell.append("")
+            else:
+                side_buy.append("")
+                side_sell.append(side)
+                price_buy.append("")
+                price_sell.append(price)
+            qty.append(q)
+            ts.append(t)
 
-        ts = datetime.fromtimestamp(trade["ts"]).strftime("%H:%M:%S")
-        self.time.configure(text=ts)
+        cols = self._cols
+        itemconfigure = self.canvas.itemconfigure
+        itemconfigure(cols["side_buy"], text="\n".join(side_buy))
+        itemconfigure(cols["side_sell"], text="\n".join(side_sell))
+        itemconfigure(cols["price_buy"], text="\n".join(price_buy))
+        itemconfigure(cols["price_sell"], text="\n".join(price_sell))
+        itemconfigure(cols["qty"], text="\n".join(qty))
+        itemconfigure(cols["time"], text="\n".join(ts))